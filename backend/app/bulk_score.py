@@ -0,0 +1,248 @@
+"""Offline bulk scoring of archived articles from a JSONL or CSV file.
+
+By default every row is scored by the local classifier (``classify_many``) in a
+process pool and mapped to a verdict exactly as ``/check-news`` does when no
+ClaimReview or news context is available. ``--with-lookups`` runs the full
+``/check-news`` pipeline instead, including news and fact-check calls, on the
+event loop. Either way at most ``--window`` batches are in flight, results are
+appended to the output file in input order, and a checkpoint file records how
+many rows are safely written so an interrupted run resumes where it stopped::
+
+    python -m app.bulk_score articles.jsonl verdicts.jsonl --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from app.routes import check_news as check_news_route
+from app.services import classifier_service
+from app.utils import json_codec
+
+# ``text`` is None for a row that could not be parsed; it is written as an error.
+Row = Tuple[int, Any, Optional[str]]
+
+
+def iter_rows(path: str | Path, *, text_field: str = "text", id_field: Optional[str] = "id") -> Iterator[Row]:
+    """Yield ``(row_number, id, text)`` for every row of a CSV or JSONL file.
+
+    Row numbers count every record, including ones without usable text, so they
+    stay stable between runs and can be used to resume. A JSONL line that is not
+    a JSON object is reported on stderr and yielded with ``None`` as its text.
+    """
+
+    source = Path(path)
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        if source.suffix.lower() in {".jsonl", ".ndjson", ".json"}:
+            records: Iterable[Any] = (_parse_json_line(line) for line in handle if line.strip())
+        else:
+            records = csv.DictReader(handle)
+        for number, record in enumerate(records):
+            if not isinstance(record, dict):
+                print(f"Row {number} of {source} is not a JSON object; recording an error.", file=sys.stderr)
+                yield number, None, None
+                continue
+            text = record.get(text_field)
+            identifier = record.get(id_field) if id_field else None
+            yield number, identifier, text if isinstance(text, str) else ""
+
+
+def _parse_json_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        return None
+
+
+def score_offline(texts: Sequence[str]) -> List[Dict[str, Any]]:
+    """Score *texts* with the local classifier and map each to a verdict."""
+
+    news_score = check_news_route._estimate_news_contradiction_score([])  # noqa: SLF001
+    scored: List[Dict[str, Any]] = []
+    for result in classifier_service.classify_many(texts):
+        combined = check_news_route._combine_scores(result["score"], news_score)  # noqa: SLF001
+        verdict, confidence = check_news_route._map_score_to_verdict(combined)  # noqa: SLF001
+        scored.append({"verdict": verdict, "confidence": confidence, "classifier": result})
+    return scored
+
+
+class _Checkpoint:
+    """Rows durably written so far, stored next to the output file."""
+
+    def __init__(self, output: Path) -> None:
+        self.path = output.with_name(output.name + ".checkpoint")
+
+    def load(self) -> Tuple[int, int]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return int(data["rows_done"]), int(data["output_bytes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0, 0
+
+    def save(self, rows_done: int, output_bytes: int) -> None:
+        staging = self.path.with_name(self.path.name + ".tmp")
+        staging.write_text(json.dumps({"rows_done": rows_done, "output_bytes": output_bytes}), encoding="utf-8")
+        os.replace(staging, self.path)
+
+
+class _OrderedWriter:
+    """Append finished batches in input order and checkpoint after each flush."""
+
+    def __init__(self, output: Path, checkpoint: _Checkpoint, *, resume: bool, report_every: float) -> None:
+        rows_done, output_bytes = checkpoint.load() if resume else (0, 0)
+        if rows_done and (not output.exists() or output.stat().st_size < output_bytes):
+            rows_done, output_bytes = 0, 0
+        self._handle = output.open("ab" if rows_done else "wb")
+        # Drop anything written after the last checkpoint; those rows are redone.
+        self._handle.truncate(output_bytes if rows_done else 0)
+        self._handle.seek(0, os.SEEK_END)
+        self._checkpoint = checkpoint
+        self._pending: Dict[int, List[bytes]] = {}
+        self._next_batch = 0
+        self.resumed_rows = rows_done
+        self.rows_done = rows_done
+        self._started = time.perf_counter()
+        self._report_every = report_every
+        self._last_report = self._started
+
+    def add(self, batch_index: int, rows: Sequence[Row], results: Sequence[Dict[str, Any]]) -> None:
+        """Queue a batch; *results* hold one entry per row that has text."""
+
+        lines = []
+        scored = iter(results)
+        for number, identifier, text in rows:
+            result = next(scored) if text is not None else {"error": "Row is not a valid JSON object."}
+            record = {"row": number, "id": identifier, **result}
+            lines.append(json_codec.dumps(record) + b"\n")
+        self._pending[batch_index] = lines
+        self._flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        return (self.rows_done - self.resumed_rows) / elapsed
+
+    def _flush(self) -> None:
+        written = 0
+        while self._next_batch in self._pending:
+            lines = self._pending.pop(self._next_batch)
+            self._handle.writelines(lines)
+            written += len(lines)
+            self._next_batch += 1
+        if not written:
+            return
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self.rows_done += written
+        self._checkpoint.save(self.rows_done, self._handle.tell())
+
+        now = time.perf_counter()
+        if now - self._last_report >= self._report_every:
+            self._last_report = now
+            print(f"{self.rows_done} rows written ({self.rows_per_second:.1f} rows/s)", file=sys.stderr)
+
+
+def _batches(rows: Iterator[Row], size: int) -> Iterator[List[Row]]:
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _texts(batch: Sequence[Row]) -> List[str]:
+    return [text for _, _, text in batch if text is not None]
+
+
+def _run_offline(rows: Iterator[Row], writer: _OrderedWriter, *, batch_size: int, window: int, workers: int) -> None:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: Dict[Future[List[Dict[str, Any]]], Tuple[int, List[Row]]] = {}
+        for index, batch in enumerate(_batches(rows, batch_size)):
+            while len(in_flight) >= window:
+                _collect(in_flight, writer, wait(in_flight, return_when=FIRST_COMPLETED).done)
+            in_flight[pool.submit(score_offline, _texts(batch))] = (index, batch)
+        while in_flight:
+            _collect(in_flight, writer, wait(in_flight, return_when=FIRST_COMPLETED).done)
+
+
+def _collect(
+    in_flight: Dict[Future[List[Dict[str, Any]]], Tuple[int, List[Row]]],
+    writer: _OrderedWriter,
+    done: Set[Future[List[Dict[str, Any]]]],
+) -> None:
+    for future in done:
+        index, batch = in_flight.pop(future)
+        writer.add(index, batch, future.result())
+
+
+async def _run_with_lookups(rows: Iterator[Row], writer: _OrderedWriter, *, batch_size: int, window: int) -> None:
+    async def _score(index: int, batch: List[Row]) -> Tuple[int, List[Row], List[Dict[str, Any]]]:
+        responses = await asyncio.gather(
+            *(check_news_route._analyse(text, False) for text in _texts(batch))  # noqa: SLF001
+        )
+        return index, batch, [response.model_dump() for response in responses]
+
+    in_flight: Set[asyncio.Task[Tuple[int, List[Row], List[Dict[str, Any]]]]] = set()
+    for index, batch in enumerate(_batches(rows, batch_size)):
+        while len(in_flight) >= window:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                writer.add(*task.result())
+        in_flight.add(asyncio.create_task(_score(index, batch)))
+    while in_flight:
+        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            writer.add(*task.result())
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.bulk_score", description=__doc__.split("\n\n")[1])
+    parser.add_argument("input", help="CSV or JSONL file with one article per row.")
+    parser.add_argument("output", help="JSONL file that receives one verdict per row.")
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--id-field", default="id", help="Copied to each output row; empty to omit.")
+    parser.add_argument("--with-lookups", action="store_true", help="Also query news and fact-check providers.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--window", type=int, default=0, help="Batches in flight (default: twice the workers).")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore any checkpoint and start over.")
+    parser.add_argument("--report-every", type=float, default=5.0, help="Seconds between progress lines.")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    checkpoint = _Checkpoint(output)
+    writer = _OrderedWriter(output, checkpoint, resume=not args.no_resume, report_every=args.report_every)
+    if writer.resumed_rows:
+        print(f"Resuming after {writer.resumed_rows} rows from {checkpoint.path}", file=sys.stderr)
+
+    rows = islice(iter_rows(args.input, text_field=args.text_field, id_field=args.id_field or None), writer.resumed_rows, None)
+    batch_size = max(1, args.batch_size)
+    workers = max(1, args.workers)
+    window = max(1, args.window or 2 * workers)
+    try:
+        if args.with_lookups:
+            asyncio.run(_run_with_lookups(rows, writer, batch_size=batch_size, window=window))
+        else:
+            _run_offline(rows, writer, batch_size=batch_size, window=window, workers=workers)
+    finally:
+        writer.close()
+
+    print(f"Wrote {writer.rows_done} rows to {output} ({writer.rows_per_second:.1f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,27 @@ module simplifies future additions such as environment driven settings.
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from typing import Final, Optional
 
-from dotenv import load_dotenv
 
-load_dotenv()
+def _find_dotenv() -> Optional[Path]:
+    # Same search as python-dotenv's find_dotenv(): this directory, then each parent.
+    here = Path(__file__).resolve().parent
+    for directory in (here, *here.parents):
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+_DOTENV_PATH = _find_dotenv()
+if _DOTENV_PATH is not None:
+    # Deployments configure the environment directly; only pay for python-dotenv
+    # when there is a file to load.
+    from dotenv import load_dotenv
+
+    load_dotenv(_DOTENV_PATH)
 
 
 def _env(name: str, default: Optional[str] = None) -> Optional[str]:
@@ -64,6 +80,12 @@ CACHE_TTL_SECONDS: Final[int] = max(60, _env_int("CACHE_TTL_SECONDS", 600))
 CACHE_MAX_ITEMS: Final[int] = max(4, _env_int("CACHE_MAX_ITEMS", 256))
 USE_REDIS: Final[bool] = _env_bool("USE_REDIS", False)
 REDIS_URL: Final[Optional[str]] = _env("REDIS_URL")
+CACHE_SHARED_MEMORY: Final[bool] = _env_bool("CACHE_SHARED_MEMORY", False)
+CACHE_SHARED_MEMORY_PREFIX: Final[str] = _env("CACHE_SHARED_MEMORY_PREFIX", "fakenews") or "fakenews"
+CACHE_SHARED_MEMORY_SLOT_BYTES: Final[int] = max(1024, _env_int("CACHE_SHARED_MEMORY_SLOT_BYTES", 16384))
+CACHE_SINGLE_FLIGHT: Final[bool] = _env_bool("CACHE_SINGLE_FLIGHT", True)
+CACHE_LEASE_TTL_MS: Final[int] = max(100, _env_int("CACHE_LEASE_TTL_MS", 10000))
+CACHE_LEASE_POLL_MS: Final[int] = max(1, _env_int("CACHE_LEASE_POLL_MS", 25))
 
 NEWS_PROVIDER: Final[str] = (_env("NEWS_PROVIDER", "newsapi") or "newsapi").lower()
 NEWS_DEFAULT_LIMIT: Final[int] = max(1, _env_int("NEWS_DEFAULT_LIMIT", 3))
@@ -90,8 +112,45 @@ GOOGLE_FACTCHECK_ENDPOINT: Final[str] = _env(
 )
 GOOGLE_FACTCHECK_KEY: Final[Optional[str]] = _env("GOOGLE_FACTCHECK_KEY")
 
+QUERY_EXTRACTION_MIN_CHARS: Final[int] = max(0, _env_int("QUERY_EXTRACTION_MIN_CHARS", 280))
+FACTCHECK_MAX_CLAIM_QUERIES: Final[int] = max(1, _env_int("FACTCHECK_MAX_CLAIM_QUERIES", 3))
+NEWS_QUERY_MAX_KEYWORDS: Final[int] = max(1, _env_int("NEWS_QUERY_MAX_KEYWORDS", 4))
+CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS: Final[int] = max(0, _env_int("CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS", 300))
+CHECK_NEWS_RESPONSE_CACHE_MAXSIZE: Final[int] = max(4, _env_int("CHECK_NEWS_RESPONSE_CACHE_MAXSIZE", 256))
+CHECK_NEWS_BATCH_MAX_ITEMS: Final[int] = max(1, _env_int("CHECK_NEWS_BATCH_MAX_ITEMS", 100))
+CHECK_NEWS_BATCH_CONCURRENCY: Final[int] = max(1, _env_int("CHECK_NEWS_BATCH_CONCURRENCY", 8))
+JOBS_WORKERS: Final[int] = max(1, _env_int("JOBS_WORKERS", 4))
+JOBS_QUEUE_MAX_DEPTH: Final[int] = max(1, _env_int("JOBS_QUEUE_MAX_DEPTH", 100))
+JOBS_RESULT_TTL_SECONDS: Final[int] = max(60, _env_int("JOBS_RESULT_TTL_SECONDS", 3600))
+JOBS_MAX_RETAINED: Final[int] = max(1, _env_int("JOBS_MAX_RETAINED", 1000))
+JOBS_QUEUE_BACKEND: Final[str] = (_env("JOBS_QUEUE_BACKEND", "memory") or "memory").lower()
+ADMISSION_MAX_IN_FLIGHT: Final[int] = max(0, _env_int("ADMISSION_MAX_IN_FLIGHT", 64))
+ADMISSION_MAX_QUEUE: Final[int] = max(0, _env_int("ADMISSION_MAX_QUEUE", 32))
+ADMISSION_QUEUE_TIMEOUT_MS: Final[int] = max(0, _env_int("ADMISSION_QUEUE_TIMEOUT_MS", 250))
+ADMISSION_RETRY_AFTER_SECONDS: Final[int] = max(1, _env_int("ADMISSION_RETRY_AFTER_SECONDS", 1))
+RATE_LIMIT_REQUESTS: Final[int] = max(0, _env_int("RATE_LIMIT_REQUESTS", 60))
+RATE_LIMIT_WINDOW_SECONDS: Final[float] = max(1.0, _env_float("RATE_LIMIT_WINDOW_SECONDS", 60.0))
+RATE_LIMIT_BACKEND: Final[str] = (_env("RATE_LIMIT_BACKEND", "memory") or "memory").lower()
+RATE_LIMIT_TRUST_FORWARDED: Final[bool] = _env_bool("RATE_LIMIT_TRUST_FORWARDED", False)
+RATE_LIMIT_API_KEYS: Final[frozenset[str]] = frozenset(
+    key.strip() for key in (_env("RATE_LIMIT_API_KEYS", "") or "").split(",") if key.strip()
+)
+UPSTREAM_CONCURRENCY: Final[int] = max(0, _env_int("UPSTREAM_CONCURRENCY", 32))
+UPSTREAM_INTERACTIVE_WEIGHT: Final[float] = max(0.01, _env_float("UPSTREAM_INTERACTIVE_WEIGHT", 9.0))
+UPSTREAM_BULK_WEIGHT: Final[float] = max(0.01, _env_float("UPSTREAM_BULK_WEIGHT", 1.0))
+UPSTREAM_BULK_MAX_SHARE: Final[float] = min(1.0, max(0.0, _env_float("UPSTREAM_BULK_MAX_SHARE", 0.5)))
+BULK_API_KEYS: Final[frozenset[str]] = frozenset(
+    key.strip() for key in (_env("BULK_API_KEYS", "") or "").split(",") if key.strip()
+)
+WARMUP_ENABLED: Final[bool] = _env_bool("WARMUP_ENABLED", True)
+WARMUP_TIMEOUT_SECONDS: Final[float] = max(1.0, _env_float("WARMUP_TIMEOUT_SECONDS", 30.0))
+WARMUP_HOT_TEXTS_PATH: Final[Optional[str]] = _env("WARMUP_HOT_TEXTS_PATH")
+WARMUP_HOT_TEXTS_MAX: Final[int] = max(0, _env_int("WARMUP_HOT_TEXTS_MAX", 200))
+DRAIN_TIMEOUT_SECONDS: Final[float] = max(0.0, _env_float("DRAIN_TIMEOUT_SECONDS", 10.0))
+
 CLASSIFIER_PROVIDER: Final[str] = (_env("CLASSIFIER_PROVIDER", "local") or "local").lower()
 CLASSIFIER_CACHE_TTL_SECONDS: Final[int] = max(60, _env_int("CLASSIFIER_CACHE_TTL_SECONDS", 600))
+CLASSIFIER_FALLBACK_CACHE_TTL_SECONDS: Final[int] = max(0, _env_int("CLASSIFIER_FALLBACK_CACHE_TTL_SECONDS", 10))
 CLASSIFIER_CACHE_MAXSIZE: Final[int] = max(4, _env_int("CLASSIFIER_CACHE_MAXSIZE", 64))
 CLASSIFIER_HTTP_TIMEOUT_SECONDS: Final[float] = max(1.0, _env_float("CLASSIFIER_HTTP_TIMEOUT_SECONDS", 8.0))
 RAPIDAPI_CLASSIFIER_ENDPOINT: Final[str] = _env(
@@ -100,6 +159,31 @@ RAPIDAPI_CLASSIFIER_ENDPOINT: Final[str] = _env(
 )
 RAPIDAPI_KEY: Final[Optional[str]] = _env("RAPIDAPI_KEY")
 RAPIDAPI_HOST: Final[Optional[str]] = _env("RAPIDAPI_HOST")
+RAPIDAPI_BATCH_ENDPOINT: Final[Optional[str]] = _env("RAPIDAPI_BATCH_ENDPOINT")
+CLASSIFIER_BATCH_MAX_SIZE: Final[int] = max(1, _env_int("CLASSIFIER_BATCH_MAX_SIZE", 8))
+CLASSIFIER_BATCH_WINDOW_MS: Final[float] = max(0.0, _env_float("CLASSIFIER_BATCH_WINDOW_MS", 5.0))
+CLASSIFIER_BATCH_CONCURRENCY: Final[int] = max(1, _env_int("CLASSIFIER_BATCH_CONCURRENCY", 4))
+CLASSIFIER_ENSEMBLE_DEADLINE_MS: Final[float] = max(0.0, _env_float("CLASSIFIER_ENSEMBLE_DEADLINE_MS", 0.0))
+CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT: Final[float] = min(1.0, max(0.0, _env_float("CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT", 0.7)))
+LINEAR_MODEL_PATH: Final[Optional[str]] = _env("LINEAR_MODEL_PATH")
+LEXICON_PATH: Final[Optional[str]] = _env("LEXICON_PATH")
+CLASSIFIER_MODEL_WATCH_SECONDS: Final[float] = max(0.0, _env_float("CLASSIFIER_MODEL_WATCH_SECONDS", 0.0))
+ADMIN_TOKEN: Final[Optional[str]] = _env("ADMIN_TOKEN")
+ONNX_MODEL_PATH: Final[Optional[str]] = _env("ONNX_MODEL_PATH")
+ONNX_VOCAB_PATH: Final[Optional[str]] = _env("ONNX_VOCAB_PATH")
+ONNX_INTRA_OP_THREADS: Final[int] = max(1, _env_int("ONNX_INTRA_OP_THREADS", 1))
+ONNX_MAX_SEQUENCE_LENGTH: Final[int] = max(16, _env_int("ONNX_MAX_SEQUENCE_LENGTH", 256))
+ONNX_BATCH_MAX_SIZE: Final[int] = max(1, _env_int("ONNX_BATCH_MAX_SIZE", 16))
+ONNX_BATCH_WINDOW_MS: Final[float] = max(0.0, _env_float("ONNX_BATCH_WINDOW_MS", 5.0))
+CLASSIFIER_EXECUTION: Final[str] = (_env("CLASSIFIER_EXECUTION", "inline") or "inline").lower()
+CLASSIFIER_POOL_WORKERS: Final[int] = max(1, _env_int("CLASSIFIER_POOL_WORKERS", 2))
+CLASSIFIER_INLINE_MAX_CHARS: Final[int] = max(0, _env_int("CLASSIFIER_INLINE_MAX_CHARS", 4000))
+CLASSIFIER_CHUNK_CHARS: Final[int] = max(256, _env_int("CLASSIFIER_CHUNK_CHARS", 20000))
+
+UPSTREAM_RETRY_ATTEMPTS: Final[int] = max(1, _env_int("UPSTREAM_RETRY_ATTEMPTS", 3))
+UPSTREAM_RETRY_BASE_DELAY_SECONDS: Final[float] = max(0.0, _env_float("UPSTREAM_RETRY_BASE_DELAY_SECONDS", 0.1))
+UPSTREAM_RETRY_MAX_DELAY_SECONDS: Final[float] = max(0.0, _env_float("UPSTREAM_RETRY_MAX_DELAY_SECONDS", 1.0))
+UPSTREAM_HEDGE_AFTER_SECONDS: Final[float] = max(0.0, _env_float("UPSTREAM_HEDGE_AFTER_SECONDS", 0.0))
 
 
 __all__ = [
@@ -110,6 +194,12 @@ __all__ = [
     "CACHE_MAX_ITEMS",
     "USE_REDIS",
     "REDIS_URL",
+    "CACHE_SHARED_MEMORY",
+    "CACHE_SHARED_MEMORY_PREFIX",
+    "CACHE_SHARED_MEMORY_SLOT_BYTES",
+    "CACHE_SINGLE_FLIGHT",
+    "CACHE_LEASE_TTL_MS",
+    "CACHE_LEASE_POLL_MS",
     "NEWS_PROVIDER",
     "NEWS_DEFAULT_LIMIT",
     "NEWS_CACHE_TTL_SECONDS",
@@ -128,11 +218,67 @@ __all__ = [
     "FACTCHECK_HTTP_TIMEOUT_SECONDS",
     "GOOGLE_FACTCHECK_ENDPOINT",
     "GOOGLE_FACTCHECK_KEY",
+    "QUERY_EXTRACTION_MIN_CHARS",
+    "FACTCHECK_MAX_CLAIM_QUERIES",
+    "NEWS_QUERY_MAX_KEYWORDS",
+    "CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS",
+    "CHECK_NEWS_RESPONSE_CACHE_MAXSIZE",
+    "CHECK_NEWS_BATCH_MAX_ITEMS",
+    "CHECK_NEWS_BATCH_CONCURRENCY",
+    "JOBS_WORKERS",
+    "JOBS_QUEUE_MAX_DEPTH",
+    "JOBS_RESULT_TTL_SECONDS",
+    "JOBS_MAX_RETAINED",
+    "JOBS_QUEUE_BACKEND",
+    "ADMISSION_MAX_IN_FLIGHT",
+    "ADMISSION_MAX_QUEUE",
+    "ADMISSION_QUEUE_TIMEOUT_MS",
+    "ADMISSION_RETRY_AFTER_SECONDS",
+    "RATE_LIMIT_REQUESTS",
+    "RATE_LIMIT_WINDOW_SECONDS",
+    "RATE_LIMIT_BACKEND",
+    "RATE_LIMIT_TRUST_FORWARDED",
+    "RATE_LIMIT_API_KEYS",
+    "UPSTREAM_CONCURRENCY",
+    "UPSTREAM_INTERACTIVE_WEIGHT",
+    "UPSTREAM_BULK_WEIGHT",
+    "UPSTREAM_BULK_MAX_SHARE",
+    "BULK_API_KEYS",
+    "WARMUP_ENABLED",
+    "WARMUP_TIMEOUT_SECONDS",
+    "WARMUP_HOT_TEXTS_PATH",
+    "WARMUP_HOT_TEXTS_MAX",
+    "DRAIN_TIMEOUT_SECONDS",
     "CLASSIFIER_PROVIDER",
     "CLASSIFIER_CACHE_TTL_SECONDS",
+    "CLASSIFIER_FALLBACK_CACHE_TTL_SECONDS",
     "CLASSIFIER_CACHE_MAXSIZE",
     "CLASSIFIER_HTTP_TIMEOUT_SECONDS",
     "RAPIDAPI_CLASSIFIER_ENDPOINT",
     "RAPIDAPI_KEY",
     "RAPIDAPI_HOST",
+    "RAPIDAPI_BATCH_ENDPOINT",
+    "CLASSIFIER_BATCH_MAX_SIZE",
+    "CLASSIFIER_BATCH_WINDOW_MS",
+    "CLASSIFIER_BATCH_CONCURRENCY",
+    "CLASSIFIER_ENSEMBLE_DEADLINE_MS",
+    "CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT",
+    "LINEAR_MODEL_PATH",
+    "LEXICON_PATH",
+    "CLASSIFIER_MODEL_WATCH_SECONDS",
+    "ADMIN_TOKEN",
+    "ONNX_MODEL_PATH",
+    "ONNX_VOCAB_PATH",
+    "ONNX_INTRA_OP_THREADS",
+    "ONNX_MAX_SEQUENCE_LENGTH",
+    "ONNX_BATCH_MAX_SIZE",
+    "ONNX_BATCH_WINDOW_MS",
+    "CLASSIFIER_EXECUTION",
+    "CLASSIFIER_POOL_WORKERS",
+    "CLASSIFIER_INLINE_MAX_CHARS",
+    "CLASSIFIER_CHUNK_CHARS",
+    "UPSTREAM_RETRY_ATTEMPTS",
+    "UPSTREAM_RETRY_BASE_DELAY_SECONDS",
+    "UPSTREAM_RETRY_MAX_DELAY_SECONDS",
+    "UPSTREAM_HEDGE_AFTER_SECONDS",
 ]
@@ -0,0 +1,190 @@
+"""Application start-up warm-up and shutdown drain, wired in as the FastAPI
+lifespan.
+
+Warm-up runs in the background once the server starts, so ``/health`` answers
+straight away while ``/ready`` reports ``warming``. It pre-connects the pooled
+HTTP clients to every configured provider, builds the cache backends and opens
+the Redis pool, loads the local classifier models and, when
+``WARMUP_HOT_TEXTS_PATH`` is set, replays those texts into the caches. Each step
+is best effort: failures are logged and reported, and after
+``WARMUP_TIMEOUT_SECONDS`` the instance reports ready regardless.
+
+The analysis job workers start with the server, so jobs left in a shared Redis
+queue (or claimed by an instance that died) are worked off without waiting for
+a new submission.
+
+On shutdown ``/ready`` reports ``draining``, job intake stops, running jobs and
+late classifier cache writes get ``DRAIN_TIMEOUT_SECONDS`` to finish, and the
+HTTP pools, Redis connections and process pool are closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional
+
+from fastapi import FastAPI
+
+from app import config
+from app.routes import check_news as check_news_route
+from app.services import classifier_service, factcheck_service, news_service
+from app.utils import cache, http_client, metrics
+
+logger = logging.getLogger(__name__)
+
+READY = "ready"
+WARMING = "warming"
+DRAINING = "draining"
+
+# Ready until a lifespan says otherwise, so apps served without one stay usable.
+_STATE = READY
+_REPORT: Dict[str, str] = {}
+
+
+def state() -> str:
+    """Return ``ready``, ``warming`` or ``draining``."""
+
+    return _STATE
+
+
+def report() -> Dict[str, str]:
+    """Return the outcome of each warm-up step from the latest run."""
+
+    return dict(_REPORT)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    global _STATE
+    warmup: Optional[asyncio.Task[Dict[str, str]]] = None
+    if config.WARMUP_ENABLED:
+        _STATE = WARMING
+        warmup = asyncio.create_task(warm_up())
+    else:
+        _STATE = READY
+    check_news_route.start_jobs()
+    watcher = asyncio.create_task(classifier_service.watch_model_files())
+    try:
+        yield
+    finally:
+        watcher.cancel()
+        await asyncio.gather(watcher, return_exceptions=True)
+        await drain(warmup)
+
+
+async def warm_up() -> Dict[str, str]:
+    """Run every warm-up step within ``WARMUP_TIMEOUT_SECONDS`` and mark the app ready."""
+
+    global _STATE
+    _STATE = WARMING
+    _REPORT.clear()
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(_run_steps(), timeout=config.WARMUP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("Warm-up did not finish within %.0fs; serving anyway.", config.WARMUP_TIMEOUT_SECONDS)
+        metrics.increment("warmup.timed_out")
+        for step, outcome in _REPORT.items():
+            if outcome == "running":
+                _REPORT[step] = "timed out"
+    finally:
+        metrics.observe("warmup.seconds", time.perf_counter() - started)
+        # A drain that started meanwhile keeps its state.
+        if _STATE == WARMING:
+            _STATE = READY
+    logger.info("Warm-up finished in %.2fs: %s", time.perf_counter() - started, _REPORT)
+    return report()
+
+
+async def drain(warmup: Optional[asyncio.Task[Any]] = None) -> None:
+    """Stop taking work, give in-flight work ``DRAIN_TIMEOUT_SECONDS``, then close pools."""
+
+    global _STATE
+    _STATE = DRAINING
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+        await asyncio.gather(warmup, return_exceptions=True)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + config.DRAIN_TIMEOUT_SECONDS
+    # Late classifier writes do not wait on jobs, so both share the one budget.
+    abandoned, _ = await asyncio.gather(
+        check_news_route.drain_jobs(config.DRAIN_TIMEOUT_SECONDS),
+        classifier_service.drain(config.DRAIN_TIMEOUT_SECONDS),
+    )
+    # Jobs that finished meanwhile may have started late writes of their own.
+    await classifier_service.drain(max(0.0, deadline - loop.time()))
+    await classifier_service.aclose_process_pool()
+    await http_client.aclose_clients()
+    await cache.aclose_redis()
+    logger.info("Drained for shutdown; %d jobs left unfinished.", abandoned)
+
+
+async def _run_steps() -> None:
+    await asyncio.gather(
+        _step("upstreams", _preconnect_upstreams()),
+        _step("caches", _open_caches()),
+        _step("models", asyncio.to_thread(classifier_service.preload)),
+    )
+    # Replayed texts go through the caches and models opened above.
+    await _step("hot_texts", _replay_hot_texts())
+
+
+async def _step(name: str, work: Awaitable[str]) -> None:
+    _REPORT[name] = "running"
+    try:
+        _REPORT[name] = await work
+    except Exception as exc:
+        logger.warning("Warm-up step %s failed: %s", name, exc)
+        metrics.increment(f"warmup.{name}.failed")
+        _REPORT[name] = "failed"
+
+
+async def _preconnect_upstreams() -> str:
+    connected = await asyncio.gather(
+        classifier_service.preconnect(),
+        news_service.preconnect(),
+        factcheck_service.preconnect(),
+    )
+    return f"{sum(connected)} connected"
+
+
+async def _open_caches() -> str:
+    cache.resolve_registered_caches()
+    if not (config.USE_REDIS and config.REDIS_URL):
+        return "in-process"
+    return "redis" if await cache.ping_redis() else "redis unavailable"
+
+
+async def _replay_hot_texts() -> str:
+    path = config.WARMUP_HOT_TEXTS_PATH
+    if not path or config.WARMUP_HOT_TEXTS_MAX == 0:
+        return "skipped"
+    texts = await asyncio.to_thread(_read_hot_texts, path, config.WARMUP_HOT_TEXTS_MAX)
+    primed = await check_news_route.prime_response_cache(texts)
+    metrics.set_gauge("warmup.hot_texts.primed", primed)
+    return f"{primed} primed"
+
+
+def _read_hot_texts(path: str, limit: int) -> List[str]:
+    """Read up to *limit* texts, one per line; blank lines and ``#`` comments are skipped."""
+
+    with open(path, encoding="utf-8") as handle:
+        lines = (line.strip() for line in handle)
+        return list(islice((line for line in lines if line and not line.startswith("#")), limit))
+
+
+__all__ = [
+    "READY",
+    "WARMING",
+    "DRAINING",
+    "lifespan",
+    "warm_up",
+    "drain",
+    "state",
+    "report",
+]
@@ -3,15 +3,27 @@ Author: GPT-5 Codecs (acting as a 30–40 year experienced software engineer)
 Behavior: Full write access. Create files, run checks, save results.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app import lifecycle
 from app.config import ALLOWED_ORIGINS, API_TITLE, API_VERSION, REDIS_URL, USE_REDIS
+from app.routes.admin import router as admin_router
 from app.routes.check_news import router as check_news_router
+from app.utils import metrics
+from app.utils.admission import AdmissionControlMiddleware
+from app.utils.rate_limit import RateLimitMiddleware
+from app.utils.scheduling import PriorityMiddleware
 from app.utils.cache import Cache, is_redis_available
 
-app = FastAPI(title=API_TITLE, version=API_VERSION)
+app = FastAPI(title=API_TITLE, version=API_VERSION, lifespan=lifecycle.lifespan)
 
+# Middleware runs in reverse registration order: CORS, then per-client rate
+# limits, then admission control, so limited clients never occupy a slot and
+# 429/503 responses still carry CORS headers. The priority class is set last.
+app.add_middleware(PriorityMiddleware)
+app.add_middleware(AdmissionControlMiddleware, prefixes=("/check-news",))
+app.add_middleware(RateLimitMiddleware, prefixes=("/check-news",))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
@@ -21,6 +33,7 @@ app.add_middleware(
 )
 
 app.include_router(check_news_router)
+app.include_router(admin_router)
 
 
 @app.get("/health", tags=["health"])
@@ -30,8 +43,17 @@ async def healthcheck() -> dict[str, str]:
 
 
 @app.get("/ready", tags=["health"])
-async def readiness() -> dict[str, object]:
-    """Expose a readiness probe that validates core dependencies."""
+async def readiness(response: Response) -> dict[str, object]:
+    """Expose a readiness probe that validates core dependencies.
+
+    Answers 503 with status ``warming`` until start-up warm-up finishes and
+    ``draining`` once shutdown begins.
+    """
+
+    phase = lifecycle.state()
+    if phase != lifecycle.READY:
+        response.status_code = 503
+        return {"status": phase, "checks": {"warmup": lifecycle.report()}}
 
     cache_check = await _probe_cache()
     redis_expected = bool(USE_REDIS and REDIS_URL)
@@ -53,10 +75,17 @@ async def readiness() -> dict[str, object]:
                 "configured": redis_expected,
                 "available": redis_available,
             },
+            "warmup": lifecycle.report(),
         },
     }
 
 
+@app.get("/metrics", tags=["health"])
+async def metrics_snapshot() -> dict[str, object]:
+    """Expose in-process counters, gauges and summaries as JSON."""
+    return metrics.snapshot()
+
+
 async def _probe_cache() -> dict[str, object]:
     try:
         cache = Cache(ttl=2, max_items=8)
@@ -0,0 +1,41 @@
+"""Operator endpoints. Every route requires the ``X-Admin-Token`` header to match
+``ADMIN_TOKEN``; when no token is configured the routes answer 404 as if they
+did not exist.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app import config
+from app.services import classifier_service
+
+logger = logging.getLogger(__name__)
+
+
+def _require_admin_token(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    expected = config.ADMIN_TOKEN
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(_require_admin_token)])
+
+
+@router.post("/reload-model")
+async def reload_model() -> dict[str, Optional[str]]:
+    """Reload classifier models from disk and report the versions now serving."""
+
+    try:
+        # Loading model files is blocking I/O; keep it off the event loop.
+        return await asyncio.to_thread(classifier_service.reload_models)
+    except classifier_service.ClassifierServiceError as exc:
+        logger.error("%s", exc)
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -5,15 +5,19 @@ Behavior: Full write access. Create files, run checks, save results.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Optional, TypeVar
 
-from fastapi import APIRouter, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 
 from app import config
-from app.services import classifier_service, factcheck_service, news_service
+from app.services import classifier_service, factcheck_service, news_service, query_extraction
 from app.services.mock_service import analyze_text_mock
+from app.utils import cache, jobs, json_codec, metrics, scheduling, text_context
 
 router = APIRouter(tags=["analysis"])
 logger = logging.getLogger(__name__)
@@ -58,84 +62,611 @@ class CheckNewsResponse(BaseModel):
     claim_reviews: list[ClaimReviewItem]
     classifier: "ClassifierResult"
     notes: str
+    # False when a fact-check or news lookup failed transiently; never serialised.
+    _complete: bool = PrivateAttr(default=True)
 
 
 class ClassifierResult(BaseModel):
     provider: str
     score: float = Field(..., ge=0.0, le=1.0)
     explanation: Optional[str] = None
+    model_version: Optional[str] = None
+
+
+class CheckNewsBatchRequest(BaseModel):
+    """Several texts analysed in one call; results come back in input order."""
+
+    texts: list[str] = Field(..., min_length=1, description="News articles, snippets, or headlines")
+
+
+class CheckNewsBatchItem(BaseModel):
+    index: int
+    result: Optional[CheckNewsResponse] = None
+    error: Optional[str] = None
+
+
+class CheckNewsBatchResponse(BaseModel):
+    results: list[CheckNewsBatchItem]
+
+
+class CheckNewsJob(BaseModel):
+    """State of a queued analysis; ``result`` is set once ``status`` is ``done``."""
+
+    id: str
+    status: str
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[CheckNewsResponse] = None
+    error: Optional[str] = None
+
+
+async def _run_job(payload: dict[str, Any]) -> dict[str, Any]:
+    # Workers outlive the request that started them, so restore the submitter's class.
+    with scheduling.use_priority(payload.get("priority", scheduling.BULK)):
+        response = await _analyse(payload["text"], bool(payload.get("refresh")))
+    return response.model_dump()
+
+
+_JOBS = jobs.JobQueue(
+    _run_job,
+    name="check_news",
+    workers=config.JOBS_WORKERS,
+    max_depth=config.JOBS_QUEUE_MAX_DEPTH,
+    ttl=config.JOBS_RESULT_TTL_SECONDS,
+    max_retained=config.JOBS_MAX_RETAINED,
+    backend=config.JOBS_QUEUE_BACKEND,
+)
+
+
+_RESPONSE_CACHE = cache.create_cache(
+    "check_news.response",
+    ttl=max(1, config.CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS),
+    max_items=config.CHECK_NEWS_RESPONSE_CACHE_MAXSIZE,
+)
+
+
+_T = TypeVar("_T")
+
+# Non-standard status popularised by nginx; nobody receives it, but it keeps
+# abandoned requests distinguishable in access logs.
+_CLIENT_CLOSED_REQUEST = 499
+
+
+class _ClientDisconnected(Exception):
+    """The caller went away before the analysis finished."""
 
 
 @router.post("/check-news", response_model=CheckNewsResponse, status_code=200)
 async def check_news(
+    request: Request,
     payload: CheckNewsRequest,
     refresh: bool = Query(False, description="Force refresh of cached downstream results."),
-) -> CheckNewsResponse:
-    """Return deterministic mock analysis augmented with fact-check and news context."""
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
+    """Return deterministic mock analysis augmented with fact-check and news context.
+
+    The serialised response is cached per normalised text and provider setup and
+    carries a strong ``ETag``; a matching ``If-None-Match`` gets ``304``.
+    ``refresh=true`` recomputes every stage and replaces the cached response.
+    If the client disconnects first, outstanding lookups are cancelled; stages
+    that already finished stay in their caches.
+    """
+
+    enabled = config.CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS > 0
+    context = text_context.TextContext.from_text(payload.text)
+    key = _response_cache_key(context)
+    entry = await _RESPONSE_CACHE.get(key) if enabled and not refresh else None
+    if entry is None:
+        try:
+            response = await _unless_disconnected(request, _analyse(context, refresh))
+        except _ClientDisconnected:
+            return Response(status_code=_CLIENT_CLOSED_REQUEST)
+        body = response.model_dump_json()
+        entry = {"etag": _strong_etag(body), "body": body}
+        if enabled and not _is_degraded(response):
+            await _RESPONSE_CACHE.set(key, entry, ttl=config.CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS)
+        metrics.increment("check_news.response_cache.miss")
+    else:
+        metrics.increment("check_news.response_cache.hit")
+
+    headers = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, entry["etag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry["body"], media_type="application/json", headers=headers)
+
+
+async def _unless_disconnected(request: Request, work: Awaitable[_T]) -> _T:
+    """Await *work*, cancelling it and raising ``_ClientDisconnected`` if the client leaves."""
+
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait((task, watcher), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+    if task.cancelled() or not task.done():
+        await asyncio.gather(task, return_exceptions=True)
+        metrics.increment("check_news.client_disconnected")
+        raise _ClientDisconnected()
+    return task.result()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    # The body has already been read, so the next ASGI message is the disconnect.
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+def _response_cache_key(context: text_context.TextContext) -> str:
+    return cache.make_key(
+        "check_news.response",
+        context.digest,
+        config.FACTCHECK_PROVIDER,
+        config.FACTCHECK_DEFAULT_LIMIT,
+        config.NEWS_PROVIDER,
+        config.NEWS_DEFAULT_LIMIT,
+        config.CLASSIFIER_PROVIDER,
+        classifier_service.active_model_version(),
+    )
+
+
+def _strong_etag(body: str) -> str:
+    return '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    # If-None-Match uses weak comparison, so W/"x" also matches "x".
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _is_degraded(response: CheckNewsResponse) -> bool:
+    """True when a lookup failed transiently or the local classifier stood in for RapidAPI."""
+
+    if not response._complete:  # noqa: SLF001
+        return True
+    return config.CLASSIFIER_PROVIDER == "rapidapi" and response.classifier.provider == "local"
+
+
+async def prime_response_cache(texts: list[str]) -> int:
+    """Analyse *texts* that are not cached yet so their first request is a hit.
+
+    Used by the start-up warm-up. Work runs in the bulk class at most
+    ``CHECK_NEWS_BATCH_CONCURRENCY`` texts at a time; failures are logged and
+    skipped. Returns the number of texts analysed.
+    """
+
+    enabled = config.CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS > 0
+    contexts: dict[str, text_context.TextContext] = {}
+    for text in texts:
+        context = text_context.TextContext.from_text(text)
+        if context.normalised:
+            contexts.setdefault(context.digest, context)
+    semaphore = asyncio.Semaphore(config.CHECK_NEWS_BATCH_CONCURRENCY)
+
+    async def _prime(context: text_context.TextContext) -> bool:
+        key = _response_cache_key(context)
+        if enabled and await _RESPONSE_CACHE.get(key) is not None:
+            return False
+        async with semaphore:
+            response = await _analyse(context, False)
+        if enabled and not _is_degraded(response):
+            body = response.model_dump_json()
+            await _RESPONSE_CACHE.set(
+                key,
+                {"etag": _strong_etag(body), "body": body},
+                ttl=config.CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS,
+            )
+        return True
+
+    with scheduling.use_priority(scheduling.BULK):
+        outcomes = await asyncio.gather(*(_prime(context) for context in contexts.values()), return_exceptions=True)
+    failures = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    if failures:
+        logger.warning("Could not prime %d of %d texts: %s", len(failures), len(outcomes), failures[0])
+    return sum(1 for outcome in outcomes if outcome is True)
+
+
+@router.post("/check-news/batch", response_model=CheckNewsBatchResponse, status_code=200)
+async def check_news_batch(
+    request: Request,
+    payload: CheckNewsBatchRequest,
+    refresh: bool = Query(False, description="Force refresh of cached downstream results."),
+) -> Response:
+    """Analyse many texts at once, sharing work between identical inputs.
+
+    Texts that normalise to the same string are analysed once. Cached fact-check,
+    news and classifier results for every distinct text are fetched in one bulk
+    lookup per cache, and the remaining work runs at most
+    ``CHECK_NEWS_BATCH_CONCURRENCY`` texts at a time.
+    """
+
+    if len(payload.texts) > config.CHECK_NEWS_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds the limit of {config.CHECK_NEWS_BATCH_MAX_ITEMS} texts",
+        )
 
-    response_data: dict[str, Any] = analyze_text_mock(payload.text)
-    provider_label = config.NEWS_PROVIDER
-    notes = response_data.get("notes", "")
+    positions: dict[str, list[int]] = {}
+    contexts: dict[str, text_context.TextContext] = {}
+    for index, text in enumerate(payload.texts):
+        context = text_context.TextContext.from_text(text)
+        contexts.setdefault(context.digest, context)
+        positions.setdefault(context.digest, []).append(index)
+    unique_texts = [context for context in contexts.values() if context.normalised]
+    metrics.observe("check_news.batch.size", len(payload.texts))
+    metrics.observe("check_news.batch.unique", len(unique_texts))
+
+    prefetched = [{} for _ in unique_texts] if refresh else await _prefetch_cached(unique_texts)
+    semaphore = asyncio.Semaphore(config.CHECK_NEWS_BATCH_CONCURRENCY)
+
+    async def _run(context: text_context.TextContext, cached_stages: dict[str, Any]) -> CheckNewsResponse:
+        async with semaphore:
+            return await _analyse(context, refresh, cached_stages)
 
-    claim_reviews: list[dict[str, Any]] = []
     try:
-        claim_reviews = await factcheck_service.query_claimreview(
-            payload.text,
-            limit=config.FACTCHECK_DEFAULT_LIMIT,
-            force_refresh=refresh,
+        outcomes = await _unless_disconnected(
+            request,
+            asyncio.gather(
+                *(_run(context, cached_stages) for context, cached_stages in zip(unique_texts, prefetched)),
+                return_exceptions=True,
+            ),
         )
-    except Exception as exc:  # pragma: no cover - defensive guard
-        logger.exception("FactCheck query failed", exc_info=exc)
-        claim_reviews = []
+    except _ClientDisconnected:
+        return Response(status_code=_CLIENT_CLOSED_REQUEST)
+
+    items: list[Optional[CheckNewsBatchItem]] = [None] * len(payload.texts)
+    for context, outcome in zip(unique_texts, outcomes):
+        for index in positions.pop(context.digest):
+            if isinstance(outcome, BaseException):
+                logger.error("Batch item %d failed: %s", index, outcome)
+                items[index] = CheckNewsBatchItem(index=index, error="Analysis failed; see logs for details.")
+            else:
+                items[index] = CheckNewsBatchItem(index=index, result=outcome)
+    for indices in positions.values():
+        for index in indices:
+            items[index] = CheckNewsBatchItem(index=index, error="Text must not be empty.")
+    return _json_response(CheckNewsBatchResponse(results=[item for item in items if item is not None]))
+
+
+@router.post("/check-news/jobs", response_model=CheckNewsJob, status_code=202)
+async def submit_check_news_job(
+    payload: CheckNewsRequest,
+    refresh: bool = Query(False, description="Force refresh of cached downstream results."),
+) -> Response:
+    """Queue an analysis and return its job id without waiting for the result."""
 
-    if claim_reviews:
-        verdict, confidence = _promote_claim_review_verdict(claim_reviews)
-        response_data["verdict"] = verdict
-        response_data["confidence"] = confidence
-        notes = _append_note(notes, "ClaimReview matched and promoted to primary verdict.")
-    sources: list[dict[str, Any]] = []
     try:
-        sources = await news_service.search_news(
-            payload.text,
-            limit=config.NEWS_DEFAULT_LIMIT,
-            force_refresh=refresh,
+        job = await _JOBS.submit(
+            {"text": payload.text, "refresh": refresh, "priority": scheduling.current_priority()}
+        )
+    except jobs.JobQueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"}) from exc
+    return _json_response(
+        CheckNewsJob.model_validate(job),
+        status_code=202,
+        headers={"Location": f"/check-news/jobs/{job['id']}"},
+    )
+
+
+@router.get("/check-news/jobs/{job_id}", response_model=CheckNewsJob)
+async def get_check_news_job(job_id: str) -> Response:
+    """Return the state of a queued analysis, including its result when done."""
+
+    job = await _JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return _json_response(CheckNewsJob.model_validate(job))
+
+
+def start_jobs() -> None:
+    """Start the analysis job workers so queued work is picked up without a new submission."""
+
+    _JOBS.start()
+
+
+async def drain_jobs(timeout: float) -> int:
+    """Stop taking analysis jobs and let running ones finish; returns the number abandoned."""
+
+    return await _JOBS.drain(timeout)
+
+
+@router.post("/check-news/stream", status_code=200)
+async def check_news_stream(
+    payload: CheckNewsRequest,
+    refresh: bool = Query(False, description="Force refresh of cached downstream results."),
+) -> StreamingResponse:
+    """Stream the analysis as NDJSON events while each stage completes.
+
+    The first line is a local classifier ``estimate`` computed without network
+    calls. ``claim_reviews``, ``sources`` and ``classifier`` lines follow in
+    completion order, and the last line is the full ``result`` payload as
+    returned by ``/check-news``.
+    """
+
+    context = text_context.TextContext.from_text(payload.text)
+    return StreamingResponse(_stream_events(context, refresh), media_type="application/x-ndjson")
+
+
+async def _stream_events(context: text_context.TextContext, refresh: bool) -> AsyncIterator[bytes]:
+    estimate = classifier_service.classify_many([context.raw])[0]
+    yield _ndjson({"stage": "estimate", "classifier": ClassifierResult(**estimate).model_dump()})
+
+    pending = [
+        asyncio.create_task(_tagged("claim_reviews", _lookup_claim_reviews(context, refresh, {}))),
+        asyncio.create_task(_tagged("sources", _lookup_sources(context, refresh, {}))),
+        asyncio.create_task(_tagged("classifier", _classify_with_fallback(context, refresh, {}))),
+    ]
+    results: dict[str, Any] = {}
+    try:
+        for completed in asyncio.as_completed(pending):
+            stage, outcome = await completed
+            results[stage] = outcome
+            yield _ndjson(_stage_event(stage, outcome))
+    finally:
+        # Runs when the client disconnects mid-stream as well.
+        _cancel_stages(pending)
+
+    claim_reviews, reviews_complete = results["claim_reviews"]
+    sources, news_note, sources_complete = results["sources"]
+    response = _assemble(
+        context,
+        claim_reviews,
+        sources,
+        news_note,
+        results["classifier"],
+        complete=reviews_complete and sources_complete,
+    )
+    yield _ndjson({"stage": "result", "result": response.model_dump(mode="json")})
+
+
+async def _tagged(stage: str, awaitable: Awaitable[Any]) -> tuple[str, Any]:
+    return stage, await awaitable
+
+
+def _stage_event(stage: str, outcome: Any) -> dict[str, Any]:
+    if stage == "sources":
+        sources, note, _ = outcome
+        return {"stage": stage, "sources": sources, "note": note}
+    if stage == "classifier":
+        return {"stage": stage, "classifier": ClassifierResult(**outcome).model_dump()}
+    return {"stage": stage, "claim_reviews": outcome[0]}
+
+
+def _ndjson(event: dict[str, Any]) -> bytes:
+    return json_codec.dumps(event) + b"\n"
+
+
+async def _analyse(
+    text: text_context.TextLike,
+    refresh: bool,
+    cached_stages: Optional[dict[str, Any]] = None,
+) -> CheckNewsResponse:
+    """Run the three lookups concurrently and assemble the response.
+
+    *cached_stages* carries results already fetched from the stage caches (keys
+    ``claim_reviews``, ``sources`` and ``classifier``); those stages are skipped.
+    """
+
+    context = text_context.of(text)
+    stages = cached_stages or {}
+    tasks = [
+        asyncio.ensure_future(_lookup_claim_reviews(context, refresh, stages)),
+        asyncio.ensure_future(_lookup_sources(context, refresh, stages)),
+        asyncio.ensure_future(_classify_with_fallback(context, refresh, stages)),
+    ]
+    try:
+        (claim_reviews, reviews_complete), (sources, news_note, sources_complete), classifier_result = (
+            await asyncio.gather(*tasks)
         )
-        if sources:
-            notes = _append_note(notes, f"News results added from provider: {provider_label}")
-        else:
-            notes = _append_note(notes, "No related articles returned by the news provider.")
-    except news_service.MissingCredentialsError as exc:
-        notes = _append_note(notes, f"News provider credentials missing: {exc}.")
-    except Exception as exc:  # pragma: no cover - defensive guard
-        logger.exception("News search failed", exc_info=exc)
-        notes = _append_note(notes, "News provider lookup failed; see logs for details.")
-
-    classifier_payload = await _classify_with_fallback(payload.text, notes, refresh)
-    notes = classifier_payload["notes"]
+    except asyncio.CancelledError:
+        _cancel_stages(tasks)
+        raise
+    return _assemble(
+        context,
+        claim_reviews,
+        sources,
+        news_note,
+        classifier_result,
+        complete=reviews_complete and sources_complete,
+    )
+
+
+def _cancel_stages(tasks: list[asyncio.Future[Any]]) -> None:
+    """Cancel unfinished stage lookups and count the upstream calls that saves."""
+
+    # gather() may already have cancelled them, so count those too.
+    abandoned = [task for task in tasks if not task.done() or task.cancelled()]
+    for task in abandoned:
+        task.cancel()
+    if abandoned:
+        metrics.increment("check_news.stage_lookups_cancelled", len(abandoned))
+
+
+def _assemble(
+    context: text_context.TextContext,
+    claim_reviews: list[dict[str, Any]],
+    sources: list[dict[str, Any]],
+    news_note: str,
+    classifier_result: dict[str, Any],
+    *,
+    complete: bool = True,
+) -> CheckNewsResponse:
+    # Provider payloads are validated once here; everything else is computed in
+    # this module and goes through model_construct without a second validation.
+    mock = analyze_text_mock(context.raw)
+    notes = [mock.get("notes", "")]
+
+    if claim_reviews:
+        verdict, confidence = _promote_claim_review_verdict(claim_reviews)
+        notes.append("ClaimReview matched and promoted to primary verdict.")
+    notes.append(news_note)
+    provider = classifier_result.get("provider")
+    notes.append(f"Classifier provider {provider} executed." if provider else "Classifier executed.")
 
     if not claim_reviews:
-        combined_score = _combine_scores(classifier_payload["score"], _estimate_news_contradiction_score(sources))
+        combined_score = _combine_scores(classifier_result["score"], _estimate_news_contradiction_score(sources))
         verdict, confidence = _map_score_to_verdict(combined_score)
-        response_data["verdict"] = verdict
-        response_data["confidence"] = confidence
-        notes = _append_note(notes, "Verdict blended classifier and news heuristics.")
-
-    response_data["sources"] = sources
-    response_data["claim_reviews"] = claim_reviews
-    response_data["classifier"] = ClassifierResult(
-        provider=classifier_payload["provider"],
-        score=classifier_payload["score"],
-        explanation=classifier_payload.get("explanation"),
+        notes.append("Verdict blended classifier and news heuristics.")
+
+    response = CheckNewsResponse.model_construct(
+        verdict=verdict,
+        confidence=confidence,
+        evidence=list(mock.get("evidence", [])),
+        sources=_SOURCES_ADAPTER.validate_python(sources),
+        claim_reviews=_CLAIM_REVIEWS_ADAPTER.validate_python(claim_reviews),
+        classifier=ClassifierResult.model_construct(
+            provider=provider or "local",
+            score=max(0.0, min(1.0, float(classifier_result["score"]))),
+            explanation=classifier_result.get("explanation"),
+            model_version=classifier_result.get("model_version"),
+        ),
+        notes=" ".join(note.strip() for note in notes if note and note.strip()),
+    )
+    response._complete = complete  # noqa: SLF001
+    return response
+
+
+_SOURCES_ADAPTER = TypeAdapter(list[SourceArticle])
+_CLAIM_REVIEWS_ADAPTER = TypeAdapter(list[ClaimReviewItem])
+
+
+def _json_response(model: BaseModel, *, status_code: int = 200, headers: Optional[dict[str, str]] = None) -> Response:
+    """Serialise an already-built model directly, skipping response_model re-validation."""
+
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json", headers=headers)
+
+
+def _search_queries(context: text_context.TextContext) -> query_extraction.QueryExtraction:
+    return query_extraction.extract(
+        context,
+        max_claims=config.FACTCHECK_MAX_CLAIM_QUERIES,
+        max_keywords=config.NEWS_QUERY_MAX_KEYWORDS,
+        min_chars=config.QUERY_EXTRACTION_MIN_CHARS,
     )
-    response_data["notes"] = notes
-    return CheckNewsResponse.model_validate(response_data)
 
 
-def _append_note(existing: str, addition: str) -> str:
-    cleaned_existing = existing.strip()
-    if not cleaned_existing:
-        return addition
-    return f"{cleaned_existing} {addition}".strip()
+async def _lookup_claim_reviews(
+    context: text_context.TextContext,
+    refresh: bool,
+    stages: dict[str, Any],
+) -> tuple[list[dict[str, Any]], bool]:
+    """Return the merged reviews and whether every claim query answered."""
+
+    if "claim_reviews" in stages:
+        return stages["claim_reviews"], True
+    claims = _search_queries(context).claims
+    outcomes = await asyncio.gather(
+        *(
+            factcheck_service.query_claimreview(claim, limit=config.FACTCHECK_DEFAULT_LIMIT, force_refresh=refresh)
+            for claim in claims
+        ),
+        return_exceptions=True,
+    )
+    results: list[list[dict[str, Any]]] = []
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            logger.error("FactCheck query failed: %s", outcome)
+            continue
+        if outcome is not None:
+            results.append(outcome)
+    return _merge_claim_reviews(results), len(results) == len(outcomes)
+
+
+def _merge_claim_reviews(results: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Concatenate per-claim results in claim rank order, dropping repeated URLs."""
+
+    merged: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for reviews in results:
+        for review in reviews:
+            url = review.get("url")
+            if url in seen:
+                continue
+            seen.add(url)
+            merged.append(review)
+    return merged[: config.FACTCHECK_DEFAULT_LIMIT]
+
+
+async def _lookup_sources(
+    context: text_context.TextContext,
+    refresh: bool,
+    stages: dict[str, Any],
+) -> tuple[list[dict[str, Any]], str, bool]:
+    """Return the articles, a note for the response and whether the lookup succeeded."""
+
+    sources: Optional[list[dict[str, Any]]]
+    if "sources" in stages:
+        sources = stages["sources"]
+    else:
+        try:
+            sources = await news_service.search_news(
+                _search_queries(context).news_query,
+                limit=config.NEWS_DEFAULT_LIMIT,
+                force_refresh=refresh,
+            )
+        except news_service.MissingCredentialsError as exc:
+            return [], f"News provider credentials missing: {exc}.", True
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.exception("News search failed", exc_info=exc)
+            return [], "News provider lookup failed; see logs for details.", False
+        if sources is None:
+            return [], "News provider lookup failed; see logs for details.", False
+    if sources:
+        return sources, f"News results added from provider: {config.NEWS_PROVIDER}", True
+    return sources, "No related articles returned by the news provider.", True
+
+
+async def _prefetch_cached(contexts: list[text_context.TextContext]) -> list[dict[str, Any]]:
+    """Bulk-read the fact-check, news and classifier caches for *texts*.
+
+    A text's fact-check stage counts as cached only when every one of its claim
+    queries is cached.
+    """
+
+    prefetched: list[dict[str, Any]] = [{} for _ in contexts]
+    extractions = [_search_queries(context) for context in contexts]
+    lookups = (
+        (
+            "claim_reviews",
+            factcheck_service.query_claimreview,
+            {"limit": config.FACTCHECK_DEFAULT_LIMIT},
+            [list(extraction.claims) for extraction in extractions],
+        ),
+        (
+            "sources",
+            news_service.search_news,
+            {"limit": config.NEWS_DEFAULT_LIMIT},
+            [[extraction.news_query] for extraction in extractions],
+        ),
+        ("classifier", classifier_service.classify_text, {}, [[context] for context in contexts]),
+    )
+    for stage, lookup, kwargs, queries in lookups:
+        key_for = getattr(lookup, "cache_key", None)
+        backend = getattr(lookup, "cache_backend", None)
+        if key_for is None or backend is None:
+            continue
+        try:
+            values = await backend.get_many([key_for(query, **kwargs) for group in queries for query in group])
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning("Bulk cache lookup for %s failed: %s", stage, exc)
+            continue
+        hits = 0
+        offset = 0
+        for slot, group in zip(prefetched, queries):
+            found = values[offset : offset + len(group)]
+            offset += len(group)
+            if not group or any(value is None for value in found):
+                continue
+            slot[stage] = _merge_claim_reviews(found) if stage == "claim_reviews" else found[0]
+            hits += 1
+        metrics.increment(f"check_news.batch.{stage}.cache_hits", hits)
+    return prefetched
 
 
 def _promote_claim_review_verdict(reviews: list[dict[str, Any]]) -> tuple[str, float]:
@@ -179,24 +710,30 @@ def _promote_claim_review_verdict(reviews: list[dict[str, Any]]) -> tuple[str, f
     return "unsure", 0.6
 
 
-async def _classify_with_fallback(text: str, notes: str, refresh: bool) -> dict[str, Any]:
-    try:
-        result = await classifier_service.classify_text(text, force_refresh=refresh)
-    except Exception as exc:  # pragma: no cover - defensive guard
-        logger.exception("Classifier invocation failed", exc_info=exc)
-        result = {
-            "provider": "local",
-            "score": 0.5,
-            "explanation": "Classifier unavailable; defaulting to neutral score.",
-        }
-
-    note_suffix = f"Classifier provider {result['provider']} executed." if result.get("provider") else "Classifier executed."
-    updated_notes = _append_note(notes, note_suffix)
+async def _classify_with_fallback(
+    context: text_context.TextContext,
+    refresh: bool,
+    stages: dict[str, Any],
+) -> dict[str, Any]:
+    result: dict[str, Any]
+    if "classifier" in stages:
+        result = stages["classifier"]
+    else:
+        try:
+            result = await classifier_service.classify_text(context, force_refresh=refresh)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.exception("Classifier invocation failed", exc_info=exc)
+            result = {
+                "provider": "local",
+                "score": 0.5,
+                "explanation": "Classifier unavailable; defaulting to neutral score.",
+            }
+
     return {
         "provider": result.get("provider", "local"),
         "score": float(result.get("score", 0.5)),
         "explanation": result.get("explanation"),
-        "notes": updated_notes,
+        "model_version": result.get("model_version"),
     }
 
 
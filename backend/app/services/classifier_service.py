@@ -9,15 +9,19 @@ through the shared caching utilities to avoid repeated lookups.
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
 import math
-from typing import Any, Dict, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
 import httpx
+import numpy as np
 
 from app import config
-from app.utils import cache
+from app.services import lexicon, linear_model, onnx_classifier
+from app.utils import batching, cache, http_client, metrics, scheduling, text_context
 
 logger = logging.getLogger(__name__)
 
@@ -29,41 +33,11 @@ class ClassifierServiceError(Exception):
 class MissingCredentialsError(ClassifierServiceError):
     """Raised when RapidAPI credentials are required but not configured."""
 
-_SENSATIONAL_TERMS = {
-    "shocking",
-    "breaking",
-    "exposed",
-    "hoax",
-    "cover-up",
-    "outrage",
-    "collapse",
-    "apocalypse",
-    "secret",
-    "reveal",
-}
-
-_REPUTABLE_TERMS = {
-    "according",
-    "research",
-    "study",
-    "reported",
-    "analysis",
-    "verified",
-    "official",
-    "evidence",
-    "journal",
-    "investigation",
-}
-
 
 def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     return max(minimum, min(maximum, value))
 
 
-def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 _CLASSIFIER_CACHE = cache.create_cache(
     "classifier.score",
     ttl=config.CLASSIFIER_CACHE_TTL_SECONDS,
@@ -71,12 +45,11 @@ _CLASSIFIER_CACHE = cache.create_cache(
 )
 
 
-def _make_cache_key(text: str, *, force_refresh: bool = False) -> str:
-    trimmed = " ".join(text.split())
-    digest = _hash_text(trimmed)
+def _make_cache_key(text: text_context.TextLike, *, force_refresh: bool = False) -> str:
+    digest = text_context.of(text).digest
     provider = config.CLASSIFIER_PROVIDER
     _ = force_refresh
-    return cache.make_key("classifier", provider, digest)
+    return cache.make_key("classifier", provider, active_model_version(), digest)
 
 
 def _sanitize_for_logs(text: str, max_len: int = 120) -> str:
@@ -84,20 +57,31 @@ def _sanitize_for_logs(text: str, max_len: int = 120) -> str:
     return cleaned[: max_len - 3] + "..." if len(cleaned) > max_len else cleaned
 
 
+def _result_ttl(result: Dict[str, Any]) -> int:
+    """Cache local stand-ins for RapidAPI only briefly so the remote score gets another chance."""
+
+    if config.CLASSIFIER_PROVIDER == "rapidapi" and result.get("provider") == "local":
+        return config.CLASSIFIER_FALLBACK_CACHE_TTL_SECONDS
+    return config.CLASSIFIER_CACHE_TTL_SECONDS
+
+
 @cache.cached(
     ttl=config.CLASSIFIER_CACHE_TTL_SECONDS,
     key_func=_make_cache_key,
     cache=_CLASSIFIER_CACHE,
     namespace="classifier.score",
+    ttl_for=_result_ttl,
 )
-async def classify_text(text: str, *, force_refresh: bool = False) -> Dict[str, Any]:
+async def classify_text(text: text_context.TextLike, *, force_refresh: bool = False) -> Dict[str, Any]:
     """Return a classifier score for *text*.
 
     Score is a float between 0 (likely real) and 1 (likely fake). RapidAPI is
     preferred when configured; otherwise the deterministic local heuristic is used.
+    *text* may be a ``TextContext`` so the cache key reuses its digest.
     """
 
-    trimmed = text.strip()
+    context = text_context.of(text)
+    trimmed = context.raw.strip()
     if not trimmed:
         return {
             "provider": "local",
@@ -109,52 +93,193 @@ async def classify_text(text: str, *, force_refresh: bool = False) -> Dict[str,
 
     result: Dict[str, Any]
     try:
-        if config.CLASSIFIER_PROVIDER == "rapidapi":
-            result = await _classify_via_rapidapi(trimmed)
-        elif config.CLASSIFIER_PROVIDER == "local":
-            result = _classify_locally(trimmed, reason="Configured to use local classifier")
+        if config.CLASSIFIER_PROVIDER == "rapidapi" and config.CLASSIFIER_ENSEMBLE_DEADLINE_MS > 0:
+            result = await _classify_ensemble(trimmed, context)
+        elif config.CLASSIFIER_PROVIDER == "rapidapi":
+            result = await _classify_via_rapidapi_batched(trimmed)
+        elif config.CLASSIFIER_PROVIDER in {"linear", "local"}:
+            result = await _classify_in_process(trimmed)
+        elif config.CLASSIFIER_PROVIDER == "onnx":
+            result = await _classify_with_onnx(trimmed)
         else:
             logger.warning("Unsupported classifier provider '%s'; falling back to local.", config.CLASSIFIER_PROVIDER)
             result = _classify_locally(trimmed, reason="Unsupported provider requested")
     except MissingCredentialsError:
         logger.warning("RapidAPI credentials missing; using local classifier for input: %s", _sanitize_for_logs(trimmed))
         result = _classify_locally(trimmed, reason="RapidAPI credentials missing")
-    except ClassifierServiceError as exc:  # pragma: no cover - defensive guard
+    except ClassifierServiceError as exc:
         logger.warning("Classifier provider error: %s; using local fallback.", exc)
         result = _classify_locally(trimmed, reason=str(exc))
 
     return result
 
 
-async def _classify_via_rapidapi(text: str) -> Dict[str, Any]:
+_LATE_REMOTE_WRITES: set[asyncio.Task[None]] = set()
+
+
+async def _classify_ensemble(text: str, context: text_context.TextContext) -> Dict[str, Any]:
+    """Score locally at once and blend in RapidAPI if it answers before the deadline.
+
+    The remote call is never cancelled. When it misses the deadline the local
+    score is returned (and cached for ``CLASSIFIER_FALLBACK_CACHE_TTL_SECONDS``
+    only) while a background task caches the blended score once the remote
+    answer lands, so the next identical request gets the full result.
+    Remote errors raised within the deadline propagate to the usual fallback.
+    """
+
+    local = _classify_locally(text)
+    remote = asyncio.ensure_future(_classify_via_rapidapi_batched(text))
+    done, _ = await asyncio.wait({remote}, timeout=config.CLASSIFIER_ENSEMBLE_DEADLINE_MS / 1000.0)
+    if done:
+        metrics.increment("classifier.ensemble.remote_in_time")
+        return _blend(local, remote.result())
+
+    metrics.increment("classifier.ensemble.remote_late")
+    key = _make_cache_key(context)
+    task = asyncio.create_task(_cache_late_remote(key, local, remote))
+    _LATE_REMOTE_WRITES.add(task)
+    task.add_done_callback(_LATE_REMOTE_WRITES.discard)
+    return {**local, "explanation": f"{local['explanation']} (remote classifier pending)"[:200]}
+
+
+async def _cache_late_remote(key: str, local: Dict[str, Any], remote: "asyncio.Future[Dict[str, Any]]") -> None:
+    try:
+        remote_result = await remote
+    except Exception as exc:
+        metrics.increment("classifier.ensemble.remote_failed")
+        logger.info("Late RapidAPI result failed; keeping local score: %s", exc)
+        return
+    await _CLASSIFIER_CACHE.set(key, _blend(local, remote_result), ttl=config.CLASSIFIER_CACHE_TTL_SECONDS)
+
+
+def _blend(local: Dict[str, Any], remote: Dict[str, Any]) -> Dict[str, Any]:
+    weight = config.CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT
+    score = weight * float(remote["score"]) + (1.0 - weight) * float(local["score"])
+    explanation = remote.get("explanation") or local.get("explanation") or ""
+    return {
+        "provider": "ensemble",
+        "score": _clamp(score),
+        "explanation": f"{explanation} (blended {weight:.0%} RapidAPI with local heuristic)"[:200],
+    }
+
+
+_RAPIDAPI_BATCHER: Optional[batching.MicroBatcher] = None
+
+
+def _rapidapi_batcher() -> batching.MicroBatcher:
+    global _RAPIDAPI_BATCHER
+    max_size = config.CLASSIFIER_BATCH_MAX_SIZE
+    max_wait = config.CLASSIFIER_BATCH_WINDOW_MS / 1000.0
+    batcher = _RAPIDAPI_BATCHER
+    if batcher is None or batcher.max_batch_size != max_size or batcher.max_wait != max_wait:
+        batcher = batching.MicroBatcher(
+            _classify_rapidapi_batch,
+            max_batch_size=max_size,
+            max_wait=max_wait,
+            name="classifier.rapidapi",
+        )
+        _RAPIDAPI_BATCHER = batcher
+    return batcher
+
+
+async def _classify_via_rapidapi_batched(text: str) -> Dict[str, Any]:
+    if config.CLASSIFIER_BATCH_MAX_SIZE <= 1:
+        return await _classify_via_rapidapi(text)
+    return await _rapidapi_batcher().submit(text)
+
+
+async def _classify_rapidapi_batch(texts: List[str]) -> List[Any]:
+    """Score a micro-batch of texts with as few RapidAPI round trips as possible.
+
+    A configured batch endpoint receives every text in one request. Otherwise the
+    texts are sent as a bounded parallel burst over the pooled client. Errors are
+    returned per item so each waiter sees its own outcome.
+    """
+
+    if config.RAPIDAPI_BATCH_ENDPOINT and len(texts) > 1:
+        try:
+            return await _classify_via_rapidapi_batch_endpoint(texts)
+        except ClassifierServiceError as exc:
+            return [exc] * len(texts)
+        except httpx.HTTPError as exc:
+            return [ClassifierServiceError(f"RapidAPI batch request failed: {exc}")] * len(texts)
+
+    semaphore = asyncio.Semaphore(config.CLASSIFIER_BATCH_CONCURRENCY)
+
+    async def _bounded(text: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _classify_via_rapidapi(text)
+
+    return list(await asyncio.gather(*(_bounded(text) for text in texts), return_exceptions=True))
+
+
+def _rapidapi_headers() -> Dict[str, str]:
     api_key = config.RAPIDAPI_KEY
     api_host = config.RAPIDAPI_HOST
-    endpoint = config.RAPIDAPI_CLASSIFIER_ENDPOINT
 
     if not api_key or not api_host:
         raise MissingCredentialsError("RAPIDAPI_KEY and RAPIDAPI_HOST are required for RapidAPI provider.")
 
-    headers = {
+    return {
         "Content-Type": "application/json",
         "X-RapidAPI-Key": api_key,
         "X-RapidAPI-Host": api_host,
     }
+
+
+def _rapidapi_client() -> httpx.AsyncClient:
+    return http_client.get_client("rapidapi", timeout=config.CLASSIFIER_HTTP_TIMEOUT_SECONDS)
+
+
+async def preconnect() -> bool:
+    """Open a pooled connection to RapidAPI; ``False`` when it is not in use."""
+
+    if config.CLASSIFIER_PROVIDER != "rapidapi" or not config.RAPIDAPI_KEY:
+        return False
+    return await http_client.preconnect(_rapidapi_client(), config.RAPIDAPI_CLASSIFIER_ENDPOINT)
+
+
+async def _classify_via_rapidapi(text: str) -> Dict[str, Any]:
+    headers = _rapidapi_headers()
+    endpoint = config.RAPIDAPI_CLASSIFIER_ENDPOINT
     payload = {"text": text}
 
-    async with httpx.AsyncClient(timeout=config.CLASSIFIER_HTTP_TIMEOUT_SECONDS) as client:
-        response = await client.post(endpoint, json=payload, headers=headers)
-        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
-            raise ClassifierServiceError("RapidAPI rate limit reached")
-        response.raise_for_status()
-        data = response.json()
+    async with scheduling.upstream_slot():
+        response = await _rapidapi_client().post(endpoint, json=payload, headers=headers)
+    if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+        raise ClassifierServiceError("RapidAPI rate limit reached")
+    response.raise_for_status()
+    data = response.json()
+
+    return _rapidapi_result(data)
+
+
+async def _classify_via_rapidapi_batch_endpoint(texts: List[str]) -> List[Any]:
+    headers = _rapidapi_headers()
+    endpoint = config.RAPIDAPI_BATCH_ENDPOINT
+    assert endpoint is not None
 
-    score = _extract_score(data)
-    explanation = _extract_explanation(data)
+    async with scheduling.upstream_slot():
+        response = await _rapidapi_client().post(endpoint, json={"texts": texts}, headers=headers)
+    if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+        raise ClassifierServiceError("RapidAPI rate limit reached")
+    response.raise_for_status()
+    data = response.json()
 
+    items = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(items, list) or len(items) != len(texts):
+        raise ClassifierServiceError("RapidAPI batch response does not match submitted texts")
+    return [
+        _rapidapi_result(item) if isinstance(item, dict) else ClassifierServiceError("Malformed batch item")
+        for item in items
+    ]
+
+
+def _rapidapi_result(data: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "provider": "rapidapi",
-        "score": score,
-        "explanation": explanation,
+        "score": _extract_score(data),
+        "explanation": _extract_explanation(data),
         "raw": data,
     }
 
@@ -189,14 +314,316 @@ def _extract_explanation(payload: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+_LINEAR_MODEL: Optional[linear_model.LinearModel] = None
+
+
+def _get_linear_model() -> linear_model.LinearModel:
+    global _LINEAR_MODEL
+    path = config.LINEAR_MODEL_PATH
+    if not path:
+        raise ClassifierServiceError("LINEAR_MODEL_PATH is not configured")
+    model = _LINEAR_MODEL
+    if model is None or model.path != path:
+        try:
+            model = linear_model.LinearModel.load(path)
+        except linear_model.LinearModelError as exc:
+            raise ClassifierServiceError(str(exc)) from exc
+        logger.info("Loaded linear classifier %s from %s", model.version, path)
+        _LINEAR_MODEL = model
+    return model
+
+
+def _classify_with_linear_model(text: str) -> Dict[str, Any]:
+    model = _get_linear_model()
+    return {
+        "provider": "linear",
+        "score": _clamp(model.score(text)),
+        "explanation": f"Linear TF-IDF model {model.version}",
+        "model_version": model.version,
+    }
+
+
+_ONNX_MODEL: Optional[onnx_classifier.OnnxClassifier] = None
+_ONNX_BATCHER: Optional[batching.MicroBatcher] = None
+
+
+def _get_onnx_model() -> onnx_classifier.OnnxClassifier:
+    global _ONNX_MODEL
+    model_path = config.ONNX_MODEL_PATH
+    vocab_path = config.ONNX_VOCAB_PATH
+    if not model_path or not vocab_path:
+        raise ClassifierServiceError("ONNX_MODEL_PATH and ONNX_VOCAB_PATH are required for the onnx provider")
+    if _ONNX_MODEL is None or _ONNX_MODEL.model_path != model_path:
+        try:
+            _ONNX_MODEL = onnx_classifier.OnnxClassifier.load(
+                model_path,
+                vocab_path,
+                threads=config.ONNX_INTRA_OP_THREADS,
+                max_length=config.ONNX_MAX_SEQUENCE_LENGTH,
+            )
+        except onnx_classifier.OnnxClassifierError as exc:
+            raise ClassifierServiceError(str(exc)) from exc
+        logger.info("Loaded ONNX classifier %s from %s", _ONNX_MODEL.version, model_path)
+    return _ONNX_MODEL
+
+
+def _onnx_batcher() -> batching.MicroBatcher:
+    global _ONNX_BATCHER
+    max_size = config.ONNX_BATCH_MAX_SIZE
+    max_wait = config.ONNX_BATCH_WINDOW_MS / 1000.0
+    batcher = _ONNX_BATCHER
+    if batcher is None or batcher.max_batch_size != max_size or batcher.max_wait != max_wait:
+        batcher = batching.MicroBatcher(_predict_onnx_batch, max_batch_size=max_size, max_wait=max_wait, name="classifier.onnx")
+        _ONNX_BATCHER = batcher
+    return batcher
+
+
+async def _predict_onnx_batch(texts: List[str]) -> List[float]:
+    model = _get_onnx_model()
+    # Inference releases the GIL inside onnxruntime, so a worker thread keeps the
+    # event loop responsive while the session runs.
+    return await asyncio.to_thread(model.predict, texts)
+
+
+async def _classify_with_onnx(text: str) -> Dict[str, Any]:
+    model = _get_onnx_model()
+    score = await _onnx_batcher().submit(text)
+    return {
+        "provider": "onnx",
+        "score": _clamp(score),
+        "explanation": f"ONNX transformer model {model.version}",
+        "model_version": model.version,
+    }
+
+
+def classify_many(texts: Sequence[str]) -> List[Dict[str, Any]]:
+    """Score many texts at once with the in-process classifier.
+
+    Intended for backfills: results are not cached and RapidAPI is never called.
+    The linear model is used when it is the configured provider, otherwise the
+    local heuristic. Scores match :func:`classify_text` for the same provider.
+    """
+
+    trimmed = [text.strip() for text in texts]
+    results: List[Optional[Dict[str, Any]]] = [None] * len(trimmed)
+    indices = [index for index, text in enumerate(trimmed) if text]
+    batch = [trimmed[index] for index in indices]
+
+    scored: List[Dict[str, Any]]
+    if not batch:
+        scored = []
+    elif config.CLASSIFIER_PROVIDER == "linear":
+        try:
+            model = _get_linear_model()
+        except ClassifierServiceError as exc:
+            logger.warning("Linear model unavailable for batch scoring: %s; using local fallback.", exc)
+            scored = _classify_many_locally(batch, reason=str(exc))
+        else:
+            explanation = f"Linear TF-IDF model {model.version}"
+            scored = [
+                {"provider": "linear", "score": _clamp(float(score)), "explanation": explanation, "model_version": model.version}
+                for score in model.score_many(batch)
+            ]
+    else:
+        scored = _classify_many_locally(batch, reason="Configured to use local classifier")
+
+    for index, result in zip(indices, scored):
+        results[index] = result
+    return [
+        result
+        if result is not None
+        else {"provider": "local", "score": 0.5, "explanation": "No text submitted for classification."}
+        for result in results
+    ]
+
+
+def _classify_many_locally(texts: Sequence[str], *, reason: Optional[str] = None) -> List[Dict[str, Any]]:
+    sensational_hits, reputable_hits, weights = _get_lexicon().scan_many(texts)
+    scores = 1 / (1 + np.exp(-weights))
+    return [
+        _local_result(float(score), int(sensational), int(reputable), reason)
+        for score, sensational, reputable in zip(scores, sensational_hits, reputable_hits)
+    ]
+
+
+_LEXICON: Optional[lexicon.Lexicon] = None
+_LEXICON_SOURCE: Optional[str] = None
+
+
+def _get_lexicon() -> lexicon.Lexicon:
+    global _LEXICON, _LEXICON_SOURCE
+    source = config.LEXICON_PATH or str(lexicon.DEFAULT_LEXICON_PATH)
+    if _LEXICON is None or _LEXICON_SOURCE != source:
+        try:
+            loaded = lexicon.Lexicon.load(source)
+        except lexicon.LexiconError as exc:
+            logger.warning("%s; using the bundled lexicon instead.", exc)
+            loaded = lexicon.Lexicon.load(lexicon.DEFAULT_LEXICON_PATH)
+        _LEXICON, _LEXICON_SOURCE = loaded, source
+    return _LEXICON
+
+
+def _count_local_hits(text: str) -> lexicon.LexiconMatch:
+    return _get_lexicon().scan(text)
+
+
+def _local_score(weight: float) -> float:
+    return 1 / (1 + math.exp(-weight))
+
+
 def _classify_locally(text: str, *, reason: Optional[str] = None) -> Dict[str, Any]:
-    words = [token.strip(".,!?;:\"'()").lower() for token in text.split() if token.strip()]
-    sensational_hits = sum(1 for word in words if word in _SENSATIONAL_TERMS)
-    reputable_hits = sum(1 for word in words if word in _REPUTABLE_TERMS)
+    match = _count_local_hits(text)
+    return _local_result(_local_score(match.weight), match.sensational_hits, match.reputable_hits, reason)
+
+
+_LOCAL_REASON = "Configured to use local classifier"
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+
+async def _classify_in_process(text: str) -> Dict[str, Any]:
+    """Run the configured in-process model inline or on the process pool.
+
+    Short texts are scored inline because pickling them to a worker costs more
+    than scoring them. Long texts are split on whitespace into chunks that are
+    scored in parallel by pre-warmed workers, keeping the event loop free.
+    """
+
+    if config.CLASSIFIER_EXECUTION != "process" or len(text) <= config.CLASSIFIER_INLINE_MAX_CHARS:
+        return _classify_inline(text)
+
+    chunks = _split_into_chunks(text, config.CLASSIFIER_CHUNK_CHARS)
+    metrics.observe("classifier.pool.chunks", len(chunks))
+    loop = asyncio.get_running_loop()
+    pool = _get_process_pool()
+    partials = await asyncio.gather(*(loop.run_in_executor(pool, _score_chunk, chunk) for chunk in chunks))
+    return _aggregate_chunks(partials, [len(chunk) for chunk in chunks])
+
+
+def _classify_inline(text: str) -> Dict[str, Any]:
+    if config.CLASSIFIER_PROVIDER == "linear":
+        return _classify_with_linear_model(text)
+    return _classify_locally(text, reason=_LOCAL_REASON)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        workers = config.CLASSIFIER_POOL_WORKERS
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_pool_worker,
+            initargs=(config.CLASSIFIER_PROVIDER, config.LINEAR_MODEL_PATH),
+        )
+        # Submitting one no-op per worker spawns every process up front so the
+        # model load in the initializer happens before real traffic arrives.
+        for _ in range(workers):
+            pool.submit(_pool_worker_ready)
+        _PROCESS_POOL = pool
+    return _PROCESS_POOL
+
+
+def _retire_process_pool() -> None:
+    """Detach the pool so the next long text starts fresh workers; queued chunks still finish."""
+
+    global _PROCESS_POOL
+    retired, _PROCESS_POOL = _PROCESS_POOL, None
+    if retired is not None:
+        retired.shutdown(wait=False, cancel_futures=False)
+
+
+def _shutdown_process_pool(*, wait: bool = True) -> None:
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=wait, cancel_futures=True)
+        _PROCESS_POOL = None
+
+
+async def drain(timeout: float) -> None:
+    """Give pending late remote cache writes *timeout* seconds, then drop the rest."""
+
+    pending = set(_LATE_REMOTE_WRITES)
+    if pending:
+        _, unfinished = await asyncio.wait(pending, timeout=timeout)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            metrics.increment("classifier.ensemble.late_writes_dropped", len(unfinished))
+
+
+async def aclose_process_pool() -> None:
+    """Stop the process pool; call once nothing will classify long texts any more."""
+
+    await asyncio.to_thread(_shutdown_process_pool)
+
+
+def _init_pool_worker(provider: str, model_path: Optional[str]) -> None:
+    config.CLASSIFIER_PROVIDER = provider  # type: ignore[misc]
+    config.LINEAR_MODEL_PATH = model_path  # type: ignore[misc]
+    if provider == "linear":
+        try:
+            _get_linear_model()
+        except ClassifierServiceError as exc:
+            logger.warning("Process pool worker could not load linear model: %s", exc)
+
+
+def _pool_worker_ready() -> bool:
+    return True
+
+
+def _score_chunk(chunk: str) -> Dict[str, Any]:
+    if config.CLASSIFIER_PROVIDER == "linear":
+        model = _get_linear_model()
+        return {"provider": "linear", "logit": _logit(model.score(chunk)), "model_version": model.version}
+    match = _count_local_hits(chunk)
+    return {
+        "provider": "local",
+        "sensational": match.sensational_hits,
+        "reputable": match.reputable_hits,
+        "weight": match.weight,
+    }
+
 
-    weight = 0.8 * sensational_hits - 0.6 * reputable_hits
-    score = _clamp(1 / (1 + math.exp(-weight)))
+def _aggregate_chunks(partials: Sequence[Dict[str, Any]], lengths: Sequence[int]) -> Dict[str, Any]:
+    if partials and partials[0]["provider"] == "linear":
+        total = max(1, sum(lengths))
+        logit = sum(partial["logit"] * length for partial, length in zip(partials, lengths)) / total
+        version = partials[0]["model_version"]
+        return {
+            "provider": "linear",
+            "score": _clamp(1 / (1 + math.exp(-logit))),
+            "explanation": f"Linear TF-IDF model {version} ({len(partials)} chunks)",
+            "model_version": version,
+        }
+
+    # Lexicon weights are additive, so chunked scoring matches inline exactly as
+    # long as no phrase straddles a chunk boundary.
+    sensational_hits = sum(partial["sensational"] for partial in partials)
+    reputable_hits = sum(partial["reputable"] for partial in partials)
+    score = _local_score(sum(partial["weight"] for partial in partials))
+    return _local_result(score, sensational_hits, reputable_hits, _LOCAL_REASON)
+
+
+def _split_into_chunks(text: str, chunk_chars: int) -> List[str]:
+    chunks: List[str] = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(length, start + chunk_chars)
+        if end < length:
+            boundary = text.rfind(" ", start, end)
+            if boundary > start:
+                end = boundary
+        chunks.append(text[start:end])
+        start = end
+    return chunks
 
+
+def _logit(probability: float) -> float:
+    clamped = min(max(probability, 1e-9), 1 - 1e-9)
+    return math.log(clamped / (1 - clamped))
+
+
+def _local_result(score: float, sensational_hits: int, reputable_hits: int, reason: Optional[str]) -> Dict[str, Any]:
     pieces = []
     if sensational_hits:
         pieces.append(f"Detected {sensational_hits} sensational terms")
@@ -209,17 +636,158 @@ def _classify_locally(text: str, *, reason: Optional[str] = None) -> Dict[str, A
 
     return {
         "provider": "local",
-        "score": score,
+        "score": _clamp(score),
         "explanation": explanation[:200],
     }
 
 
+def active_model_version() -> str:
+    """Return the version of the model currently serving the configured provider.
+
+    The version is folded into classifier cache keys, so scores computed by a
+    replaced model stop being served as soon as the new one is active. Entries
+    keyed by an old version are never read again and age out through the
+    normal TTL and LRU eviction.
+    """
+
+    provider = config.CLASSIFIER_PROVIDER
+    try:
+        if provider == "linear":
+            return _get_linear_model().version
+        if provider == "onnx":
+            return _get_onnx_model().version
+    except ClassifierServiceError:
+        return f"fallback-{_get_lexicon().version}"
+    if provider == "rapidapi" and config.CLASSIFIER_ENSEMBLE_DEADLINE_MS > 0:
+        return f"ensemble-{_get_lexicon().version}"
+    if provider == "rapidapi":
+        return "remote"
+    return _get_lexicon().version
+
+
+def preload() -> str:
+    """Load the models the configured provider needs and return the active version.
+
+    One throwaway text goes through the in-process scorer so lazily built state
+    is ready before the first request, and process pool workers are started
+    when long texts are scored there.
+    """
+
+    version = active_model_version()
+    classify_many(["warm-up"])
+    if config.CLASSIFIER_EXECUTION == "process":
+        _get_process_pool()
+    return version
+
+
+def reload_models() -> Dict[str, Optional[str]]:
+    """Load fresh copies of every configured local model and swap them in.
+
+    All files are loaded before anything is replaced, so a bad file leaves the
+    running models untouched. Each swap is a single reference assignment, which
+    in-flight requests observe atomically. Pool workers hold their own copies and
+    are retired so the next long text starts workers with the new model.
+    """
+
+    global _LEXICON, _LEXICON_SOURCE, _LINEAR_MODEL, _ONNX_MODEL
+
+    lexicon_source = config.LEXICON_PATH or str(lexicon.DEFAULT_LEXICON_PATH)
+    try:
+        new_lexicon = lexicon.Lexicon.load(lexicon_source)
+        new_linear = linear_model.LinearModel.load(config.LINEAR_MODEL_PATH) if config.LINEAR_MODEL_PATH else None
+        new_onnx = (
+            onnx_classifier.OnnxClassifier.load(
+                config.ONNX_MODEL_PATH,
+                config.ONNX_VOCAB_PATH,
+                threads=config.ONNX_INTRA_OP_THREADS,
+                max_length=config.ONNX_MAX_SEQUENCE_LENGTH,
+            )
+            if config.CLASSIFIER_PROVIDER == "onnx" and config.ONNX_MODEL_PATH and config.ONNX_VOCAB_PATH
+            else None
+        )
+    except (lexicon.LexiconError, linear_model.LinearModelError, onnx_classifier.OnnxClassifierError) as exc:
+        metrics.increment("classifier.reload.failed")
+        raise ClassifierServiceError(f"Model reload failed: {exc}") from exc
+
+    _LEXICON, _LEXICON_SOURCE = new_lexicon, lexicon_source
+    if new_linear is not None:
+        _LINEAR_MODEL = new_linear
+    if new_onnx is not None:
+        _ONNX_MODEL = new_onnx
+    _retire_process_pool()
+    _WATCHED_MTIMES.clear()
+    _WATCHED_MTIMES.update(_current_mtimes())
+    metrics.increment("classifier.reload.succeeded")
+
+    versions = {
+        "provider": config.CLASSIFIER_PROVIDER,
+        "active": active_model_version(),
+        "lexicon": new_lexicon.version,
+        "linear": new_linear.version if new_linear is not None else None,
+        "onnx": new_onnx.version if new_onnx is not None else None,
+    }
+    logger.info("Classifier models reloaded: %s", versions)
+    return versions
+
+
+_WATCHED_MTIMES: Dict[str, int] = {}
+
+
+def _current_mtimes() -> Dict[str, int]:
+    paths = [config.LEXICON_PATH or str(lexicon.DEFAULT_LEXICON_PATH)]
+    if config.CLASSIFIER_PROVIDER == "linear" and config.LINEAR_MODEL_PATH:
+        paths.append(config.LINEAR_MODEL_PATH)
+    if config.CLASSIFIER_PROVIDER == "onnx" and config.ONNX_MODEL_PATH:
+        paths.append(config.ONNX_MODEL_PATH)
+    mtimes: Dict[str, int] = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+async def watch_model_files() -> None:
+    """Hot-reload changed model and lexicon files every ``CLASSIFIER_MODEL_WATCH_SECONDS``.
+
+    Runs until cancelled. The stat calls and any reload happen on a worker
+    thread, so the event loop and cache-key construction never wait on disk.
+    """
+
+    while config.CLASSIFIER_MODEL_WATCH_SECONDS > 0:
+        await asyncio.to_thread(_reload_if_changed)
+        await asyncio.sleep(config.CLASSIFIER_MODEL_WATCH_SECONDS)
+
+
+def _reload_if_changed() -> None:
+    current = _current_mtimes()
+    if not _WATCHED_MTIMES:
+        _WATCHED_MTIMES.update(current)
+        return
+    if current == _WATCHED_MTIMES:
+        return
+    try:
+        reload_models()
+    except ClassifierServiceError as exc:
+        logger.warning("%s; keeping the current models.", exc)
+        _WATCHED_MTIMES.update(current)
+
+
 async def _clear_cache_for_tests() -> None:
     await _CLASSIFIER_CACHE.clear()
 
 
 __all__ = [
     "classify_text",
+    "classify_many",
+    "active_model_version",
+    "reload_models",
+    "watch_model_files",
+    "preload",
+    "preconnect",
+    "drain",
+    "aclose_process_pool",
     "MissingCredentialsError",
     "ClassifierServiceError",
     "_clear_cache_for_tests",
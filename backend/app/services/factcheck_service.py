@@ -15,7 +15,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app import config
-from app.utils import cache
+from app.utils import cache, http_client, retry
 
 logger = logging.getLogger(__name__)
 
@@ -34,17 +34,38 @@ def _make_cache_key(query: str, limit: int = 5, *, force_refresh: bool = False)
     return cache.make_key("factcheck", provider, str(per_page), normalised)
 
 
+def _http_client() -> httpx.AsyncClient:
+    return http_client.get_client("factcheck", timeout=config.FACTCHECK_HTTP_TIMEOUT_SECONDS)
+
+
+async def preconnect() -> bool:
+    """Open a pooled connection to the Fact Check API; ``False`` when it is not in use."""
+
+    if config.FACTCHECK_PROVIDER != "google" or not config.GOOGLE_FACTCHECK_KEY:
+        return False
+    return await http_client.preconnect(_http_client(), config.GOOGLE_FACTCHECK_ENDPOINT)
+
+
+def _result_ttl(result: Optional[List[Dict[str, Any]]]) -> int:
+    # A failed lookup is never written, so the next request asks the provider again.
+    return 0 if result is None else config.FACTCHECK_CACHE_TTL_SECONDS
+
+
 @cache.cached(
     ttl=config.FACTCHECK_CACHE_TTL_SECONDS,
     key_func=_make_cache_key,
     cache=_FACTCHECK_CACHE,
     namespace="factcheck.query",
+    ttl_for=_result_ttl,
 )
-async def query_claimreview(query: str, limit: int = 5, *, force_refresh: bool = False) -> List[Dict[str, Any]]:
+async def query_claimreview(query: str, limit: int = 5, *, force_refresh: bool = False) -> Optional[List[Dict[str, Any]]]:
     """Query ClaimReview entries for the supplied text.
 
     The Google Fact Check API is queried when configured. If the provider is disabled
     or credentials are missing, the function returns an empty list gracefully.
+    Transient failures (network errors, rate limits and 5xx responses once retries
+    are exhausted) return ``None`` rather than a list; that result is never
+    written to the cache, so an outage is not remembered as "no fact-checks".
     """
 
     trimmed = query.strip()
@@ -71,19 +92,18 @@ async def query_claimreview(query: str, limit: int = 5, *, force_refresh: bool =
     }
 
     try:
-        async with httpx.AsyncClient(timeout=config.FACTCHECK_HTTP_TIMEOUT_SECONDS) as client:
-            response = await client.get(config.GOOGLE_FACTCHECK_ENDPOINT, params=params)
-            if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
-                logger.warning("FactCheck API rate limit encountered; returning cached empty response.")
-                return []
-            response.raise_for_status()
-            data = response.json()
+        response = await retry.get_with_retry(_http_client(), config.GOOGLE_FACTCHECK_ENDPOINT, params=params)
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            logger.warning("FactCheck API rate limit encountered; skipping without caching.")
+            return None
+        response.raise_for_status()
+        data = response.json()
     except httpx.HTTPStatusError as exc:
         logger.warning("FactCheck API HTTP error: %s", exc)
-        return []
+        return None if exc.response.status_code >= 500 else []
     except httpx.HTTPError as exc:
         logger.warning("FactCheck API network error: %s", exc)
-        return []
+        return None
 
     claims = data.get("claims") or []
     results = _normalise_claims(claims, per_page)
@@ -176,5 +196,6 @@ async def _clear_cache_for_tests() -> None:
 
 __all__ = [
     "query_claimreview",
+    "preconnect",
     "_clear_cache_for_tests",
 ]
@@ -0,0 +1,192 @@
+"""Weighted term and phrase lexicon used by the local heuristic classifier. Terms
+are loaded from a JSON data file and compiled into a word-level trie. A text is
+tokenised once with a C-level regex and scanned left to right, taking the
+longest matching phrase at each position. The scan does at most
+``max_phrase_words`` lookups per token, so it is linear in the text length
+whatever the lexicon size. Punctuation and hyphens separate words, so
+"cover-up" and "cover up" both match the phrase ``cover up``. ``scan_many``
+gives the same results for a batch: each distinct token is looked up once,
+hits are summed per text with NumPy, and only positions where a multi-word
+phrase can start are walked in Python.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_LEXICON_PATH = Path(__file__).resolve().parent.parent / "data" / "lexicon.json"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_BOUNDARY = "\0"
+_BATCH_TOKEN_RE = re.compile(r"[a-z0-9]+|\0")
+_TERMINAL = ""
+
+
+class LexiconError(Exception):
+    """Raised when a lexicon data file is missing or malformed."""
+
+
+@dataclass(frozen=True, slots=True)
+class LexiconMatch:
+    sensational_hits: int
+    reputable_hits: int
+    weight: float
+
+
+class Lexicon:
+    """Compiled phrase matcher over sensational (+) and reputable (-) terms."""
+
+    def __init__(self, sensational: Dict[str, float], reputable: Dict[str, float], *, version: str) -> None:
+        self.version = version
+        self._root: Dict[str, Any] = {}
+        self.max_phrase_words = 0
+        self.size = 0
+        for terms, sign in ((sensational, 1.0), (reputable, -1.0)):
+            for term, weight in terms.items():
+                self._add(term, sign * abs(float(weight)))
+
+    @classmethod
+    def load(cls, path: str | Path = DEFAULT_LEXICON_PATH) -> "Lexicon":
+        try:
+            raw = Path(path).read_bytes()
+            data = json.loads(raw)
+        except (OSError, ValueError) as exc:
+            raise LexiconError(f"Unable to load lexicon {path}: {exc}") from exc
+        if not isinstance(data, dict):
+            raise LexiconError(f"Lexicon {path} must contain a JSON object")
+        digest = hashlib.sha256(raw).hexdigest()[:8]
+        version = f"{data.get('version', 'unversioned')}+{digest}"
+        return cls(data.get("sensational") or {}, data.get("reputable") or {}, version=version)
+
+    def _add(self, term: str, weight: float) -> None:
+        words = _TOKEN_RE.findall(term.lower())
+        if not words:
+            return
+        node = self._root
+        for word in words:
+            node = node.setdefault(word, {})
+        if _TERMINAL not in node:
+            self.size += 1
+        node[_TERMINAL] = weight
+        self.max_phrase_words = max(self.max_phrase_words, len(words))
+
+    def scan(self, text: str) -> LexiconMatch:
+        """Return hit counts and the summed weight of non-overlapping matches."""
+
+        tokens = _TOKEN_RE.findall(text.lower())
+        root = self._root
+        sensational_hits = 0
+        reputable_hits = 0
+        weight = 0.0
+        index = 0
+        count = len(tokens)
+        while index < count:
+            node = root.get(tokens[index])
+            if node is None:
+                index += 1
+                continue
+            best: Optional[Tuple[int, float]] = None
+            cursor = index
+            while node is not None:
+                cursor += 1
+                if _TERMINAL in node:
+                    best = (cursor, node[_TERMINAL])
+                if cursor >= count:
+                    break
+                node = node.get(tokens[cursor])
+            if best is None:
+                index += 1
+                continue
+            index, term_weight = best
+            weight += term_weight
+            if term_weight >= 0:
+                sensational_hits += 1
+            else:
+                reputable_hits += 1
+        return LexiconMatch(sensational_hits, reputable_hits, weight)
+
+    def scan_many(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorised :meth:`scan` returning ``(sensational_hits, reputable_hits, weight)`` arrays."""
+
+        # One regex pass over the whole batch; a NUL token marks each text boundary.
+        joined = _BOUNDARY.join(text.replace(_BOUNDARY, " ") for text in texts).lower()
+        flat = _BATCH_TOKEN_RE.findall(joined)
+        vocabulary: Dict[str, int] = {_BOUNDARY: 0}
+        token_ids = np.fromiter(
+            (vocabulary.setdefault(token, len(vocabulary)) for token in flat), dtype=np.intp, count=len(flat)
+        )
+        documents = np.cumsum(token_ids == 0)
+
+        # Per distinct token: its one-word term weight, and whether a longer phrase starts with it.
+        root = self._root
+        is_term = np.zeros(len(vocabulary), dtype=bool)
+        term_weight = np.zeros(len(vocabulary))
+        starts_phrase = np.zeros(len(vocabulary), dtype=bool)
+        for token, token_id in vocabulary.items():
+            node = root.get(token)
+            if node is None:
+                continue
+            is_term[token_id] = _TERMINAL in node
+            term_weight[token_id] = node.get(_TERMINAL, 0.0)
+            starts_phrase[token_id] = len(node) > is_term[token_id]
+        matched = is_term[token_ids]
+        weights = term_weight[token_ids]
+
+        # Greedy longest match, as in scan(), from candidate phrase starts only;
+        # a phrase overrides the one-word matches of the tokens it covers. No
+        # phrase contains the boundary token, so walks stop at the end of a text.
+        count = len(flat)
+        resume_at = 0
+        for start in np.flatnonzero(starts_phrase[token_ids]).tolist():
+            if start < resume_at:
+                continue
+            node = root[flat[start]]
+            best: Optional[Tuple[int, float]] = None
+            cursor = start
+            while node is not None:
+                cursor += 1
+                if _TERMINAL in node:
+                    best = (cursor, node[_TERMINAL])
+                if cursor >= count:
+                    break
+                node = node.get(flat[cursor])
+            if best is None or best[0] == start + 1:
+                continue
+            resume_at, phrase_weight = best
+            matched[start:resume_at] = False
+            weights[start:resume_at] = 0.0
+            matched[start] = True
+            weights[start] = phrase_weight
+
+        sensational = np.bincount(documents, weights=matched & (weights >= 0), minlength=len(texts))
+        reputable = np.bincount(documents, weights=matched & (weights < 0), minlength=len(texts))
+        totals = np.bincount(documents, weights=weights, minlength=len(texts))
+        return sensational.astype(np.int64), reputable.astype(np.int64), totals
+
+    def terms(self) -> List[Tuple[str, float]]:
+        collected: List[Tuple[str, float]] = []
+
+        def _walk(node: Dict[str, Any], prefix: List[str]) -> None:
+            for key, child in node.items():
+                if key == _TERMINAL:
+                    collected.append((" ".join(prefix), child))
+                else:
+                    _walk(child, prefix + [key])
+
+        _walk(self._root, [])
+        return collected
+
+
+__all__ = [
+    "DEFAULT_LEXICON_PATH",
+    "Lexicon",
+    "LexiconError",
+    "LexiconMatch",
+]
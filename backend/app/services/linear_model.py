@@ -0,0 +1,365 @@
+"""In-process linear fake-news classifier: hashed word n-gram TF-IDF features fed
+into a logistic-regression model. Weights are trained offline with the CLI in
+this module and stored in a compact binary file that is memory-mapped at load
+time, so inference needs no network round trip and no model deserialisation.
+
+Train a model from a labelled CSV (``text,label`` columns) or JSONL file::
+
+    python -m app.services.linear_model train data.jsonl model.bin --version 2026-10
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import struct
+import sys
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_MAGIC = b"FNLM"
+_FORMAT_VERSION = 1
+_HEADER_STRUCT = struct.Struct("<4sII")
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)?")
+# 1 means fake. true/false (string or JSON boolean) are rejected: datasets use
+# them both as "is fake" flags and as truth ratings, so either reading flips some.
+_FAKE_LABELS = {"1", "fake", "unreliable", "satire"}
+_REAL_LABELS = {"0", "real", "reliable"}
+
+DEFAULT_FEATURE_BITS = 18
+DEFAULT_NGRAM_MAX = 2
+
+
+class LinearModelError(Exception):
+    """Raised when a model file cannot be trained, written or loaded."""
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def hashed_features(text: str, n_features: int, ngram_max: int = DEFAULT_NGRAM_MAX) -> Dict[int, int]:
+    """Return bucket -> raw count for the word n-grams of *text*."""
+
+    tokens = tokenize(text)
+    mask = n_features - 1
+    counts: Dict[int, int] = {}
+    for size in range(1, ngram_max + 1):
+        for start in range(len(tokens) - size + 1):
+            gram = " ".join(tokens[start : start + size]) if size > 1 else tokens[start]
+            bucket = zlib.crc32(gram.encode("utf-8")) & mask
+            counts[bucket] = counts.get(bucket, 0) + 1
+    return counts
+
+
+@dataclass(frozen=True)
+class LinearModel:
+    """Memory-mapped hashed TF-IDF + logistic-regression weights."""
+
+    version: str
+    n_features: int
+    ngram_max: int
+    bias: float
+    idf: np.ndarray
+    coef: np.ndarray
+    path: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LinearModel":
+        model_path = Path(path)
+        try:
+            with model_path.open("rb") as handle:
+                magic, format_version, header_len = _HEADER_STRUCT.unpack(handle.read(_HEADER_STRUCT.size))
+                header = json.loads(handle.read(header_len).decode("utf-8"))
+        except (OSError, struct.error, ValueError) as exc:
+            raise LinearModelError(f"Unable to read model header from {model_path}: {exc}") from exc
+        if magic != _MAGIC or format_version != _FORMAT_VERSION:
+            raise LinearModelError(f"{model_path} is not a linear model file (format {format_version}).")
+
+        try:
+            n_features = int(header["n_features"])
+            version = str(header["version"])
+            ngram_max = int(header.get("ngram_max", DEFAULT_NGRAM_MAX))
+            bias = float(header["bias"])
+        except (KeyError, TypeError, ValueError, AttributeError) as exc:
+            raise LinearModelError(f"{model_path} has an invalid header: {exc!r}") from exc
+        if n_features <= 0 or n_features & (n_features - 1):
+            raise LinearModelError(f"{model_path} declares {n_features} features; expected a power of two.")
+
+        offset = _data_offset(header_len)
+        expected_size = offset + 2 * 4 * n_features
+        try:
+            actual_size = model_path.stat().st_size
+            if actual_size != expected_size:
+                raise LinearModelError(
+                    f"{model_path} is {actual_size} bytes; expected {expected_size} for {n_features} features."
+                )
+            weights = np.memmap(model_path, dtype="<f4", mode="r", offset=offset, shape=(2, n_features))
+        except (OSError, ValueError) as exc:
+            raise LinearModelError(f"Unable to map weights from {model_path}: {exc}") from exc
+        return cls(
+            version=version,
+            n_features=n_features,
+            ngram_max=ngram_max,
+            bias=bias,
+            idf=weights[0],
+            coef=weights[1],
+            path=str(model_path),
+        )
+
+    def score(self, text: str) -> float:
+        """Return the probability that *text* is fake."""
+
+        counts = hashed_features(text, self.n_features, self.ngram_max)
+        if not counts:
+            return _sigmoid(self.bias)
+        buckets = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float64, count=len(counts)))
+        weighted = tf * self.idf[buckets]
+        norm = float(np.sqrt(np.dot(weighted, weighted)))
+        if norm == 0.0:
+            return _sigmoid(self.bias)
+        logit = float(np.dot(weighted, self.coef[buckets])) / norm + self.bias
+        return _sigmoid(logit)
+
+    def score_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Vectorised :meth:`score` over *texts*, returning a float64 array."""
+
+        row_idx, col_idx, counts = sparse_counts(texts, self.n_features, self.ngram_max)
+        n_docs = len(texts)
+        tf = 1.0 + np.log(counts)
+        weighted = tf * self.idf[col_idx]
+        norms = np.sqrt(np.bincount(row_idx, weights=weighted * weighted, minlength=n_docs))
+        dots = np.bincount(row_idx, weights=weighted * self.coef[col_idx], minlength=n_docs)
+        logits = np.divide(dots, norms, out=np.zeros(n_docs), where=norms > 0) + self.bias
+        return _sigmoid_array(logits)
+
+
+def save(
+    path: str | Path,
+    *,
+    version: str,
+    idf: np.ndarray,
+    coef: np.ndarray,
+    bias: float,
+    ngram_max: int = DEFAULT_NGRAM_MAX,
+    extra: Optional[Dict[str, Any]] = None,
+) -> None:
+    n_features = int(idf.shape[0])
+    if coef.shape != idf.shape:
+        raise LinearModelError("idf and coef must have the same shape")
+    header = {
+        "version": version,
+        "n_features": n_features,
+        "ngram_max": ngram_max,
+        "bias": float(bias),
+        **(extra or {}),
+    }
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    padding = _data_offset(len(header_bytes)) - _HEADER_STRUCT.size - len(header_bytes)
+    # Write next to the destination and rename into place: processes that have the
+    # previous file memory-mapped keep reading the old inode during a hot reload.
+    destination = Path(path)
+    staging = destination.with_name(f".{destination.name}.tmp")
+    with staging.open("wb") as handle:
+        handle.write(_HEADER_STRUCT.pack(_MAGIC, _FORMAT_VERSION, len(header_bytes)))
+        handle.write(header_bytes)
+        handle.write(b"\0" * padding)
+        handle.write(np.asarray(idf, dtype="<f4").tobytes())
+        handle.write(np.asarray(coef, dtype="<f4").tobytes())
+    os.replace(staging, destination)
+
+
+def sparse_counts(
+    texts: Sequence[str], n_features: int, ngram_max: int = DEFAULT_NGRAM_MAX
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the COO ``(rows, buckets, counts)`` term-count matrix for *texts*."""
+
+    rows: List[int] = []
+    cols: List[int] = []
+    counts: List[int] = []
+    for row, text in enumerate(texts):
+        features = hashed_features(text, n_features, ngram_max)
+        rows.extend([row] * len(features))
+        cols.extend(features.keys())
+        counts.extend(features.values())
+    return (
+        np.asarray(rows, dtype=np.int64),
+        np.asarray(cols, dtype=np.int64),
+        np.asarray(counts, dtype=np.float64),
+    )
+
+
+def train(
+    texts: Sequence[str],
+    labels: Sequence[int],
+    *,
+    feature_bits: int = DEFAULT_FEATURE_BITS,
+    ngram_max: int = DEFAULT_NGRAM_MAX,
+    epochs: int = 200,
+    learning_rate: float = 0.5,
+    l2: float = 1e-4,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Fit TF-IDF weights and logistic-regression coefficients.
+
+    Returns ``(idf, coef, bias)``. Training uses full-batch gradient descent on
+    a sparse COO representation, which is plenty for the corpus sizes we label.
+    """
+
+    if len(texts) != len(labels) or not texts:
+        raise LinearModelError("Training requires the same non-zero number of texts and labels.")
+
+    n_features = 1 << feature_bits
+    row_idx, col_idx, counts = sparse_counts(texts, n_features, ngram_max)
+    n_docs = len(texts)
+    df = np.bincount(col_idx, minlength=n_features)
+    idf = (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+
+    values = (1.0 + np.log(counts)) * idf[col_idx]
+    norms = np.sqrt(np.bincount(row_idx, weights=values * values, minlength=n_docs))
+    values = values / np.maximum(norms, 1e-12)[row_idx]
+
+    y = np.asarray(labels, dtype=np.float64)
+    coef = np.zeros(n_features, dtype=np.float64)
+    bias = 0.0
+    for _ in range(max(1, epochs)):
+        logits = np.bincount(row_idx, weights=values * coef[col_idx], minlength=n_docs) + bias
+        error = 1.0 / (1.0 + np.exp(-logits)) - y
+        gradient = np.bincount(col_idx, weights=values * error[row_idx], minlength=n_features) / n_docs
+        coef -= learning_rate * (gradient + l2 * coef)
+        bias -= learning_rate * float(error.mean())
+
+    return idf, coef.astype(np.float32), bias
+
+
+def read_labelled(path: str | Path, *, text_field: str = "text", label_field: str = "label") -> Iterator[Tuple[str, int]]:
+    """Yield ``(text, label)`` pairs from a CSV or JSONL file, skipping bad rows.
+
+    Rows that are not JSON objects, lack text or carry an unknown or ambiguous
+    label are skipped; the number skipped is reported on stderr.
+    """
+
+    source = Path(path)
+    skipped = 0
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        if source.suffix.lower() in {".jsonl", ".ndjson", ".json"}:
+            records: Iterable[Any] = (_parse_json_line(line) for line in handle if line.strip())
+        else:
+            records = csv.DictReader(handle)
+        for record in records:
+            if not isinstance(record, dict):
+                skipped += 1
+                continue
+            text = record.get(text_field)
+            label = _parse_label(record.get(label_field))
+            if isinstance(text, str) and text.strip() and label is not None:
+                yield text, label
+            else:
+                skipped += 1
+    if skipped:
+        print(f"Skipped {skipped} unusable rows in {source}", file=sys.stderr)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.services.linear_model", description=__doc__.split("\n\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    train_cmd = commands.add_parser("train", help="Train a model from a labelled CSV/JSONL file.")
+    train_cmd.add_argument("input", help="Labelled CSV (text,label) or JSONL file.")
+    train_cmd.add_argument("output", help="Destination model file.")
+    train_cmd.add_argument("--version", required=True, help="Model version reported in classifier results.")
+    train_cmd.add_argument("--feature-bits", type=int, default=DEFAULT_FEATURE_BITS)
+    train_cmd.add_argument("--ngram-max", type=int, default=DEFAULT_NGRAM_MAX)
+    train_cmd.add_argument("--epochs", type=int, default=200)
+    train_cmd.add_argument("--learning-rate", type=float, default=0.5)
+    train_cmd.add_argument("--l2", type=float, default=1e-4)
+    train_cmd.add_argument("--text-field", default="text")
+    train_cmd.add_argument("--label-field", default="label")
+    args = parser.parse_args(argv)
+
+    pairs = list(read_labelled(args.input, text_field=args.text_field, label_field=args.label_field))
+    if not pairs:
+        print(f"No labelled rows found in {args.input}", file=sys.stderr)
+        return 1
+    texts, labels = zip(*pairs)
+    idf, coef, bias = train(
+        texts,
+        labels,
+        feature_bits=args.feature_bits,
+        ngram_max=args.ngram_max,
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        l2=args.l2,
+    )
+    save(
+        args.output,
+        version=args.version,
+        idf=idf,
+        coef=coef,
+        bias=bias,
+        ngram_max=args.ngram_max,
+        extra={"training_rows": len(texts)},
+    )
+    print(f"Wrote model {args.version} trained on {len(texts)} rows to {args.output}")
+    return 0
+
+
+def _parse_json_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        return None
+
+
+def _parse_label(raw: Any) -> Optional[int]:
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, (int, float)):
+        return 1 if raw >= 0.5 else 0
+    if isinstance(raw, str):
+        lowered = raw.strip().lower()
+        if lowered in _FAKE_LABELS:
+            return 1
+        if lowered in _REAL_LABELS:
+            return 0
+    return None
+
+
+def _data_offset(header_len: int) -> int:
+    raw = _HEADER_STRUCT.size + header_len
+    return (raw + 7) // 8 * 8
+
+
+def _sigmoid_array(values: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.tanh(0.5 * values))
+
+
+def _sigmoid(value: float) -> float:
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exp_value = math.exp(value)
+    return exp_value / (1.0 + exp_value)
+
+
+__all__ = [
+    "LinearModel",
+    "LinearModelError",
+    "hashed_features",
+    "main",
+    "read_labelled",
+    "save",
+    "sparse_counts",
+    "tokenize",
+    "train",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,7 @@ from typing import Any, Dict, Iterable, List, Optional
 import httpx
 
 from app import config
-from app.utils import cache
+from app.utils import cache, http_client, retry
 
 logger = logging.getLogger(__name__)
 
@@ -59,17 +59,48 @@ def _provider_settings(provider: str) -> _ProviderSettings:
     return _ProviderSettings(name=provider, api_key=None)
 
 
+def _provider_endpoint(provider: str) -> Optional[str]:
+    endpoints = {
+        "newsapi": config.NEWSAPI_ENDPOINT,
+        "gnews": config.GNEWS_ENDPOINT,
+        "newsdata": config.NEWSDATA_ENDPOINT,
+    }
+    return endpoints.get(provider)
+
+
+def _http_client() -> httpx.AsyncClient:
+    return http_client.get_client("news", timeout=config.NEWS_HTTP_TIMEOUT_SECONDS)
+
+
+async def preconnect() -> bool:
+    """Open a pooled connection to the configured provider; ``False`` when it is not in use."""
+
+    settings = _provider_settings(config.NEWS_PROVIDER)
+    endpoint = _provider_endpoint(settings.name)
+    if not settings.api_key or not endpoint:
+        return False
+    return await http_client.preconnect(_http_client(), endpoint)
+
+
+def _result_ttl(result: Optional[List[Dict[str, Any]]]) -> int:
+    # A failed lookup is never written, so the next request asks the provider again.
+    return 0 if result is None else config.NEWS_CACHE_TTL_SECONDS
+
+
 @cache.cached(
     ttl=config.NEWS_CACHE_TTL_SECONDS,
     key_func=_make_cache_key,
     cache=_NEWS_CACHE,
     namespace="news.search",
+    ttl_for=_result_ttl,
 )
-async def search_news(query: str, limit: int = 3, *, force_refresh: bool = False) -> List[Dict[str, Any]]:
+async def search_news(query: str, limit: int = 3, *, force_refresh: bool = False) -> Optional[List[Dict[str, Any]]]:
     """Search for relevant articles using the configured provider.
 
-    Missing credentials raise ``MissingCredentialsError``. Network errors or upstream
-    failures are logged and result in an empty list.
+    Missing credentials raise ``MissingCredentialsError``. Transient failures
+    (network errors, rate limits and 5xx responses once retries are exhausted)
+    and unexpected errors are logged and return ``None``, which is not cached;
+    other 4xx responses return an empty list.
     """
 
     trimmed = query.strip()
@@ -89,18 +120,20 @@ async def search_news(query: str, limit: int = 3, *, force_refresh: bool = False
         logger.warning("Unsupported news provider '%s'.", settings.name)
         return []
 
-    articles: List[Dict[str, Any]] = []
     try:
-        raw_articles = await adapter(trimmed, per_page, settings.api_key)
-        articles = _filter_articles(raw_articles)
+        articles = _filter_articles(await adapter(trimmed, per_page, settings.api_key))
     except MissingCredentialsError:
         raise
+    except httpx.HTTPStatusError as exc:
+        logger.warning("HTTP error during news search: %s", exc)
+        status = exc.response.status_code
+        return None if status >= 500 or status == httpx.codes.TOO_MANY_REQUESTS else []
     except httpx.HTTPError as exc:
         logger.warning("HTTP error during news search: %s", exc)
-        articles = []
+        return None
     except Exception as exc:  # pragma: no cover - safety net
         logger.exception("Unexpected error during news search", exc_info=exc)
-        articles = []
+        return None
     return articles
 
 
@@ -112,9 +145,8 @@ async def _search_news_newsapi(query: str, limit: int, api_key: str) -> List[Dic
         "sortBy": "relevancy",
     }
     headers = {"X-Api-Key": api_key}
-    async with httpx.AsyncClient(timeout=config.NEWS_HTTP_TIMEOUT_SECONDS) as client:
-        response = await client.get(config.NEWSAPI_ENDPOINT, params=params, headers=headers)
-        response.raise_for_status()
+    response = await retry.get_with_retry(_http_client(), config.NEWSAPI_ENDPOINT, params=params, headers=headers)
+    response.raise_for_status()
     data = response.json()
     articles = data.get("articles", [])
     return [_normalise_article(
@@ -133,9 +165,8 @@ async def _search_news_gnews(query: str, limit: int, api_key: str) -> List[Dict[
         "max": limit,
         "token": api_key,
     }
-    async with httpx.AsyncClient(timeout=config.NEWS_HTTP_TIMEOUT_SECONDS) as client:
-        response = await client.get(config.GNEWS_ENDPOINT, params=params)
-        response.raise_for_status()
+    response = await retry.get_with_retry(_http_client(), config.GNEWS_ENDPOINT, params=params)
+    response.raise_for_status()
     data = response.json()
     articles = data.get("articles", [])
     return [_normalise_article(
@@ -153,9 +184,8 @@ async def _search_news_newsdata(query: str, limit: int, api_key: str) -> List[Di
         "language": "en",
         "apikey": api_key,
     }
-    async with httpx.AsyncClient(timeout=config.NEWS_HTTP_TIMEOUT_SECONDS) as client:
-        response = await client.get(config.NEWSDATA_ENDPOINT, params=params)
-        response.raise_for_status()
+    response = await retry.get_with_retry(_http_client(), config.NEWSDATA_ENDPOINT, params=params)
+    response.raise_for_status()
     data = response.json()
     articles = data.get("results", [])
     return [_normalise_article(
@@ -226,6 +256,7 @@ async def _clear_cache_for_tests() -> None:
 
 __all__ = [
     "search_news",
+    "preconnect",
     "NewsServiceError",
     "MissingCredentialsError",
     "_clear_cache_for_tests",
@@ -0,0 +1,213 @@
+"""CPU inference for an int8-quantized ONNX text-classification model. The model is
+run with onnxruntime (an optional dependency) using a BERT-style ``vocab.txt``
+WordPiece tokenizer. Inputs are padded to bucketed sequence lengths so batches
+of similar-length texts share one session run without padding everything to the
+maximum length.
+
+Quantize an exported fp32 model with::
+
+    python -m app.services.onnx_classifier quantize model.onnx model.int8.onnx
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_BUCKETS = (16, 32, 64, 128, 256, 512)
+_WORD_RE = re.compile(r"\w+|[^\w\s]")
+
+
+class OnnxClassifierError(Exception):
+    """Raised when the ONNX runtime, model or vocabulary cannot be used."""
+
+
+class WordPieceTokenizer:
+    """Greedy longest-match WordPiece tokenizer compatible with BERT vocab files."""
+
+    def __init__(self, vocab: Dict[str, int]) -> None:
+        self._vocab = vocab
+        self._unk_id = vocab.get("[UNK]", 0)
+        self._cls_id = vocab.get("[CLS]")
+        self._sep_id = vocab.get("[SEP]")
+        self.pad_id = vocab.get("[PAD]", 0)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "WordPieceTokenizer":
+        try:
+            lines = Path(path).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise OnnxClassifierError(f"Unable to read vocabulary {path}: {exc}") from exc
+        return cls({token: index for index, token in enumerate(line.strip() for line in lines) if token})
+
+    def encode(self, text: str, max_length: int) -> List[int]:
+        special = int(self._cls_id is not None) + int(self._sep_id is not None)
+        budget = max(1, max_length - special)
+        ids: List[int] = []
+        for word in _WORD_RE.findall(text.lower()):
+            ids.extend(self._word_pieces(word))
+            if len(ids) >= budget:
+                ids = ids[:budget]
+                break
+        if self._cls_id is not None:
+            ids.insert(0, self._cls_id)
+        if self._sep_id is not None:
+            ids.append(self._sep_id)
+        return ids
+
+    def _word_pieces(self, word: str) -> List[int]:
+        if word in self._vocab:
+            return [self._vocab[word]]
+        pieces: List[int] = []
+        start = 0
+        while start < len(word):
+            end = len(word)
+            match: Optional[int] = None
+            while end > start:
+                candidate = word[start:end] if start == 0 else f"##{word[start:end]}"
+                match = self._vocab.get(candidate)
+                if match is not None:
+                    break
+                end -= 1
+            if match is None:
+                return [self._unk_id]
+            pieces.append(match)
+            start = end
+        return pieces
+
+
+@dataclass(frozen=True)
+class OnnxClassifier:
+    """Loaded inference session plus the metadata needed to feed it."""
+
+    session: Any
+    tokenizer: WordPieceTokenizer
+    input_names: tuple[str, ...]
+    version: str
+    max_length: int
+    fake_index: int
+    model_path: str
+
+    @classmethod
+    def load(
+        cls,
+        model_path: str | Path,
+        vocab_path: str | Path,
+        *,
+        threads: int = 1,
+        max_length: int = 256,
+        fake_index: int = 1,
+    ) -> "OnnxClassifier":
+        ort = _import_onnxruntime()
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = max(1, threads)
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        try:
+            session = ort.InferenceSession(str(model_path), sess_options=options, providers=["CPUExecutionProvider"])
+        except Exception as exc:  # onnxruntime raises its own exception hierarchy
+            raise OnnxClassifierError(f"Unable to load ONNX model {model_path}: {exc}") from exc
+
+        return cls(
+            session=session,
+            tokenizer=WordPieceTokenizer.from_file(vocab_path),
+            input_names=tuple(node.name for node in session.get_inputs()),
+            version=_file_version(model_path),
+            max_length=max(_BUCKETS[0], min(max_length, _BUCKETS[-1])),
+            fake_index=fake_index,
+            model_path=str(model_path),
+        )
+
+    def predict(self, texts: Sequence[str]) -> List[float]:
+        """Return the fake probability for each text, batching by length bucket."""
+
+        encoded = [self.tokenizer.encode(text, self.max_length) for text in texts]
+        scores: List[float] = [0.5] * len(texts)
+        groups: Dict[int, List[int]] = {}
+        for index, ids in enumerate(encoded):
+            groups.setdefault(_bucket_for(len(ids), self.max_length), []).append(index)
+
+        for length, indices in groups.items():
+            input_ids = np.full((len(indices), length), self.tokenizer.pad_id, dtype=np.int64)
+            attention = np.zeros((len(indices), length), dtype=np.int64)
+            for row, index in enumerate(indices):
+                ids = encoded[index]
+                input_ids[row, : len(ids)] = ids
+                attention[row, : len(ids)] = 1
+            feeds = {"input_ids": input_ids, "attention_mask": attention, "token_type_ids": np.zeros_like(input_ids)}
+            outputs = self.session.run(None, {name: feeds[name] for name in self.input_names})
+            for row, probability in enumerate(self._probabilities(np.asarray(outputs[0], dtype=np.float64))):
+                scores[indices[row]] = float(probability)
+        return scores
+
+    def _probabilities(self, logits: np.ndarray) -> np.ndarray:
+        if logits.ndim == 1 or logits.shape[-1] == 1:
+            return 1.0 / (1.0 + np.exp(-logits.reshape(-1)))
+        shifted = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(shifted)
+        return (exp / exp.sum(axis=-1, keepdims=True))[:, self.fake_index]
+
+
+def quantize(source: str | Path, destination: str | Path) -> None:
+    """Write an int8 dynamically-quantized copy of *source* to *destination*."""
+
+    _import_onnxruntime()
+    quantization = importlib.import_module("onnxruntime.quantization")
+    quantization.quantize_dynamic(str(source), str(destination), weight_type=quantization.QuantType.QInt8)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.services.onnx_classifier")
+    commands = parser.add_subparsers(dest="command", required=True)
+    quantize_cmd = commands.add_parser("quantize", help="Dynamically quantize an fp32 model to int8.")
+    quantize_cmd.add_argument("source")
+    quantize_cmd.add_argument("destination")
+    args = parser.parse_args(argv)
+
+    quantize(args.source, args.destination)
+    print(f"Wrote int8 model to {args.destination}")
+    return 0
+
+
+def _bucket_for(length: int, max_length: int) -> int:
+    for bucket in _BUCKETS:
+        if length <= bucket or bucket >= max_length:
+            return bucket
+    return _BUCKETS[-1]
+
+
+def _file_version(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return f"onnx-{digest.hexdigest()[:12]}"
+
+
+def _import_onnxruntime() -> Any:
+    try:
+        return importlib.import_module("onnxruntime")
+    except ModuleNotFoundError as exc:
+        raise OnnxClassifierError("onnxruntime is not installed; install the 'onnx' extra.") from exc
+
+
+__all__ = [
+    "OnnxClassifier",
+    "OnnxClassifierError",
+    "WordPieceTokenizer",
+    "main",
+    "quantize",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
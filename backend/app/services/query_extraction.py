@@ -0,0 +1,150 @@
+"""Turns a submitted article into short upstream search queries. Sentences are
+scored for check-worthiness (numbers, proper nouns, attribution cues and
+frequent content words, normalised by length) and the best few become
+fact-check queries; the most frequent content words become the news query.
+Scoring is done with NumPy ``bincount`` over one flat token array, so a long
+article costs a handful of vector operations rather than a loop per sentence.
+Texts shorter than ``min_chars`` are used verbatim.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.utils import text_context
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z'-]*|\d[\d,.]*%?")
+_MAX_SENTENCES = 400
+_MAX_CLAIM_WORDS = 24
+_MIN_SENTENCE_WORDS = 4
+_MEMO_SIZE = 512
+
+_STOPWORDS = frozenset(
+    """
+    a about after again against all also am an and any are as at be because been before being between both but by
+    can could did do does doing down during each even ever few for from further had has have having he her here
+    hers him his how i if in into is it its itself just like made make many may me more most much must my new no
+    nor not now of off on once one only or other our ours out over own per said same says she should since so
+    some such than that the their theirs them then there these they this those through to too under until up upon
+    us very was we were what when where which while who whom why will with would year years you your
+    """.split()
+)
+_CLAIM_CUES = frozenset(
+    """
+    according announced claim claimed claims confirmed data evidence found percent poll report reported reports
+    research revealed shows study survey statistics
+    """.split()
+)
+
+
+@dataclass(frozen=True, slots=True)
+class QueryExtraction:
+    claims: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+
+    @property
+    def news_query(self) -> str:
+        return " ".join(self.keywords) if self.keywords else (self.claims[0] if self.claims else "")
+
+
+def extract(
+    text: text_context.TextLike,
+    *,
+    max_claims: int = 3,
+    max_keywords: int = 4,
+    min_chars: int = 280,
+) -> QueryExtraction:
+    """Return up to *max_claims* claim queries and *max_keywords* keywords."""
+
+    context = text_context.of(text)
+    key = (context.digest, max(1, max_claims), max(1, max_keywords), min_chars)
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None:
+            _memo.move_to_end(key)
+            return cached
+    extraction = _extract(context.normalised, *key[1:])
+    with _memo_lock:
+        _memo[key] = extraction
+        if len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+    return extraction
+
+
+# Keyed by the digest rather than the text so the memo never pins whole articles.
+_memo: OrderedDict[Tuple[str, int, int, int], QueryExtraction] = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _extract(text: str, max_claims: int, max_keywords: int, min_chars: int) -> QueryExtraction:
+    if not text:
+        return QueryExtraction((), ())
+    if len(text) <= min_chars:
+        return QueryExtraction((text,), ())
+
+    sentences: List[List[str]] = []
+    for raw in _SENTENCE_RE.split(text)[:_MAX_SENTENCES]:
+        words = raw.split()
+        if len(words) >= _MIN_SENTENCE_WORDS:
+            sentences.append(words)
+    if not sentences:
+        return QueryExtraction((" ".join(text.split()[:_MAX_CLAIM_WORDS]),), ())
+
+    vocab: Dict[str, int] = {}
+    token_ids: List[int] = []
+    sentence_ids: List[int] = []
+    bonuses: List[float] = []
+    for index, words in enumerate(sentences):
+        for position, token in enumerate(_TOKEN_RE.findall(" ".join(words))):
+            lowered = token.lower()
+            if lowered in _STOPWORDS or len(lowered) < 2:
+                continue
+            bonus = 0.0
+            if token[0].isdigit():
+                bonus += 1.0
+            elif position and token[0].isupper():
+                bonus += 0.75
+            if lowered in _CLAIM_CUES:
+                bonus += 1.0
+            token_ids.append(vocab.setdefault(lowered, len(vocab)))
+            sentence_ids.append(index)
+            bonuses.append(bonus)
+    if not token_ids:
+        return QueryExtraction((" ".join(sentences[0][:_MAX_CLAIM_WORDS]),), ())
+
+    ids = np.asarray(token_ids, dtype=np.int64)
+    owners = np.asarray(sentence_ids, dtype=np.int64)
+    extra = np.asarray(bonuses, dtype=np.float64)
+
+    frequency = np.bincount(ids, minlength=len(vocab)).astype(np.float64)
+    token_scores = np.log1p(frequency)[ids] + extra
+    lengths = np.asarray([len(words) for words in sentences], dtype=np.float64)
+    sentence_scores = np.bincount(owners, weights=token_scores, minlength=len(sentences)) / np.sqrt(lengths)
+
+    # Stable sorts keep earlier sentences/words first on ties.
+    claims: List[str] = []
+    for index in np.argsort(-sentence_scores, kind="stable"):
+        claim = " ".join(sentences[index][:_MAX_CLAIM_WORDS]).rstrip(".!?")
+        if claim not in claims:
+            claims.append(claim)
+            if len(claims) == max_claims:
+                break
+
+    keyword_scores = np.bincount(ids, weights=1.0 + extra, minlength=len(vocab))
+    keyword_scores[frequency < 2] *= 0.5
+    terms = list(vocab)
+    keywords = tuple(terms[index] for index in np.argsort(-keyword_scores, kind="stable")[:max_keywords])
+    return QueryExtraction(tuple(claims), keywords)
+
+
+__all__ = [
+    "QueryExtraction",
+    "extract",
+]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.utils import metrics
+from app.utils.admission import AdmissionController, AdmissionControlMiddleware
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> None:
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_controller_queues_then_sheds_when_saturated() -> None:
+    controller = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=1.0)
+    assert await controller.acquire()
+
+    waiting = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 1
+
+    # Queue is full: the next caller is rejected without waiting.
+    assert await controller.acquire() is False
+
+    controller.release()
+    assert await waiting is True
+    assert controller.in_flight == 1
+    assert controller.queue_depth == 0
+
+    controller.release()
+    assert controller.in_flight == 0
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["admission.shed"] == 1
+    assert snapshot["gauges"]["admission.queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_controller_sheds_waiter_after_timeout() -> None:
+    controller = AdmissionController(max_in_flight=1, max_queue=4, queue_timeout=0.01)
+    assert await controller.acquire()
+    assert await controller.acquire() is False
+    assert controller.queue_depth == 0
+
+    controller.release()
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_middleware_returns_503_and_exempts_health() -> None:
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.post("/check-news")
+    async def slow() -> dict[str, str]:
+        await release.wait()
+        return {"status": "done"}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=0.0)
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/check-news"))
+        while controller.in_flight == 0:
+            await asyncio.sleep(0.001)
+
+        shed = await client.post("/check-news")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"]
+
+        health_response = await client.get("/health")
+        assert health_response.status_code == 200
+
+        release.set()
+        assert (await first).status_code == 200
+
+    assert controller.in_flight == 0
+    assert metrics.snapshot()["counters"]["admission.shed"] == 1
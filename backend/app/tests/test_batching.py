@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, List
+
+import pytest
+import pytest_asyncio
+import respx
+from httpx import Request, Response
+
+from app import config
+from app.services import classifier_service
+from app.utils import batching, metrics
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_state() -> AsyncIterator[None]:
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    metrics.reset()
+    yield
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    metrics.reset()
+
+
+def _configure_rapidapi(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "rapidapi")
+    monkeypatch.setattr(config, "RAPIDAPI_KEY", "rapid-key")
+    monkeypatch.setattr(config, "RAPIDAPI_HOST", "fake-news-detector.p.rapidapi.com")
+    monkeypatch.setattr(config, "RAPIDAPI_CLASSIFIER_ENDPOINT", "https://rapidapi.example/predict")
+    monkeypatch.setattr(config, "CLASSIFIER_BATCH_MAX_SIZE", 4)
+    monkeypatch.setattr(config, "CLASSIFIER_BATCH_WINDOW_MS", 20.0)
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_groups_concurrent_submissions() -> None:
+    batches: List[List[int]] = []
+
+    async def handler(items: List[int]) -> List[Any]:
+        batches.append(list(items))
+        return [ValueError("odd") if item % 2 else item * 10 for item in items]
+
+    batcher = batching.MicroBatcher(handler, max_batch_size=3, max_wait=0.02, name="unit")
+    results = await asyncio.gather(*(batcher.submit(item) for item in range(5)), return_exceptions=True)
+
+    assert batches == [[0, 1, 2], [3, 4]]
+    assert results[0] == 0 and results[2] == 20 and results[4] == 40
+    assert isinstance(results[1], ValueError) and isinstance(results[3], ValueError)
+    assert metrics.snapshot()["summaries"]["unit.batch_size"]["count"] == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_a_parallel_burst(monkeypatch: pytest.MonkeyPatch) -> None:
+    _configure_rapidapi(monkeypatch)
+    monkeypatch.setattr(config, "RAPIDAPI_BATCH_ENDPOINT", None)
+
+    def _score(request: Request) -> Response:
+        text = json.loads(request.content)["text"]
+        return Response(200, json={"score": len(text) / 100})
+
+    route = respx.post("https://rapidapi.example/predict").mock(side_effect=_score)
+
+    texts = ["alpha", "bravo!", "charlie", "delta deltas"]
+    results = await asyncio.gather(*(classifier_service.classify_text(text) for text in texts))
+
+    assert route.call_count == 4
+    assert [result["score"] for result in results] == pytest.approx([0.05, 0.06, 0.07, 0.12])
+    summary = metrics.snapshot()["summaries"]["classifier.rapidapi.batch_size"]
+    assert summary["count"] == 1
+    assert summary["max"] == 4
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batch_endpoint_used_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    _configure_rapidapi(monkeypatch)
+    monkeypatch.setattr(config, "RAPIDAPI_BATCH_ENDPOINT", "https://rapidapi.example/predict/batch")
+
+    def _score_batch(request: Request) -> Response:
+        texts = json.loads(request.content)["texts"]
+        return Response(200, json={"results": [{"score": 0.25, "label": text} for text in texts]})
+
+    batch_route = respx.post("https://rapidapi.example/predict/batch").mock(side_effect=_score_batch)
+    single_route = respx.post("https://rapidapi.example/predict").mock(return_value=Response(200, json={"score": 0.9}))
+
+    results = await asyncio.gather(
+        classifier_service.classify_text("first text"),
+        classifier_service.classify_text("second text"),
+    )
+
+    assert batch_route.call_count == 1
+    assert single_route.call_count == 0
+    assert [result["explanation"] for result in results] == ["first text", "second text"]
+    assert all(result["provider"] == "rapidapi" for result in results)
@@ -5,7 +5,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
 
 import pytest
 
@@ -82,6 +84,22 @@ async def test_cached_decorator_respects_force_refresh() -> None:
     assert call_log == [5, 5]
 
 
+@pytest.mark.asyncio
+async def test_cached_get_many_reads_decorated_keys() -> None:
+    backend = cache.Cache(ttl=5, max_items=8)
+
+    @cache.cached(cache=backend, ttl=5)
+    async def compute(value: int, *, force_refresh: bool = False) -> int:
+        _ = force_refresh
+        return value * 2
+
+    await compute(1)
+    await compute(3)
+
+    keys = [compute.cache_key(value) for value in (1, 2, 3)]  # type: ignore[attr-defined]
+    assert await backend.get_many(keys) == [2, None, 6]
+
+
 @pytest.mark.asyncio
 async def test_create_cache_falls_back_when_redis_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(cache.config, "USE_REDIS", False)
@@ -90,4 +108,88 @@ async def test_create_cache_falls_back_when_redis_disabled(monkeypatch: pytest.M
     backend = cache.create_cache("unit-test", ttl=60, max_items=16)
 
     await backend.set("key", "value")
-    assert await backend.get("key") == "value"
\ No newline at end of file
+    assert await backend.get("key") == "value"
+
+
+class _LeasedCache(cache.Cache):
+    """In-memory stand-in for ``RedisCache`` leases shared by several "instances"."""
+
+    def __init__(self) -> None:
+        super().__init__(ttl=5, max_items=8)
+        self.leases: Dict[str, Tuple[str, float]] = {}
+
+    async def acquire_lease(self, key: str, ttl_ms: int) -> Optional[str]:
+        held = self.leases.get(key)
+        if held is not None and held[1] > time.monotonic():
+            return None
+        token = uuid.uuid4().hex
+        self.leases[key] = (token, time.monotonic() + ttl_ms / 1000.0)
+        return token
+
+    async def release_lease(self, key: str, token: str) -> None:
+        if self.leases.get(key, ("",))[0] == token:
+            del self.leases[key]
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_misses_in_process() -> None:
+    backend = cache.Cache(ttl=5, max_items=8)
+    calls: List[int] = []
+
+    @cache.cached(cache=backend, ttl=5)
+    async def compute(value: int) -> int:
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    assert await asyncio.gather(*(compute(4) for _ in range(10))) == [8] * 10
+    assert calls == [4]
+
+
+@pytest.mark.asyncio
+async def test_cached_lease_makes_other_instances_wait_for_the_holder(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache.config, "CACHE_LEASE_POLL_MS", 1)
+    backend = _LeasedCache()
+    release = asyncio.Event()
+    calls: List[str] = []
+
+    # Two decorations model two instances: separate in-process state, one shared backend.
+    @cache.cached(cache=backend, ttl=5, namespace="shared", single_flight=True)
+    async def instance_a(text: str) -> str:
+        calls.append("a")
+        await release.wait()
+        return text.upper()
+
+    @cache.cached(cache=backend, ttl=5, namespace="shared", single_flight=True)
+    async def instance_b(text: str) -> str:
+        calls.append("b")
+        return text.upper()
+
+    holder = asyncio.create_task(instance_a("claim"))
+    await asyncio.sleep(0.005)
+    waiter = asyncio.create_task(instance_b("claim"))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    release.set()
+    assert await holder == "CLAIM"
+    assert await waiter == "CLAIM"
+    assert calls == ["a"]
+    assert backend.leases == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_takes_over_when_lease_holder_dies(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache.config, "CACHE_LEASE_POLL_MS", 1)
+    backend = _LeasedCache()
+
+    @cache.cached(cache=backend, ttl=5, single_flight=True)
+    async def compute(text: str) -> str:
+        return text.upper()
+
+    # A crashed instance left a lease behind that nobody will release.
+    await backend.acquire_lease(compute.cache_key("claim"), 30)  # type: ignore[attr-defined]
+
+    started = time.monotonic()
+    assert await compute("claim") == "CLAIM"
+    assert time.monotonic() - started >= 0.02
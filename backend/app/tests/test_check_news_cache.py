@@ -91,3 +91,11 @@ def test_check_news_endpoint_uses_cached_services(monkeypatch: pytest.MonkeyPatc
     assert news_route.call_count == 2
     assert factcheck_route.call_count == 2
     assert classifier_route.call_count == 2
+
+    batch = client.post("/check-news/batch", json={"texts": [payload["text"], payload["text"]]})
+    assert batch.status_code == 200
+    assert [item["result"] for item in batch.json()["results"]] == [refreshed.json(), refreshed.json()]
+
+    assert news_route.call_count == 2
+    assert factcheck_route.call_count == 2
+    assert classifier_route.call_count == 2
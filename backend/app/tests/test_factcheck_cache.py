@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import AsyncIterator
 
+import httpx
 import pytest
 import pytest_asyncio
 import respx
@@ -62,3 +63,37 @@ async def test_factcheck_query_uses_cache(monkeypatch: pytest.MonkeyPatch) -> No
     refreshed = await factcheck_service.query_claimreview("Claim to verify", limit=1, force_refresh=True)
     assert refreshed == first
     assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_failed_factcheck_lookup_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "FACTCHECK_PROVIDER", "google")
+    monkeypatch.setattr(config, "GOOGLE_FACTCHECK_KEY", "unit-key")
+    monkeypatch.setattr(config, "GOOGLE_FACTCHECK_ENDPOINT", "https://factcheck.example/claims:search")
+    monkeypatch.setattr(config, "UPSTREAM_RETRY_ATTEMPTS", 1)
+
+    route = respx.get("https://factcheck.example/claims:search").mock(
+        side_effect=[
+            httpx.ConnectError("connection refused"),
+            Response(200, json={"claims": [{"text": "Claim", "claimReview": [{"url": "https://factcheck.example/r"}]}]}),
+        ]
+    )
+
+    writes: list[str] = []
+    backend = factcheck_service.query_claimreview.cache_backend
+    real_set = backend.set
+
+    async def _recording_set(key: str, value: object, ttl: object = None) -> None:
+        writes.append(key)
+        await real_set(key, value, ttl=ttl)
+
+    monkeypatch.setattr(backend, "set", _recording_set)
+
+    failed = await factcheck_service.query_claimreview("Outage claim", limit=1)
+    assert writes == []
+    recovered = await factcheck_service.query_claimreview("Outage claim", limit=1)
+
+    assert failed is None
+    assert recovered and recovered[0]["url"] == "https://factcheck.example/r"
+    assert route.call_count == 2
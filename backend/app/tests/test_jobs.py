@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from app.utils import cache, jobs, metrics, shm_cache
+
+
+async def _wait_for(queue: jobs.JobQueue, job_id: str, status: str) -> Dict[str, Any]:
+    for _ in range(200):
+        record = await queue.get(job_id)
+        if record is not None and record["status"] == status:
+            return record
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"job {job_id} never reached {status}")
+
+
+class _FakeRedis:
+    """The handful of list and key commands the Redis job backend uses."""
+
+    def __init__(self) -> None:
+        self.lists: Dict[str, List[str]] = {}
+        self.keys: Dict[str, str] = {}
+
+    async def lpush(self, key: str, value: str) -> None:
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    async def lmove(self, source: str, destination: str, src: str, dest: str) -> Optional[str]:
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop(0 if src == "LEFT" else -1)
+        target = self.lists.setdefault(destination, [])
+        target.insert(0 if dest == "LEFT" else len(target), value)
+        return value
+
+    async def blmove(self, source: str, destination: str, timeout: float, src: str, dest: str) -> Optional[str]:
+        value = await self.lmove(source, destination, src, dest)
+        if value is None:
+            await asyncio.sleep(0.005)
+        return value
+
+    async def lrem(self, key: str, count: int, value: str) -> None:
+        self.lists.get(key, []).remove(value)
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        self.keys[key] = value
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.keys)
+
+    async def delete(self, key: str) -> None:
+        self.keys.pop(key, None)
+
+    async def scan_iter(self, match: str) -> AsyncIterator[str]:
+        for key in list(self.lists):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+
+@pytest.mark.asyncio
+async def test_job_queue_runs_handler_and_records_result() -> None:
+    async def handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"doubled": payload["value"] * 2}
+
+    queue = jobs.JobQueue(handler, name="unit-ok", workers=2, max_depth=4, ttl=60)
+    try:
+        job = await queue.submit({"value": 21})
+        assert job["status"] == "queued"
+        assert "payload" not in job
+
+        done = await _wait_for(queue, job["id"], "done")
+        assert done["result"] == {"doubled": 42}
+    finally:
+        await queue.aclose()
+
+
+@pytest.mark.asyncio
+async def test_job_queue_records_failures() -> None:
+    async def handler(payload: Dict[str, Any]) -> None:
+        raise ValueError("bad payload")
+
+    queue = jobs.JobQueue(handler, name="unit-fail", workers=1, max_depth=4, ttl=60)
+    try:
+        job = await queue.submit({})
+        failed = await _wait_for(queue, job["id"], "failed")
+        assert failed["error"] == "bad payload"
+    finally:
+        await queue.aclose()
+
+
+@pytest.mark.asyncio
+async def test_job_queue_rejects_when_full() -> None:
+    release = asyncio.Event()
+
+    async def handler(payload: Dict[str, Any]) -> None:
+        await release.wait()
+
+    queue = jobs.JobQueue(handler, name="unit-full", workers=1, max_depth=1, ttl=60)
+    try:
+        first = await queue.submit({})
+        await _wait_for(queue, first["id"], "running")
+        await queue.submit({})
+
+        with pytest.raises(jobs.JobQueueFullError):
+            await queue.submit({})
+    finally:
+        release.set()
+        await queue.aclose()
+
+
+@pytest.mark.asyncio
+async def test_drain_finishes_queued_work_and_refuses_new_jobs() -> None:
+    release = asyncio.Event()
+
+    async def handler(payload: Dict[str, Any]) -> int:
+        await release.wait()
+        return payload["value"]
+
+    queue = jobs.JobQueue(handler, name="unit-drain", workers=1, max_depth=4, ttl=60)
+    running = await queue.submit({"value": 1})
+    queued = await queue.submit({"value": 2})
+    await _wait_for(queue, running["id"], "running")
+
+    drain = asyncio.create_task(queue.drain(timeout=5))
+    await asyncio.sleep(0)
+    with pytest.raises(jobs.JobQueueDrainingError):
+        await queue.submit({"value": 3})
+    release.set()
+
+    assert await drain == 0
+    assert (await queue.get(queued["id"]))["result"] == 2
+
+    # Intake stays closed after the drain until the queue is started again.
+    with pytest.raises(jobs.JobQueueDrainingError):
+        await queue.submit({"value": 4})
+    queue.start()
+    try:
+        reopened = await queue.submit({"value": 5})
+        assert (await _wait_for(queue, reopened["id"], "done"))["result"] == 5
+    finally:
+        await queue.aclose()
+
+
+@pytest.mark.asyncio
+async def test_drain_gives_up_after_timeout() -> None:
+    async def handler(payload: Dict[str, Any]) -> None:
+        await asyncio.Event().wait()
+
+    queue = jobs.JobQueue(handler, name="unit-drain-timeout", workers=1, max_depth=4, ttl=60)
+    job = await queue.submit({})
+    await _wait_for(queue, job["id"], "running")
+
+    assert await queue.drain(timeout=0.05) == 1
+    assert (await queue.get(job["id"]))["status"] == "running"
+
+
+@pytest.mark.asyncio
+async def test_start_requeues_jobs_claimed_by_a_stopped_instance(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def handler(payload: Dict[str, Any]) -> int:
+        return payload["value"]
+
+    redis = _FakeRedis()
+    queue = jobs.JobQueue(handler, name="unit-orphans", workers=1, max_depth=4, ttl=60, backend="redis")
+    monkeypatch.setattr(queue, "_redis_client", lambda: redis)
+    await queue._store.set("orphan", {"id": "orphan", "status": "running", "payload": {"value": 7}})  # noqa: SLF001
+    redis.lists["jobs:unit-orphans:claimed:dead"] = ["orphan"]
+    await queue._store.set("alive", {"id": "alive", "status": "running", "payload": {"value": 8}})  # noqa: SLF001
+    redis.lists["jobs:unit-orphans:claimed:busy"] = ["alive"]
+    redis.keys["jobs:unit-orphans:alive:busy"] = "1"
+    metrics.reset()
+
+    queue.start()
+    try:
+        done = await _wait_for(queue, "orphan", "done")
+    finally:
+        await queue.aclose()
+
+    assert done["result"] == 7
+    assert (await queue.get("alive"))["status"] == "running"
+    assert redis.lists["jobs:unit-orphans:claimed:busy"] == ["alive"]
+    assert metrics.snapshot()["counters"]["jobs.unit-orphans.requeued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_hands_claimed_redis_jobs_back(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def handler(payload: Dict[str, Any]) -> None:
+        await asyncio.Event().wait()
+
+    redis = _FakeRedis()
+    queue = jobs.JobQueue(handler, name="unit-handback", workers=1, max_depth=4, ttl=60, backend="redis")
+    monkeypatch.setattr(queue, "_redis_client", lambda: redis)
+    queue.start()
+    job = await queue.submit({})
+    await _wait_for(queue, job["id"], "running")
+
+    await queue.aclose()
+
+    assert redis.lists["jobs:unit-handback:queue"] == [job["id"]]
+    assert (await queue.get(job["id"]))["status"] == "queued"
+    assert not redis.keys
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_survive_shared_memory_caching(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache.config, "USE_REDIS", False)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY", True)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY_SLOT_BYTES", 1024)
+
+    async def handler(payload: Dict[str, Any]) -> int:
+        return len(payload["text"])
+
+    queue = jobs.JobQueue(handler, name="unit-large", workers=1, max_depth=4, ttl=60)
+    try:
+        job = await queue.submit({"text": "long article " * 1_000})
+        done = await _wait_for(queue, job["id"], "done")
+    finally:
+        await queue.aclose()
+        cache._REGISTERED_CACHES.remove(queue._store)  # noqa: SLF001
+
+    assert done["result"] == len("long article " * 1_000)
+    assert not isinstance(queue._store.resolve(), shm_cache.SharedMemoryCache)  # noqa: SLF001
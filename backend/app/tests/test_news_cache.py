@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import AsyncIterator
 
+import httpx
 import pytest
 import pytest_asyncio
 import respx
@@ -54,4 +55,38 @@ async def test_news_search_uses_cache(monkeypatch: pytest.MonkeyPatch) -> None:
 
     refreshed = await news_service.search_news("Cached query", limit=1, force_refresh=True)
     assert refreshed == first
-    assert route.call_count == 2
\ No newline at end of file
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_failed_news_search_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "NEWS_PROVIDER", "newsapi")
+    monkeypatch.setattr(config, "NEWSAPI_KEY", "unit-test-key")
+    monkeypatch.setattr(config, "NEWSAPI_ENDPOINT", "https://newsapi.example/v2/everything")
+    monkeypatch.setattr(config, "UPSTREAM_RETRY_ATTEMPTS", 1)
+
+    route = respx.get("https://newsapi.example/v2/everything").mock(
+        side_effect=[
+            httpx.ConnectError("connection refused"),
+            Response(200, json={"articles": [{"title": "Back", "url": "https://example.com/b", "source": {"name": "AP"}}]}),
+        ]
+    )
+
+    writes: list[str] = []
+    backend = news_service.search_news.cache_backend
+    real_set = backend.set
+
+    async def _recording_set(key: str, value: object, ttl: object = None) -> None:
+        writes.append(key)
+        await real_set(key, value, ttl=ttl)
+
+    monkeypatch.setattr(backend, "set", _recording_set)
+
+    failed = await news_service.search_news("Outage query", limit=1)
+    assert writes == []
+    recovered = await news_service.search_news("Outage query", limit=1)
+
+    assert failed is None
+    assert [article["title"] for article in recovered] == ["Back"]
+    assert route.call_count == 2
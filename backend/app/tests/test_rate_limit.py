@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routes import check_news as check_news_route
+from app.utils import metrics
+from app.utils.rate_limit import MemoryRateLimiter, client_identity
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_slides_previous_window() -> None:
+    clock = _Clock(1_000.0)
+    limiter = MemoryRateLimiter(clock=clock)
+
+    for expected_remaining in (2, 1, 0):
+        decision = await limiter.hit("ip:1", limit=3, window=10)
+        assert decision.allowed and decision.remaining == expected_remaining
+    assert not (await limiter.hit("ip:1", limit=3, window=10)).allowed
+    assert (await limiter.hit("ip:2", limit=3, window=10)).allowed
+
+    # Halfway through the next window half of the previous count still applies.
+    clock.now = 1_015.0
+    decision = await limiter.hit("ip:1", limit=3, window=10)
+    assert decision.allowed and decision.remaining == 0
+    assert not (await limiter.hit("ip:1", limit=3, window=10)).allowed
+
+    # Two windows later the history has been swept.
+    clock.now = 1_030.0
+    assert (await limiter.hit("ip:1", limit=3, window=10)).remaining == 2
+    assert "ip:2" not in limiter._windows  # noqa: SLF001
+
+
+def test_client_identity_uses_the_hop_the_proxy_appended() -> None:
+    # The client sent the first entry itself; the proxy appended the second.
+    scope = {"client": ("10.0.0.1", 5000), "headers": [(b"x-forwarded-for", b"198.51.100.7, 203.0.113.9")]}
+    assert client_identity(scope) == "ip:10.0.0.1"
+    assert client_identity(scope, trust_forwarded=True) == "ip:203.0.113.9"
+
+
+def test_client_identity_only_trusts_configured_api_keys() -> None:
+    keyed = {"client": ("10.0.0.1", 5000), "headers": [(b"x-api-key", b"secret")]}
+    assert client_identity(keyed, api_keys=frozenset({"secret"})).startswith("key:")
+    assert "secret" not in client_identity(keyed, api_keys=frozenset({"secret"}))
+
+    # A made-up key cannot buy a fresh quota.
+    assert client_identity(keyed) == "ip:10.0.0.1"
+    assert client_identity(keyed, api_keys=frozenset({"other"})) == "ip:10.0.0.1"
+
+
+def test_check_news_returns_429_with_rate_limit_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _empty(*_args: object, **_kwargs: object) -> list[object]:
+        return []
+
+    monkeypatch.setattr(check_news_route.config, "RATE_LIMIT_REQUESTS", 2)
+    monkeypatch.setattr(check_news_route.config, "RATE_LIMIT_API_KEYS", frozenset({"test-rate-limit-key", "other"}))
+    monkeypatch.setattr(check_news_route.config, "CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS", 0)
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _empty)
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _empty)
+    metrics.reset()
+    client = TestClient(app)
+    headers = {"X-API-Key": "test-rate-limit-key"}
+
+    first = client.post("/check-news", json={"text": "limited"}, headers=headers)
+    assert first.status_code == 200
+    assert first.headers["RateLimit-Limit"] == "2"
+    assert first.headers["RateLimit-Remaining"] == "1"
+
+    client.post("/check-news", json={"text": "limited"}, headers=headers)
+    limited = client.post("/check-news", json={"text": "limited"}, headers=headers)
+    assert limited.status_code == 429
+    assert limited.headers["RateLimit-Remaining"] == "0"
+    assert int(limited.headers["Retry-After"]) >= 1
+
+    # Other clients and health probes are unaffected.
+    assert client.post("/check-news", json={"text": "limited"}, headers={"X-API-Key": "other"}).status_code == 200
+    assert client.get("/health").status_code == 200
+    assert metrics.snapshot()["counters"]["rate_limit.rejected"] == 1
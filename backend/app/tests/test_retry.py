@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import AsyncIterator, List
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+from httpx import Response
+
+from app import config
+from app.services import factcheck_service, news_service
+from app.utils import retry
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_caches() -> AsyncIterator[None]:
+    await news_service._clear_cache_for_tests()  # noqa: SLF001
+    await factcheck_service._clear_cache_for_tests()  # noqa: SLF001
+    yield
+    await news_service._clear_cache_for_tests()  # noqa: SLF001
+    await factcheck_service._clear_cache_for_tests()  # noqa: SLF001
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "UPSTREAM_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr(config, "UPSTREAM_RETRY_BASE_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(config, "UPSTREAM_RETRY_MAX_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(config, "UPSTREAM_HEDGE_AFTER_SECONDS", 0.0)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_news_search_recovers_from_dropped_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "NEWS_PROVIDER", "newsapi")
+    monkeypatch.setattr(config, "NEWSAPI_KEY", "retry-key")
+    monkeypatch.setattr(config, "NEWSAPI_ENDPOINT", "https://newsapi.example/v2/everything")
+
+    route = respx.get("https://newsapi.example/v2/everything").mock(
+        side_effect=[
+            httpx.ConnectError("connection reset"),
+            Response(
+                200,
+                json={"articles": [{"title": "Recovered", "url": "https://example.com/a", "source": {"name": "AP"}}]},
+            ),
+        ]
+    )
+
+    articles = await news_service.search_news("Retry query", limit=1)
+
+    assert route.call_count == 2
+    assert [article["title"] for article in articles] == ["Recovered"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_factcheck_retries_service_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "FACTCHECK_PROVIDER", "google")
+    monkeypatch.setattr(config, "GOOGLE_FACTCHECK_KEY", "fact-key")
+    monkeypatch.setattr(config, "GOOGLE_FACTCHECK_ENDPOINT", "https://factcheck.example/claims:search")
+
+    route = respx.get("https://factcheck.example/claims:search").mock(
+        side_effect=[
+            Response(503),
+            Response(
+                200,
+                json={
+                    "claims": [
+                        {
+                            "text": "Claim",
+                            "claimReview": [{"url": "https://review.example/1", "textualRating": "False"}],
+                        }
+                    ]
+                },
+            ),
+        ]
+    )
+
+    results = await factcheck_service.query_claimreview("Retry claim", limit=1)
+
+    assert route.call_count == 2
+    assert results and results[0]["url"] == "https://review.example/1"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_retries_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "FACTCHECK_PROVIDER", "google")
+    monkeypatch.setattr(config, "GOOGLE_FACTCHECK_KEY", "fact-key")
+    monkeypatch.setattr(config, "GOOGLE_FACTCHECK_ENDPOINT", "https://factcheck.example/claims:search")
+
+    route = respx.get("https://factcheck.example/claims:search").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+
+    results = await factcheck_service.query_claimreview("Unreachable claim", limit=1)
+
+    assert results is None
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_when_primary_is_slow() -> None:
+    request = httpx.Request("GET", "https://upstream.example/")
+    delays: List[float] = [1.0, 0.0]
+    calls: List[float] = []
+
+    async def send() -> httpx.Response:
+        delay = delays[len(calls)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, request=request, json={"delay": delay})
+
+    policy = retry.RetryPolicy(max_attempts=1, base_delay=0.0, max_delay=0.0, hedge_after=0.05)
+    started = time.monotonic()
+    response = await retry.call_with_retry(send, policy=policy, timeout=2.0)
+
+    assert response.json() == {"delay": 0.0}
+    assert len(calls) == 2
+    assert time.monotonic() - started < 0.5
+
+
+@pytest.mark.asyncio
+async def test_overall_deadline_is_respected() -> None:
+    attempts: List[int] = []
+
+    async def send() -> httpx.Response:
+        attempts.append(1)
+        await asyncio.sleep(1.0)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    policy = retry.RetryPolicy(max_attempts=5, base_delay=0.0, max_delay=0.0)
+    started = time.monotonic()
+    with pytest.raises(httpx.TimeoutException):
+        await retry.call_with_retry(send, policy=policy, timeout=0.1)
+
+    assert time.monotonic() - started < 0.5
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_the_primary_request() -> None:
+    in_flight: List[asyncio.Task[None]] = []
+
+    async def send() -> httpx.Response:
+        in_flight.append(asyncio.current_task())  # type: ignore[arg-type]
+        await asyncio.sleep(10)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    policy = retry.RetryPolicy(max_attempts=1, base_delay=0.0, max_delay=0.0, hedge_after=5.0)
+    caller = asyncio.create_task(retry.call_with_retry(send, policy=policy))
+    while not in_flight:
+        await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert in_flight[0].cancelled()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils import scheduling
+
+
+def test_priority_comes_from_header_unless_api_key_is_bulk(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduling.config, "BULK_API_KEYS", frozenset({"backfill"}))
+
+    assert scheduling.priority_for([]) == scheduling.INTERACTIVE
+    assert scheduling.priority_for([(b"x-priority", b"Bulk")]) == scheduling.BULK
+    assert scheduling.priority_for([(b"x-priority", b"urgent")]) == scheduling.INTERACTIVE
+    # A bulk key cannot promote itself with the header.
+    headers = [(b"x-priority", b"interactive"), (b"x-api-key", b"backfill")]
+    assert scheduling.priority_for(headers) == scheduling.BULK
+
+
+def test_priority_middleware_sets_class_for_the_request() -> None:
+    app = FastAPI()
+    app.add_middleware(scheduling.PriorityMiddleware)
+
+    @app.get("/priority")
+    async def priority() -> dict[str, str]:
+        return {"priority": scheduling.current_priority()}
+
+    client = TestClient(app)
+    assert client.get("/priority").json() == {"priority": "interactive"}
+    assert client.get("/priority", headers={"X-Priority": "bulk"}).json() == {"priority": "bulk"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_is_capped_so_interactive_finds_spare_capacity() -> None:
+    scheduler = scheduling.WeightedFairScheduler(capacity=4, bulk_max_share=0.5)
+
+    for _ in range(2):
+        await scheduler.acquire(scheduling.BULK)
+    third_bulk = asyncio.create_task(scheduler.acquire(scheduling.BULK))
+    await asyncio.sleep(0)
+    assert not third_bulk.done()
+    assert scheduler.waiting(scheduling.BULK) == 1
+
+    await asyncio.wait_for(scheduler.acquire(scheduling.INTERACTIVE), timeout=0.1)
+    assert scheduler.in_flight(scheduling.INTERACTIVE) == 1
+
+    scheduler.release(scheduling.BULK)
+    await asyncio.wait_for(third_bulk, timeout=0.1)
+    assert scheduler.in_flight(scheduling.BULK) == 2
+
+
+@pytest.mark.asyncio
+async def test_contended_slots_are_shared_by_weight() -> None:
+    scheduler = scheduling.WeightedFairScheduler(
+        capacity=1,
+        weights={scheduling.INTERACTIVE: 3.0, scheduling.BULK: 1.0},
+        bulk_max_share=1.0,
+    )
+    await scheduler.acquire(scheduling.INTERACTIVE)
+    order: List[str] = []
+
+    async def worker(priority: str) -> None:
+        async with scheduler.slot(priority):
+            order.append(priority)
+            await asyncio.sleep(0)
+
+    priorities = [scheduling.BULK] * 4 + [scheduling.INTERACTIVE] * 6
+    tasks = [asyncio.create_task(worker(priority)) for priority in priorities]
+    await asyncio.sleep(0)
+    scheduler.release(scheduling.INTERACTIVE)
+    await asyncio.gather(*tasks)
+
+    assert order[:4].count(scheduling.INTERACTIVE) == 3
+    assert order.count(scheduling.BULK) == 4
+    assert scheduler.in_flight(scheduling.INTERACTIVE) == scheduler.in_flight(scheduling.BULK) == 0
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+import uuid
+from typing import Iterator, List
+
+import pytest
+
+from app.utils import cache, shm_cache
+
+
+@pytest.fixture
+def segment() -> Iterator[str]:
+    name = f"fnp-test-{uuid.uuid4().hex[:8]}"
+    opened: List[shm_cache.SharedMemoryCache] = []
+    yield name
+    try:
+        handle = shm_cache.SharedMemoryCache(name, max_items=8, slot_bytes=1024)
+        opened.append(handle)
+        handle.unlink()
+    except shm_cache.SharedMemoryLayoutError:
+        pass
+    for handle in opened:
+        handle.close()
+
+
+def _write_from_child(name: str) -> None:
+    handle = shm_cache.SharedMemoryCache(name, ttl=60, max_items=8, slot_bytes=1024)
+    asyncio.run(handle.set("from-child", {"pid": "child", "items": [1, 2, 3]}))
+    handle.close()
+
+
+@pytest.mark.asyncio
+async def test_entries_are_shared_between_handles_and_processes(segment: str) -> None:
+    first = shm_cache.SharedMemoryCache(segment, ttl=60, max_items=8, slot_bytes=1024)
+    second = shm_cache.SharedMemoryCache(segment, ttl=60, max_items=8, slot_bytes=1024)
+    try:
+        await first.set("claim", {"verdict": "fake"})
+        assert await second.get("claim") == {"verdict": "fake"}
+        await second.delete("claim")
+        assert await first.get("claim") is None
+
+        child = multiprocessing.get_context("fork").Process(target=_write_from_child, args=(segment,))
+        child.start()
+        child.join(timeout=10)
+        assert child.exitcode == 0
+        assert await first.get("from-child") == {"pid": "child", "items": [1, 2, 3]}
+    finally:
+        first.close()
+        second.close()
+
+
+@pytest.mark.asyncio
+async def test_expiry_eviction_and_oversized_values(segment: str) -> None:
+    # max_items=8 is a single bucket, so the ninth key must evict one.
+    backend = shm_cache.SharedMemoryCache(segment, ttl=60, max_items=8, slot_bytes=1024)
+    try:
+        await backend.set("short", "lived", ttl=1)
+        assert backend._get("short", time.time() + 2) is None  # noqa: SLF001
+
+        for index in range(8):
+            await backend.set(f"key-{index}", index)
+        await backend.get("key-0")  # most recently used now
+        await backend.set("key-8", 8)
+        assert await backend.get("key-0") == 0
+        assert await backend.get("key-1") is None
+        assert await backend.get_many(["key-8", "missing"]) == [8, None]
+
+        await backend.set("huge", "x" * 2048)
+        assert await backend.get("huge") is None
+
+        await backend.clear()
+        assert await backend.get("key-8") is None
+    finally:
+        backend.close()
+
+
+def test_mismatched_layout_is_rejected(segment: str) -> None:
+    backend = shm_cache.SharedMemoryCache(segment, max_items=8, slot_bytes=1024)
+    try:
+        with pytest.raises(shm_cache.SharedMemoryLayoutError):
+            shm_cache.SharedMemoryCache(segment, max_items=64, slot_bytes=1024)
+    finally:
+        backend.close()
+
+
+@pytest.mark.asyncio
+async def test_create_cache_uses_shared_memory_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    prefix = f"fnp-{uuid.uuid4().hex[:6]}"
+    monkeypatch.setattr(cache.config, "USE_REDIS", False)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY", True)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY_PREFIX", prefix)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY_SLOT_BYTES", 1024)
+
+    backend = cache.create_cache("unit-shm", ttl=60, max_items=16)
+    other_worker = cache.create_cache("unit-shm", ttl=60, max_items=16)
+    try:
+        assert isinstance(backend.resolve(), shm_cache.SharedMemoryCache)
+        await backend.set("key", [1, 2])
+        assert await other_worker.get("key") == [1, 2]
+    finally:
+        cache._REGISTERED_CACHES.remove(backend)  # noqa: SLF001
+        cache._REGISTERED_CACHES.remove(other_worker)  # noqa: SLF001
+        backend.unlink()
+        backend.close()
+        other_worker.close()
+
+
+def test_layout_change_gets_a_new_segment(monkeypatch: pytest.MonkeyPatch) -> None:
+    prefix = f"fnp-{uuid.uuid4().hex[:6]}"
+    monkeypatch.setattr(cache.config, "USE_REDIS", False)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY", True)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY_PREFIX", prefix)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY_SLOT_BYTES", 1024)
+    previous_deploy = cache.create_cache("unit-shm-layout", ttl=60, max_items=16)
+    monkeypatch.setattr(cache.config, "CACHE_SHARED_MEMORY_SLOT_BYTES", 2048)
+    next_deploy = cache.create_cache("unit-shm-layout", ttl=60, max_items=16)
+    try:
+        assert isinstance(previous_deploy.resolve(), shm_cache.SharedMemoryCache)
+        assert isinstance(next_deploy.resolve(), shm_cache.SharedMemoryCache)
+        assert shm_cache.segment_name(prefix, "ns", max_items=16, slot_bytes=1024) == shm_cache.segment_name(
+            prefix, "ns", max_items=15, slot_bytes=1024
+        )
+    finally:
+        cache._REGISTERED_CACHES.remove(previous_deploy)  # noqa: SLF001
+        cache._REGISTERED_CACHES.remove(next_deploy)  # noqa: SLF001
+        for backend in (previous_deploy, next_deploy):
+            backend.unlink()
+            backend.close()
@@ -0,0 +1,159 @@
+"""Admission control for expensive routes. At most ``ADMISSION_MAX_IN_FLIGHT``
+guarded requests run at once; up to ``ADMISSION_MAX_QUEUE`` more may wait up to
+``ADMISSION_QUEUE_TIMEOUT_MS`` for a slot, in arrival order. Anything beyond
+that is answered immediately with ``503`` and ``Retry-After`` so the instance
+sheds load instead of letting latency grow for every caller. Health probes are
+never queued or shed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, MutableMapping, Optional, Tuple
+
+from app import config
+from app.utils import metrics
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_ALWAYS_EXEMPT = frozenset({"/health", "/ready"})
+
+
+class AdmissionController:
+    """Counting gate with a bounded FIFO wait queue.
+
+    Limits default to the ``ADMISSION_*`` settings and are read on every call,
+    so configuration changes apply without rebuilding the middleware stack.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+    ) -> None:
+        self._max_in_flight = max_in_flight
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting briefly if allowed; return ``False`` to shed."""
+
+        limit = self._max_in_flight if self._max_in_flight is not None else config.ADMISSION_MAX_IN_FLIGHT
+        if limit <= 0 or (self._in_flight < limit and not self._waiters):
+            self._in_flight += 1
+            self._publish()
+            return True
+
+        max_queue = self._max_queue if self._max_queue is not None else config.ADMISSION_MAX_QUEUE
+        if len(self._waiters) >= max_queue:
+            metrics.increment("admission.shed")
+            return False
+
+        timeout = (
+            self._queue_timeout if self._queue_timeout is not None else config.ADMISSION_QUEUE_TIMEOUT_MS / 1000.0
+        )
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._publish()
+        started = time.perf_counter()
+        try:
+            # release() hands its slot straight to the waiter, so in_flight is
+            # not incremented again here.
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            metrics.increment("admission.shed")
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            metrics.observe("admission.wait_seconds", time.perf_counter() - started)
+            self._publish()
+        return True
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._publish()
+                return
+        self._in_flight = max(0, self._in_flight - 1)
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge("admission.in_flight", self._in_flight)
+        metrics.set_gauge("admission.queue_depth", len(self._waiters))
+
+
+class AdmissionControlMiddleware:
+    """Gate requests whose path starts with one of *prefixes* (POST by default)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        prefixes: Iterable[str] = ("/check-news",),
+        methods: Iterable[str] = ("POST",),
+        controller: Optional[AdmissionController] = None,
+    ) -> None:
+        self.app = app
+        self.controller = controller or AdmissionController()
+        self._prefixes: Tuple[str, ...] = tuple(prefixes)
+        self._methods = frozenset(method.upper() for method in methods)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._guarded(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire():
+            await _send_overloaded(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+    def _guarded(self, scope: Scope) -> bool:
+        if scope["type"] != "http":
+            return False
+        path = scope.get("path", "")
+        if path in _ALWAYS_EXEMPT:
+            return False
+        return scope.get("method", "GET").upper() in self._methods and path.startswith(self._prefixes)
+
+
+async def _send_overloaded(send: Send) -> None:
+    body = json.dumps({"detail": "Server is busy; retry shortly."}).encode("utf-8")
+    headers: Dict[bytes, bytes] = {
+        b"content-type": b"application/json",
+        b"content-length": str(len(body)).encode("ascii"),
+        b"retry-after": str(config.ADMISSION_RETRY_AFTER_SECONDS).encode("ascii"),
+    }
+    await send({"type": "http.response.start", "status": 503, "headers": list(headers.items())})
+    await send({"type": "http.response.body", "body": body})
+
+
+__all__ = [
+    "AdmissionControlMiddleware",
+    "AdmissionController",
+]
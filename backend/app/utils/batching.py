@@ -0,0 +1,98 @@
+"""Asynchronous micro-batcher. Concurrent callers submit single items; the batcher
+holds them for a short window (or until the batch is full), hands the whole
+batch to one handler call and dispatches each result back to its waiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from app.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[Any]], Awaitable[Sequence[Any]]]
+
+
+class MicroBatcher:
+    """Group concurrent submissions into batches for a single handler call.
+
+    The handler receives the submitted items in order and must return one result
+    per item. A result that is an ``Exception`` instance is raised to that item's
+    waiter only, so one bad item does not fail the whole batch.
+    """
+
+    def __init__(self, handler: BatchHandler, *, max_batch_size: int, max_wait: float, name: str = "batch") -> None:
+        self._handler = handler
+        self._max_batch_size = max(1, int(max_batch_size))
+        self._max_wait = max(0.0, float(max_wait))
+        self._name = name
+        self._pending: List[Tuple[Any, asyncio.Future[Any]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset(loop)
+
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        assert self._loop is not None
+        task = self._loop.create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future[Any]]]) -> None:
+        metrics.observe(f"{self._name}.batch_size", len(batch))
+        items = [item for item, _ in batch]
+        try:
+            results = list(await self._handler(items))
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as exc:
+            logger.warning("Batch handler %s failed: %s", self._name, exc)
+            results = [exc] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+__all__ = [
+    "MicroBatcher",
+]
@@ -14,25 +14,25 @@ import inspect
 import json
 import logging
 import time
+import uuid
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
 
 from app import config
-
-try:  # pragma: no cover - optional dependency
-    redis_async = importlib.import_module("redis.asyncio")  # type: ignore[assignment]
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    redis_async = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency
-    aioredis = importlib.import_module("aioredis")  # type: ignore[assignment]
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    aioredis = None  # type: ignore[assignment]
-
+from app.utils import metrics
 
 logger = logging.getLogger(__name__)
 
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+_LEASE_POLL_MAX_SECONDS = 0.5
+_LEADER_GAVE_UP = object()
+
 
 @dataclass(slots=True)
 class _Entry:
@@ -68,6 +68,22 @@ class Cache:
             self._store.move_to_end(key)
             return _clone(entry.value)
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Look up several keys under a single lock acquisition."""
+
+        values: List[Optional[Any]] = []
+        async with self._lock:
+            self._purge_expired_locked()
+            for key in keys:
+                entry = self._store.get(key)
+                if entry is None:
+                    values.append(None)
+                    continue
+                entry.hits += 1
+                self._store.move_to_end(key)
+                values.append(_clone(entry.value))
+        return values
+
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         ttl_seconds = self._resolve_ttl(ttl)
         expires_at = time.monotonic() + ttl_seconds
@@ -131,6 +147,29 @@ class RedisCache:
             await self.delete(key)
             return None
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Fetch several keys with one ``MGET`` round trip."""
+
+        if not keys:
+            return []
+        namespaced = [self._namespaced(key) for key in keys]
+        raws = await self._client.mget(namespaced)
+        values: List[Optional[Any]] = []
+        touched: Dict[str, float] = {}
+        for key, raw in zip(namespaced, raws):
+            if raw is None:
+                values.append(None)
+                continue
+            try:
+                values.append(json.loads(raw))
+            except json.JSONDecodeError:  # pragma: no cover - defensive guard
+                values.append(None)
+                continue
+            touched[key] = time.time()
+        if self._max_items and touched:
+            await self._client.zadd(self._index_key, touched)
+        return values
+
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         payload = json.dumps(value, default=_json_fallback)
         ttl_seconds = self._resolve_ttl(ttl)
@@ -158,6 +197,24 @@ class RedisCache:
             if keys:
                 await self._client.delete(*keys)
 
+    async def acquire_lease(self, key: str, ttl_ms: int) -> Optional[str]:
+        """Take the fill lease for *key*; return its token, or ``None`` if held elsewhere.
+
+        The lease expires after *ttl_ms* so a crashed holder cannot block others.
+        """
+
+        token = uuid.uuid4().hex
+        acquired = await self._client.set(self._lease_key(key), token, nx=True, px=max(1, int(ttl_ms)))
+        return token if acquired else None
+
+    async def release_lease(self, key: str, token: str) -> None:
+        """Drop the lease only if it is still ours (it may have expired and been re-taken)."""
+
+        await self._client.eval(_RELEASE_LEASE_SCRIPT, 1, self._lease_key(key), token)
+
+    def _lease_key(self, key: str) -> str:
+        return f"{self._namespace}:lease:{key}"
+
     def _namespaced(self, key: str) -> str:
         return f"{self._namespace}:{key}"
 
@@ -185,54 +242,206 @@ _REGISTERED_CACHES: List[CacheLike] = []
 _REDIS_CLIENT: Optional[Any] = None
 
 
-def create_cache(namespace: str, *, ttl: int, max_items: Optional[int] = None) -> CacheLike:
-    backend: CacheLike
+class LazyCache:
+    """Stand-in returned by ``create_cache`` that builds its backend on first use.
+
+    Service modules create their caches at import time; deferring the choice of
+    backend keeps Redis clients, shared memory segments and their imports out
+    of application start-up.
+    """
+
+    def __init__(self, namespace: str, *, ttl: int, max_items: Optional[int], shared_memory: bool = True) -> None:
+        self._namespace = namespace
+        self._ttl = ttl
+        self._max_items = max_items
+        self._shared_memory = shared_memory
+        self._backend: Optional[CacheLike] = None
+
+    @property
+    def default_ttl(self) -> int:
+        return max(1, int(self._ttl))
+
+    @property
+    def max_items(self) -> Optional[int]:
+        return self._max_items
+
+    def resolve(self) -> CacheLike:
+        """Return the concrete backend, building it on the first call."""
+
+        if self._backend is None:
+            self._backend = _build_backend(
+                self._namespace, ttl=self._ttl, max_items=self._max_items, shared_memory=self._shared_memory
+            )
+        return self._backend
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.resolve().get(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        return await self.resolve().get_many(keys)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        await self.resolve().set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.resolve().delete(key)
+
+    async def clear(self) -> None:
+        await self.resolve().clear()
+
+    def __getattr__(self, name: str) -> Any:
+        # Optional capabilities such as acquire_lease exist only on some backends.
+        return getattr(self.resolve(), name)
+
+
+def create_cache(
+    namespace: str, *, ttl: int, max_items: Optional[int] = None, shared_memory: bool = True
+) -> CacheLike:
+    """Register and return a cache for *namespace*; the backend is chosen on first use.
+
+    The shared memory backend skips values larger than a slot. Callers that
+    cannot tolerate a silently dropped write pass ``shared_memory=False`` and
+    get the in-process cache instead when Redis is not in use.
+    """
+
+    backend = LazyCache(namespace, ttl=ttl, max_items=max_items, shared_memory=shared_memory)
+    _REGISTERED_CACHES.append(backend)
+    return backend
+
+
+def _build_backend(namespace: str, *, ttl: int, max_items: Optional[int], shared_memory: bool = True) -> CacheLike:
+    backend: Optional[CacheLike] = None
     if _redis_enabled():
         client = _ensure_redis_client()
         if client is not None:
             backend = RedisCache(client, ttl=ttl, namespace=namespace, max_items=max_items)
-        else:
-            backend = Cache(ttl=ttl, max_items=max_items or config.CACHE_MAX_ITEMS)
-    else:
+    elif config.CACHE_SHARED_MEMORY and shared_memory:
+        backend = _create_shared_memory_cache(namespace, ttl=ttl, max_items=max_items or config.CACHE_MAX_ITEMS)
+    if backend is None:
         backend = Cache(ttl=ttl, max_items=max_items or config.CACHE_MAX_ITEMS)
-
-    _REGISTERED_CACHES.append(backend)
     return backend
 
 
+def _create_shared_memory_cache(namespace: str, *, ttl: int, max_items: int) -> Optional[CacheLike]:
+    try:
+        from app.utils import shm_cache  # POSIX-only (fcntl), so imported on demand
+    except ImportError as exc:  # pragma: no cover - non-POSIX platforms
+        logger.warning("Shared memory cache unavailable (%s); using in-process cache for %s.", exc, namespace)
+        return None
+    try:
+        return shm_cache.SharedMemoryCache(
+            shm_cache.segment_name(
+                config.CACHE_SHARED_MEMORY_PREFIX,
+                namespace,
+                max_items=max_items,
+                slot_bytes=config.CACHE_SHARED_MEMORY_SLOT_BYTES,
+            ),
+            ttl=ttl,
+            max_items=max_items,
+            slot_bytes=config.CACHE_SHARED_MEMORY_SLOT_BYTES,
+        )
+    except (OSError, shm_cache.SharedMemoryLayoutError) as exc:
+        logger.warning("Shared memory cache unavailable (%s); using in-process cache for %s.", exc, namespace)
+        return None
+
+
 def cached(
     *,
     ttl: Optional[int] = None,
     key_func: Optional[Callable[..., str]] = None,
     cache: Optional[CacheLike] = None,
     namespace: Optional[str] = None,
+    single_flight: Optional[bool] = None,
+    ttl_for: Optional[Callable[[Any], int]] = None,
 ) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
-    """Decorator that wraps async functions with cache lookups."""
+    """Decorator that wraps async functions with cache lookups.
+
+    Concurrent misses for the same key share one call. With ``single_flight``
+    (default ``CACHE_SINGLE_FLIGHT``) and a Redis backend the first instance to
+    miss also takes a short Redis lease on the key; other instances poll the
+    cache with backoff until the holder stores the value, and take over if the
+    lease is released or expires without one.
+
+    ``ttl_for`` picks the TTL per computed result, so stand-in answers can
+    expire sooner than the real thing; returning 0 skips storing the result.
+    """
 
     def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
         sig = inspect.signature(func)
         backend = cache or create_cache(namespace or f"{func.__module__}.{func.__qualname__}", ttl=ttl or config.CACHE_TTL_SECONDS)
         cache_namespace = namespace or f"{func.__module__}.{func.__qualname__}"
         ttl_value = ttl if ttl is not None else getattr(backend, "default_ttl", config.CACHE_TTL_SECONDS)
+        in_flight: Dict[str, asyncio.Future[Any]] = {}
 
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            bound = sig.bind_partial(*args, **kwargs)
-            force_refresh = bool(bound.arguments.get("force_refresh", False))
-            key = _build_cache_key(cache_namespace, key_func, sig, args, kwargs)
-            if not force_refresh:
-                cached_value = await backend.get(key)
-                if cached_value is not None:
-                    return cached_value
+        refresh_param = sig.parameters.get("force_refresh")
+        # Keyword-only force_refresh can be read straight from kwargs; otherwise
+        # the arguments are bound once here and reused for the key.
+        refresh_in_kwargs = refresh_param is None or refresh_param.kind is inspect.Parameter.KEYWORD_ONLY
+
+        async def compute(key: str, args: Any, kwargs: Any) -> Any:
             result = await func(*args, **kwargs)
-            await backend.set(key, result, ttl=ttl_value)
+            result_ttl = ttl_value if ttl_for is None else ttl_for(result)
+            if result_ttl > 0:
+                await backend.set(key, result, ttl=result_ttl)
             return result
 
+        async def fill(key: str, args: Any, kwargs: Any) -> Any:
+            pending = in_flight.get(key)
+            if pending is not None:
+                metrics.increment("cache.single_flight.coalesced")
+                result = await asyncio.shield(pending)
+                if result is _LEADER_GAVE_UP:
+                    return await fill(key, args, kwargs)
+                return _clone(result)
+
+            future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            # Mark failures as retrieved so an exception nobody waited for is not logged.
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            in_flight[key] = future
+            try:
+                use_lease = single_flight if single_flight is not None else config.CACHE_SINGLE_FLIGHT
+                if use_lease and hasattr(backend, "acquire_lease"):
+                    result = await _fill_with_lease(backend, key, lambda: compute(key, args, kwargs))
+                else:
+                    result = await compute(key, args, kwargs)
+            except asyncio.CancelledError:
+                future.set_result(_LEADER_GAVE_UP)
+                raise
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                if in_flight.get(key) is future:
+                    del in_flight[key]
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if refresh_in_kwargs:
+                force_refresh = bool(kwargs.get("force_refresh", False))
+                key = _build_cache_key(cache_namespace, key_func, sig, args, kwargs)
+            else:
+                bound = sig.bind_partial(*args, **kwargs)
+                force_refresh = bool(bound.arguments.get("force_refresh", False))
+                key = _build_cache_key(cache_namespace, key_func, sig, args, kwargs, bound=bound)
+            if force_refresh:
+                return await compute(key, args, kwargs)
+            cached_value = await backend.get(key)
+            if cached_value is not None:
+                return cached_value
+            return await fill(key, args, kwargs)
+
         async def invalidate(*invalidate_args: Any, **invalidate_kwargs: Any) -> None:
             key = _build_cache_key(cache_namespace, key_func, sig, invalidate_args, invalidate_kwargs)
             await backend.delete(key)
 
+        def cache_key(*key_args: Any, **key_kwargs: Any) -> str:
+            return _build_cache_key(cache_namespace, key_func, sig, key_args, key_kwargs)
+
         wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        wrapper.cache_key = cache_key  # type: ignore[attr-defined]
         wrapper.cache_backend = backend  # type: ignore[attr-defined]
         wrapper.cache_namespace = cache_namespace  # type: ignore[attr-defined]
         return wrapper
@@ -240,6 +449,47 @@ def cached(
     return decorator
 
 
+async def _fill_with_lease(backend: CacheLike, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Compute *key* under a distributed lease, or wait for the instance holding it."""
+
+    lease_ms = config.CACHE_LEASE_TTL_MS
+    deadline = time.monotonic() + lease_ms / 1000.0
+    delay = config.CACHE_LEASE_POLL_MS / 1000.0
+    first_attempt = True
+    while True:
+        try:
+            token = await backend.acquire_lease(key, lease_ms)
+        except Exception as exc:
+            logger.warning("Cache lease unavailable for key=%s; computing locally: %s", key, exc)
+            return await compute()
+
+        if token is not None:
+            metrics.increment("cache.lease.acquired")
+            try:
+                if not first_attempt:
+                    # The previous holder may have stored the value just before releasing.
+                    cached_value = await backend.get(key)
+                    if cached_value is not None:
+                        return cached_value
+                return await compute()
+            finally:
+                try:
+                    await backend.release_lease(key, token)
+                except Exception as exc:  # pragma: no cover - lease expires on its own
+                    logger.debug("Failed to release cache lease for key=%s: %s", key, exc)
+
+        first_attempt = False
+        if time.monotonic() >= deadline:
+            metrics.increment("cache.lease.timeout")
+            return await compute()
+        metrics.increment("cache.lease.waits")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _LEASE_POLL_MAX_SECONDS)
+        cached_value = await backend.get(key)
+        if cached_value is not None:
+            return cached_value
+
+
 def make_key(namespace: str, *parts: Any) -> str:
     serialised = "|".join(str(part) for part in parts)
     digest = hashlib.sha256(serialised.encode("utf-8")).digest()
@@ -255,6 +505,44 @@ async def clear_registered_caches() -> None:
             logger.warning("Failed to clear cache backend %s: %s", backend, exc)
 
 
+def resolve_registered_caches() -> int:
+    """Build the backend of every registered cache now instead of on first use."""
+
+    for backend in _REGISTERED_CACHES:
+        resolve = getattr(backend, "resolve", None)
+        if resolve is not None:
+            resolve()
+    return len(_REGISTERED_CACHES)
+
+
+async def ping_redis() -> bool:
+    """Open the shared Redis connection pool and check that the server answers."""
+
+    client = _ensure_redis_client()
+    if client is None:
+        return False
+    try:
+        await client.ping()
+    except Exception as exc:
+        logger.warning("Redis ping failed: %s", exc)
+        return False
+    return True
+
+
+async def aclose_redis() -> None:
+    """Close the shared Redis connections; the client reconnects if used again."""
+
+    client = _REDIS_CLIENT
+    if client is None:
+        return
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    try:
+        if close is not None:
+            await close()
+    except Exception as exc:  # pragma: no cover - defensive guard
+        logger.warning("Failed to close Redis client: %s", exc)
+
+
 def is_redis_available() -> bool:
     return _redis_enabled() and _ensure_redis_client() is not None
 
@@ -272,12 +560,16 @@ def _ensure_redis_client() -> Optional[Any]:
     url = config.REDIS_URL
     assert url is not None
     client: Optional[Any] = None
+    # Client libraries are optional and slow to import, so load them only once
+    # Redis is actually in use.
+    redis_async = _import_optional("redis.asyncio")
     if redis_async is not None:  # pragma: no branch - prefer redis>=4
         try:
             client = redis_async.from_url(url, encoding="utf-8", decode_responses=True)
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.warning("Failed to initialise redis.asyncio client: %s", exc)
             client = None
+    aioredis = _import_optional("aioredis") if client is None else None
     if client is None and aioredis is not None:
         try:
             client = aioredis.from_url(url, encoding="utf-8", decode_responses=True)
@@ -290,18 +582,28 @@ def _ensure_redis_client() -> Optional[Any]:
     return _REDIS_CLIENT
 
 
+def _import_optional(module: str) -> Optional[Any]:
+    try:  # pragma: no cover - optional dependency
+        return importlib.import_module(module)
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+
+
 def _build_cache_key(
     namespace: str,
     key_func: Optional[Callable[..., str]],
     sig: inspect.Signature,
     args: Iterable[Any],
     kwargs: Dict[str, Any],
+    *,
+    bound: Optional[inspect.BoundArguments] = None,
 ) -> str:
     if key_func is not None:
         return key_func(*args, **kwargs)
-    bound = sig.bind_partial(*args, **kwargs)
-    bound.arguments.pop("force_refresh", None)
-    serialisable = _normalise_arguments(bound.arguments)
+    if bound is None:
+        bound = sig.bind_partial(*args, **kwargs)
+    arguments = {name: value for name, value in bound.arguments.items() if name != "force_refresh"}
+    serialisable = _normalise_arguments(arguments)
     payload = json.dumps(serialisable, sort_keys=True, separators=(",", ":"))
     return make_key(namespace, payload)
 
@@ -339,10 +641,14 @@ def _json_fallback(value: Any) -> Any:  # pragma: no cover - fallback for json d
 
 __all__ = [
     "Cache",
+    "LazyCache",
     "RedisCache",
     "cached",
     "create_cache",
     "make_key",
     "clear_registered_caches",
+    "resolve_registered_caches",
+    "ping_redis",
+    "aclose_redis",
     "is_redis_available",
 ]
@@ -0,0 +1,81 @@
+"""Shared ``httpx.AsyncClient`` pools keyed by name. Reusing a client keeps TCP and
+TLS connections alive between upstream calls instead of paying a handshake per
+request. Clients are bound to the event loop that created them and are rebuilt
+transparently when used from a different loop (e.g. per-test loops).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_CLIENTS: Dict[str, Tuple[httpx.AsyncClient, Optional[asyncio.AbstractEventLoop]]] = {}
+
+
+def get_client(name: str, *, timeout: float, max_connections: int = 20) -> httpx.AsyncClient:
+    """Return the pooled client registered under *name*, creating it on demand."""
+
+    loop = _running_loop()
+    existing = _CLIENTS.get(name)
+    if existing is not None:
+        client, owner = existing
+        if not client.is_closed and owner is loop and client.timeout.read == timeout:
+            return client
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    client = httpx.AsyncClient(timeout=timeout, limits=limits)
+    _CLIENTS[name] = (client, loop)
+    return client
+
+
+async def preconnect(client: httpx.AsyncClient, url: str) -> bool:
+    """Open a pooled connection to the origin of *url* with a bare ``HEAD`` request.
+
+    DNS resolution, TCP and TLS happen now instead of on the first real call.
+    Any HTTP status counts as success because only the connection matters; no
+    credentials are sent.
+    """
+
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return False
+    try:
+        await client.head(f"{parts.scheme}://{parts.netloc}/")
+    except httpx.HTTPError as exc:
+        logger.warning("Could not pre-connect to %s: %s", parts.netloc, exc)
+        return False
+    return True
+
+
+async def aclose_clients() -> None:
+    """Close every pooled client owned by the running loop."""
+
+    loop = _running_loop()
+    for name, (client, owner) in list(_CLIENTS.items()):
+        if owner is not loop:
+            continue
+        try:
+            await client.aclose()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning("Failed to close HTTP client %s: %s", name, exc)
+        _CLIENTS.pop(name, None)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+__all__ = [
+    "get_client",
+    "preconnect",
+    "aclose_clients",
+]
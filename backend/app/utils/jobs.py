@@ -0,0 +1,302 @@
+"""Background job queue with a fixed pool of worker tasks. Submissions are
+rejected with ``JobQueueFullError`` once the queue holds ``max_depth`` jobs, so
+callers can shed load instead of queueing without bound. Job records live in a
+cache backend from ``create_cache``: with Redis enabled they are shared across
+instances, otherwise they stay in the process (never the size-capped shared
+memory cache), and they expire after ``ttl`` seconds. The queue itself is an
+``asyncio.Queue`` by default, or a Redis list when ``backend="redis"`` so queued
+work survives the instance that accepted it. Redis workers move each job they
+take onto a per-instance claim list and keep a heartbeat key alive; claims left
+by an instance whose heartbeat expired are put back on the queue. ``start``
+launches the workers ahead of the first submission and ``drain`` stops intake
+and lets in-flight work finish before shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.utils import cache, metrics
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+_HEARTBEAT_SECONDS = 5.0
+_ORPHAN_SWEEP_SECONDS = 60.0
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobQueueDrainingError(JobQueueFullError):
+    """Raised when a job is submitted while the queue is draining for shutdown."""
+
+
+class JobQueue:
+    """Run submitted payloads through *handler* on ``workers`` background tasks."""
+
+    def __init__(
+        self,
+        handler: JobHandler,
+        *,
+        name: str,
+        workers: int,
+        max_depth: int,
+        ttl: int,
+        max_retained: Optional[int] = None,
+        backend: str = "memory",
+    ) -> None:
+        self._handler = handler
+        self._name = name
+        self._workers = max(1, int(workers))
+        self._max_depth = max(1, int(max_depth))
+        self._ttl = max(1, int(ttl))
+        # Records carry the submitted article, so they must not land in a
+        # size-capped shared memory slot that would drop them.
+        self._store = cache.create_cache(f"jobs.{name}", ttl=self._ttl, max_items=max_retained, shared_memory=False)
+        self._backend = backend
+        self._redis_key = f"jobs:{name}:queue"
+        self._instance = uuid.uuid4().hex
+        self._claimed_key = self._claim_key(self._instance)
+        self._queue: Optional[asyncio.Queue[str]] = None
+        self._tasks: List[asyncio.Task[None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = 0
+        self._draining = False
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    def start(self) -> None:
+        """Start the workers now instead of on the first submission.
+
+        Also reopens intake after a ``drain``. With the Redis backend the
+        heartbeat task sweeps orphaned claims right away, so jobs a crashed
+        instance was running are queued again.
+        """
+
+        self._draining = False
+        self._ensure_workers()
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue *payload* and return the new job record."""
+
+        if self._draining:
+            metrics.increment(f"jobs.{self._name}.rejected")
+            raise JobQueueDrainingError("Job queue is shutting down")
+        self._ensure_workers()
+        depth = await self.depth()
+        if depth >= self._max_depth:
+            metrics.increment(f"jobs.{self._name}.rejected")
+            raise JobQueueFullError(f"Job queue is full ({depth} pending)")
+
+        job_id = uuid.uuid4().hex
+        record = {"id": job_id, "status": "queued", "submitted_at": time.time(), "payload": payload}
+        await self._store.set(job_id, record, ttl=self._ttl)
+        client = self._redis_client()
+        if client is not None:
+            await client.lpush(self._redis_key, job_id)
+        else:
+            assert self._queue is not None
+            self._queue.put_nowait(job_id)
+        metrics.increment(f"jobs.{self._name}.submitted")
+        metrics.set_gauge(f"jobs.{self._name}.depth", depth + 1)
+        return _public(record)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        record = await self._store.get(job_id)
+        return _public(record) if record is not None else None
+
+    async def depth(self) -> int:
+        client = self._redis_client()
+        if client is not None:
+            return int(await client.llen(self._redis_key))
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def drain(self, timeout: float) -> int:
+        """Stop accepting jobs, wait up to *timeout* seconds for work to finish, then stop.
+
+        In-memory queued jobs are worked off; with the Redis backend only running
+        jobs are awaited and queued ones stay in Redis for other instances.
+        Intake stays closed until ``start`` is called again. Returns the number
+        of jobs abandoned when the deadline passed.
+        """
+
+        self._draining = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        while self._tasks and self._pending() and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+        abandoned = self._pending() if self._tasks else 0
+        if abandoned:
+            logger.warning("Job queue %s stopped with %d jobs unfinished", self._name, abandoned)
+            metrics.increment(f"jobs.{self._name}.abandoned", abandoned)
+        await self.aclose()
+        return abandoned
+
+    async def aclose(self) -> None:
+        """Cancel the worker tasks; queued in-memory jobs are dropped.
+
+        Redis jobs this instance had claimed go back on the shared queue.
+        """
+
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+        client = self._redis_client() if tasks else None
+        if client is not None:
+            try:
+                await self._requeue_claims(client, self._claimed_key)
+                await client.delete(self._alive_key(self._instance))
+            except Exception as exc:
+                logger.warning("Job queue %s could not hand back its claimed jobs: %s", self._name, exc)
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._tasks = [loop.create_task(self._worker(index)) for index in range(self._workers)]
+        if self._redis_client() is not None:
+            self._tasks.append(loop.create_task(self._heartbeat()))
+
+    def _pending(self) -> int:
+        queued = self._queue.qsize() if self._queue is not None and self._redis_client() is None else 0
+        return queued + self._running
+
+    def _redis_client(self) -> Optional[Any]:
+        if self._backend != "redis":
+            return None
+        return cache._ensure_redis_client()  # noqa: SLF001 - shared connection
+
+    async def _next_job_id(self) -> Optional[str]:
+        client = self._redis_client()
+        if client is not None:
+            return await client.blmove(self._redis_key, self._claimed_key, 1, "RIGHT", "LEFT")
+        assert self._queue is not None
+        return await self._queue.get()
+
+    async def _worker(self, index: int) -> None:
+        # Redis-queued jobs belong to every instance, so a draining one stops taking them.
+        while not (self._draining and self._redis_client() is not None):
+            try:
+                job_id = await self._next_job_id()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover - defensive guard
+                logger.warning("Job worker %s/%d could not dequeue: %s", self._name, index, exc)
+                await asyncio.sleep(1.0)
+                continue
+            if job_id is None:
+                continue
+            self._running += 1
+            try:
+                await self._run(job_id)
+                client = self._redis_client()
+                if client is not None:
+                    await client.lrem(self._claimed_key, 1, job_id)
+            finally:
+                self._running -= 1
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_sweep = loop.time()
+        while True:
+            client = self._redis_client()
+            if client is None:
+                return
+            try:
+                await client.set(self._alive_key(self._instance), "1", ex=int(_HEARTBEAT_SECONDS * 3))
+                if loop.time() >= next_sweep:
+                    next_sweep = loop.time() + _ORPHAN_SWEEP_SECONDS
+                    await self._requeue_orphans(client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Job queue %s heartbeat failed: %s", self._name, exc)
+            await asyncio.sleep(_HEARTBEAT_SECONDS)
+
+    async def _requeue_orphans(self, client: Any) -> int:
+        """Put back jobs claimed by instances whose heartbeat has expired."""
+
+        requeued = 0
+        async for key in client.scan_iter(match=self._claim_key("*")):
+            owner = key.rsplit(":", 1)[-1]
+            if owner == self._instance or await client.exists(self._alive_key(owner)):
+                continue
+            requeued += await self._requeue_claims(client, key)
+        if requeued:
+            logger.warning("Job queue %s requeued %d jobs left by stopped instances", self._name, requeued)
+            metrics.increment(f"jobs.{self._name}.requeued", requeued)
+        return requeued
+
+    async def _requeue_claims(self, client: Any, claimed_key: str) -> int:
+        moved = 0
+        # Each move is atomic, so concurrent sweeps never requeue a job twice.
+        # Claims go to the consuming end of the queue: they were taken first.
+        while (job_id := await client.lmove(claimed_key, self._redis_key, "LEFT", "RIGHT")) is not None:
+            record = await self._store.get(job_id)
+            if record is not None and record.get("status") == "running":
+                record["status"] = "queued"
+                record.pop("started_at", None)
+                await self._store.set(job_id, record, ttl=self._ttl)
+            moved += 1
+        return moved
+
+    def _claim_key(self, instance: str) -> str:
+        return f"jobs:{self._name}:claimed:{instance}"
+
+    def _alive_key(self, instance: str) -> str:
+        return f"jobs:{self._name}:alive:{instance}"
+
+    async def _run(self, job_id: str) -> None:
+        record = await self._store.get(job_id)
+        if record is None:
+            logger.warning("Job %s expired before it was processed", job_id)
+            return
+        record["status"] = "running"
+        record["started_at"] = time.time()
+        await self._store.set(job_id, record, ttl=self._ttl)
+
+        started = time.perf_counter()
+        try:
+            result = await self._handler(record["payload"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.exception("Job %s failed", job_id, exc_info=exc)
+            record.update(status="failed", error=str(exc) or exc.__class__.__name__)
+            metrics.increment(f"jobs.{self._name}.failed")
+        else:
+            record.update(status="done", result=json.loads(json.dumps(result, default=str)))
+            metrics.increment(f"jobs.{self._name}.completed")
+        record["finished_at"] = time.time()
+        metrics.observe(f"jobs.{self._name}.duration_seconds", time.perf_counter() - started)
+        await self._store.set(job_id, record, ttl=self._ttl)
+
+
+def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in record.items() if key != "payload"}
+
+
+__all__ = [
+    "JobQueue",
+    "JobQueueFullError",
+    "JobQueueDrainingError",
+]
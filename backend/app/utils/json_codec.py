@@ -0,0 +1,28 @@
+"""Compact JSON encoding for hot paths. ``orjson`` is used when installed (the
+``speedups`` extra); otherwise the standard library encoder produces the same
+compact, UTF-8 output.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    orjson = importlib.import_module("orjson")  # type: ignore[assignment]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> bytes:
+    """Serialise *value* to compact UTF-8 JSON, stringifying unknown types."""
+
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+__all__ = [
+    "dumps",
+]
@@ -0,0 +1,87 @@
+"""Minimal in-process metrics registry. Counters, gauges and summary observations
+are kept per process and exposed through ``GET /metrics`` as JSON so operators
+can inspect behaviour without pulling in a metrics client dependency.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(slots=True)
+class _Summary:
+    count: int = 0
+    total: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        if self.count == 0:
+            self.minimum = value
+            self.maximum = value
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+        self.count += 1
+        self.total += value
+
+    def as_dict(self) -> Dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": mean,
+        }
+
+
+_LOCK = threading.Lock()
+_COUNTERS: Dict[str, float] = {}
+_GAUGES: Dict[str, float] = {}
+_SUMMARIES: Dict[str, _Summary] = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+    with _LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + value
+
+
+def set_gauge(name: str, value: float) -> None:
+    with _LOCK:
+        _GAUGES[name] = value
+
+
+def observe(name: str, value: float) -> None:
+    with _LOCK:
+        summary = _SUMMARIES.get(name)
+        if summary is None:
+            summary = _SUMMARIES[name] = _Summary()
+        summary.observe(float(value))
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    with _LOCK:
+        return {
+            "counters": dict(_COUNTERS),
+            "gauges": dict(_GAUGES),
+            "summaries": {name: summary.as_dict() for name, summary in _SUMMARIES.items()},
+        }
+
+
+def reset() -> None:
+    with _LOCK:
+        _COUNTERS.clear()
+        _GAUGES.clear()
+        _SUMMARIES.clear()
+
+
+__all__ = [
+    "increment",
+    "set_gauge",
+    "observe",
+    "snapshot",
+    "reset",
+]
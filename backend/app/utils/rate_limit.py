@@ -0,0 +1,235 @@
+"""Per-client rate limiting for expensive routes. Clients are identified by their
+``X-API-Key`` header (hashed) when it is one of ``RATE_LIMIT_API_KEYS``, since
+any other value is free for a caller to rotate, or else by IP address. Each client
+gets ``RATE_LIMIT_REQUESTS`` per ``RATE_LIMIT_WINDOW_SECONDS`` using a sliding
+window counter: the previous fixed window's count is weighted by how much of it
+still overlaps the sliding window and added to the current count. That needs
+two integers per client, so a check is a dict lookup in memory or one script
+call in Redis (``RATE_LIMIT_BACKEND=redis``, sharing the cache connection).
+
+Responses carry ``RateLimit-Limit``/``RateLimit-Remaining``/``RateLimit-Reset``;
+rejected requests get ``429`` with ``Retry-After`` before any service work runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app import config
+from app.utils import cache, metrics
+from app.utils.admission import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], float]
+
+_ALWAYS_EXEMPT = frozenset({"/health", "/ready"})
+
+# KEYS: current window, previous window. ARGV: limit, window ms, elapsed ms.
+_REDIS_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local estimate = previous * (window - tonumber(ARGV[3])) / window + current
+if estimate + 1 > limit then
+    return {0, 0}
+end
+redis.call('INCR', KEYS[1])
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {1, math.floor(limit - estimate - 1)}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: int
+
+    def headers(self) -> List[Tuple[bytes, bytes]]:
+        pairs = [
+            (b"ratelimit-limit", str(self.limit).encode("ascii")),
+            (b"ratelimit-remaining", str(self.remaining).encode("ascii")),
+            (b"ratelimit-reset", str(self.reset_after).encode("ascii")),
+        ]
+        if not self.allowed:
+            pairs.append((b"retry-after", str(self.reset_after).encode("ascii")))
+        return pairs
+
+
+class MemoryRateLimiter:
+    """Sliding window counters for a single instance."""
+
+    def __init__(self, *, clock: Clock = time.time) -> None:
+        self._clock = clock
+        # client -> [window index, count in that window, count in the window before]
+        self._windows: Dict[str, List[int]] = {}
+        self._swept_window = -1
+
+    async def hit(self, client: str, *, limit: int, window: float) -> RateLimitDecision:
+        now = self._clock()
+        index = int(now // window)
+        elapsed = now - index * window
+        if index != self._swept_window:
+            self._sweep(index)
+
+        state = self._windows.get(client)
+        if state is None:
+            state = self._windows[client] = [index, 0, 0]
+        elif state[0] != index:
+            state[2] = state[1] if state[0] == index - 1 else 0
+            state[1] = 0
+            state[0] = index
+
+        estimate = state[2] * (window - elapsed) / window + state[1]
+        reset_after = max(1, math.ceil(window - elapsed))
+        if estimate + 1 > limit:
+            return RateLimitDecision(False, limit, 0, reset_after)
+        state[1] += 1
+        return RateLimitDecision(True, limit, int(limit - estimate - 1), reset_after)
+
+    def _sweep(self, index: int) -> None:
+        # Entries two windows old no longer affect any estimate.
+        self._swept_window = index
+        stale = [client for client, state in self._windows.items() if state[0] < index - 1]
+        for client in stale:
+            del self._windows[client]
+
+
+class RedisRateLimiter:
+    """Sliding window counters shared by every instance using the same Redis."""
+
+    def __init__(self, client: Any, *, clock: Clock = time.time, prefix: str = "ratelimit") -> None:
+        self._script = client.register_script(_REDIS_SCRIPT)
+        self._clock = clock
+        self._prefix = prefix
+
+    async def hit(self, client: str, *, limit: int, window: float) -> RateLimitDecision:
+        now = self._clock()
+        index = int(now // window)
+        elapsed = now - index * window
+        allowed, remaining = await self._script(
+            keys=[f"{self._prefix}:{client}:{index}", f"{self._prefix}:{client}:{index - 1}"],
+            args=[limit, int(window * 1000), int(elapsed * 1000)],
+        )
+        return RateLimitDecision(bool(int(allowed)), limit, max(0, int(remaining)), max(1, math.ceil(window - elapsed)))
+
+
+def create_limiter(backend: Optional[str] = None) -> Any:
+    """Return a Redis limiter when requested and reachable, else an in-memory one."""
+
+    if (backend or config.RATE_LIMIT_BACKEND) == "redis":
+        client = cache._ensure_redis_client()  # noqa: SLF001 - shared connection
+        if client is not None:
+            return RedisRateLimiter(client)
+        logger.warning("RATE_LIMIT_BACKEND=redis but Redis is unavailable; limiting per instance.")
+    return MemoryRateLimiter()
+
+
+def client_identity(scope: Scope, *, trust_forwarded: bool = False, api_keys: AbstractSet[str] = frozenset()) -> str:
+    """Return ``key:<digest>`` for callers with a known API key, otherwise ``ip:<address>``.
+
+    With *trust_forwarded* the address is the right-most ``X-Forwarded-For``
+    hop: the one the trusted proxy appended, which a client cannot forge.
+    """
+
+    forwarded: Optional[bytes] = None
+    for name, value in scope.get("headers", ()):
+        if name == b"x-api-key" and value and value.decode("latin-1") in api_keys:
+            return "key:" + hashlib.sha256(value).hexdigest()[:32]
+        if name == b"x-forwarded-for":
+            forwarded = value
+    if trust_forwarded and forwarded:
+        hop = forwarded.rsplit(b",", 1)[-1].strip()
+        if hop:
+            return "ip:" + hop.decode("latin-1")
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class RateLimitMiddleware:
+    """Apply per-client limits to requests whose path starts with one of *prefixes*."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        prefixes: Iterable[str] = ("/check-news",),
+        methods: Iterable[str] = ("POST",),
+        limiter: Optional[Any] = None,
+    ) -> None:
+        self.app = app
+        self._limiter = limiter
+        self._prefixes: Tuple[str, ...] = tuple(prefixes)
+        self._methods = frozenset(method.upper() for method in methods)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = config.RATE_LIMIT_REQUESTS
+        if limit <= 0 or not self._guarded(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if self._limiter is None:
+            self._limiter = create_limiter()
+        client = client_identity(
+            scope, trust_forwarded=config.RATE_LIMIT_TRUST_FORWARDED, api_keys=config.RATE_LIMIT_API_KEYS
+        )
+        try:
+            decision = await self._limiter.hit(client, limit=limit, window=config.RATE_LIMIT_WINDOW_SECONDS)
+        except Exception as exc:
+            # Fail open: an unreachable limiter must not take the API down with it.
+            logger.warning("Rate limiter unavailable, allowing request: %s", exc)
+            metrics.increment("rate_limit.errors")
+            await self.app(scope, receive, send)
+            return
+
+        if not decision.allowed:
+            metrics.increment("rate_limit.rejected")
+            await _send_limited(send, decision)
+            return
+
+        extra = decision.headers()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _guarded(self, scope: Scope) -> bool:
+        if scope["type"] != "http":
+            return False
+        path = scope.get("path", "")
+        if path in _ALWAYS_EXEMPT:
+            return False
+        return scope.get("method", "GET").upper() in self._methods and path.startswith(self._prefixes)
+
+
+async def _send_limited(send: Send, decision: RateLimitDecision) -> None:
+    body = json.dumps({"detail": "Rate limit exceeded; retry later."}).encode("utf-8")
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode("ascii")),
+        *decision.headers(),
+    ]
+    await send({"type": "http.response.start", "status": 429, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+__all__ = [
+    "MemoryRateLimiter",
+    "RateLimitDecision",
+    "RateLimitMiddleware",
+    "RedisRateLimiter",
+    "client_identity",
+    "create_limiter",
+]
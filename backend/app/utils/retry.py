@@ -0,0 +1,203 @@
+"""Retry and hedging helpers shared by idempotent upstream GET requests.
+
+Transient failures (dropped connections, timeouts, 502/503/504) are retried with
+decorrelated jitter. An optional hedged duplicate is fired when the first attempt
+is slower than a latency threshold, and the first usable response wins. Every
+attempt, sleep and hedge is bounded by an overall deadline so callers never wait
+longer than their configured budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+
+import httpx
+
+from app import config
+from app.utils import scheduling
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Bounded retry/hedge settings for a single logical upstream call."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 1.0
+    hedge_after: Optional[float] = None
+
+    @classmethod
+    def from_config(cls) -> "RetryPolicy":
+        hedge_after = config.UPSTREAM_HEDGE_AFTER_SECONDS
+        return cls(
+            max_attempts=config.UPSTREAM_RETRY_ATTEMPTS,
+            base_delay=config.UPSTREAM_RETRY_BASE_DELAY_SECONDS,
+            max_delay=config.UPSTREAM_RETRY_MAX_DELAY_SECONDS,
+            hedge_after=hedge_after if hedge_after > 0 else None,
+        )
+
+    def next_delay(self, previous: float) -> float:
+        """Return the next sleep using AWS-style decorrelated jitter."""
+
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+def is_retryable_response(response: httpx.Response) -> bool:
+    return response.status_code in _RETRYABLE_STATUS_CODES
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    policy: Optional[RetryPolicy] = None,
+    timeout: Optional[float] = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Issue an idempotent GET through :func:`call_with_retry`.
+
+    *timeout* is the overall budget for every attempt combined; it defaults to
+    the client's own timeout so existing per-provider settings keep their meaning.
+    """
+
+    budget = timeout if timeout is not None else _client_budget(client)
+    return await call_with_retry(lambda: client.get(url, **kwargs), policy=policy, timeout=budget)
+
+
+async def call_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    policy: Optional[RetryPolicy] = None,
+    timeout: Optional[float] = None,
+) -> httpx.Response:
+    """Run *send* until it yields a non-retryable response or the budget is spent.
+
+    The last retryable response is returned as-is so callers keep using
+    ``raise_for_status``; the last transport error is re-raised when no response
+    was ever received. Each attempt (and hedge) holds an upstream scheduler slot
+    for the current priority class; backoff sleeps do not.
+    """
+
+    scheduled = functools.partial(scheduling.run_upstream, send)
+    active = policy or RetryPolicy.from_config()
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    attempts = max(1, active.max_attempts)
+    delay = active.base_delay
+    last_response: Optional[httpx.Response] = None
+    last_error: Optional[BaseException] = None
+
+    for attempt in range(1, attempts + 1):
+        remaining = _remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            break
+        try:
+            response = await _attempt(scheduled, active.hedge_after, remaining)
+        except (httpx.TransportError, asyncio.TimeoutError) as exc:
+            if attempt >= attempts:
+                raise
+            logger.info("Upstream attempt %d/%d failed: %s", attempt, attempts, exc)
+            last_error = exc
+        else:
+            if not is_retryable_response(response) or attempt >= attempts:
+                return response
+            logger.info("Upstream attempt %d/%d returned HTTP %d", attempt, attempts, response.status_code)
+            last_response = response
+
+        delay = active.next_delay(delay)
+        remaining = _remaining(deadline)
+        if remaining is not None and remaining <= delay:
+            break
+        await asyncio.sleep(delay)
+
+    if last_response is not None:
+        return last_response
+    if last_error is None or isinstance(last_error, asyncio.TimeoutError):
+        raise httpx.TimeoutException("Upstream deadline exceeded") from last_error
+    raise last_error
+
+
+async def _attempt(
+    send: Callable[[], Awaitable[httpx.Response]],
+    hedge_after: Optional[float],
+    remaining: Optional[float],
+) -> httpx.Response:
+    if hedge_after is None or (remaining is not None and remaining <= hedge_after):
+        return await asyncio.wait_for(send(), timeout=remaining)
+
+    # Every started request is cancelled on the way out, including when the
+    # caller itself is cancelled while waiting on the primary.
+    started: List[asyncio.Future[httpx.Response]] = []
+    retryable: Optional[httpx.Response] = None
+    last_exc: Optional[BaseException] = None
+    try:
+        primary = asyncio.ensure_future(send())
+        started.append(primary)
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        logger.debug("Upstream attempt exceeded %.3fs; sending hedged request.", hedge_after)
+        started.append(asyncio.ensure_future(send()))
+        pending = set(started)
+        hedge_deadline = _deadline_from(remaining, hedge_after)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=_remaining(hedge_deadline),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                raise asyncio.TimeoutError()
+            for task in done:
+                exc = task.exception()
+                if exc is None:
+                    response = task.result()
+                    if not is_retryable_response(response):
+                        return response
+                    retryable = response
+                else:
+                    last_exc = exc
+        if retryable is not None:
+            return retryable
+        assert last_exc is not None
+        raise last_exc
+    finally:
+        for task in started:
+            if not task.done():
+                task.cancel()
+
+
+def _client_budget(client: httpx.AsyncClient) -> Optional[float]:
+    timeout = client.timeout
+    return timeout.read if timeout.read is not None else None
+
+
+def _deadline_from(remaining: Optional[float], elapsed: float) -> Optional[float]:
+    if remaining is None:
+        return None
+    return time.monotonic() + max(0.0, remaining - elapsed)
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+__all__ = [
+    "RetryPolicy",
+    "call_with_retry",
+    "get_with_retry",
+    "is_retryable_response",
+]
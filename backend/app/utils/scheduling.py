@@ -0,0 +1,210 @@
+"""Priority classes and a weighted-fair scheduler for upstream provider calls.
+
+Every request runs as ``interactive`` (the default) or ``bulk``. The class comes
+from the ``X-Priority`` header, except that API keys listed in
+``BULK_API_KEYS`` are always ``bulk``. It is carried in a context variable, so
+tasks spawned while handling the request inherit it.
+
+All upstream calls share ``UPSTREAM_CONCURRENCY`` slots. When slots are
+contended, waiting classes are served by weighted fair queuing
+(``UPSTREAM_INTERACTIVE_WEIGHT`` : ``UPSTREAM_BULK_WEIGHT``). Bulk work may
+never hold more than ``UPSTREAM_BULK_MAX_SHARE`` of the slots, so interactive
+calls always find spare capacity even during a backfill.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, Optional, TypeVar
+
+from app import config
+from app.utils import metrics
+from app.utils.admission import ASGIApp, Receive, Scope, Send
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITY_CLASSES = (INTERACTIVE, BULK)
+
+_T = TypeVar("_T")
+_CURRENT: ContextVar[str] = ContextVar("priority_class", default=INTERACTIVE)
+
+
+def current_priority() -> str:
+    return _CURRENT.get()
+
+
+@contextlib.contextmanager
+def use_priority(priority: str) -> Iterator[None]:
+    """Run the enclosed block (and tasks it creates) under *priority*."""
+
+    token = _CURRENT.set(priority if priority in PRIORITY_CLASSES else INTERACTIVE)
+    try:
+        yield
+    finally:
+        _CURRENT.reset(token)
+
+
+def priority_for(headers: Any) -> str:
+    """Resolve the priority class from raw ASGI ``(name, value)`` header pairs."""
+
+    requested: Optional[str] = None
+    for name, value in headers:
+        if name == b"x-api-key" and value.decode("latin-1") in config.BULK_API_KEYS:
+            return BULK
+        if name == b"x-priority":
+            requested = value.decode("latin-1").strip().lower()
+    return requested if requested in PRIORITY_CLASSES else INTERACTIVE
+
+
+class PriorityMiddleware:
+    """Set the priority class for each HTTP request from its headers."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with use_priority(priority_for(scope.get("headers", ()))):
+            await self.app(scope, receive, send)
+
+
+class WeightedFairScheduler:
+    """Hand out a fixed number of slots across priority classes.
+
+    Each class has a virtual clock that advances by ``1 / weight`` per grant;
+    the waiting class with the smallest clock goes next. A class returning from
+    idle starts at the current virtual time, so it cannot bank credit. Settings
+    default to the ``UPSTREAM_*`` config and are read on every call.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: Optional[int] = None,
+        weights: Optional[Dict[str, float]] = None,
+        bulk_max_share: Optional[float] = None,
+    ) -> None:
+        self._capacity = capacity
+        self._weights = weights
+        self._bulk_max_share = bulk_max_share
+        self._waiters: Dict[str, Deque[asyncio.Future[None]]] = {name: deque() for name in PRIORITY_CLASSES}
+        self._in_flight: Dict[str, int] = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._virtual: Dict[str, float] = dict.fromkeys(PRIORITY_CLASSES, 0.0)
+        self._now = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity if self._capacity is not None else config.UPSTREAM_CONCURRENCY
+
+    def in_flight(self, priority: str) -> int:
+        return self._in_flight[priority]
+
+    def waiting(self, priority: str) -> int:
+        return len(self._waiters[priority])
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Optional[str] = None) -> AsyncIterator[None]:
+        if self.capacity <= 0:
+            yield
+            return
+        name = priority or current_priority()
+        await self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    async def acquire(self, priority: str) -> None:
+        queue = self._waiters[priority]
+        if not queue:
+            self._virtual[priority] = max(self._virtual[priority], self._now)
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        self._dispatch()
+        if waiter.done():
+            return
+
+        started = time.perf_counter()
+        self._publish(priority)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(priority)  # granted just as we were cancelled
+            elif waiter in queue:
+                queue.remove(waiter)
+                self._publish(priority)
+            raise
+        finally:
+            metrics.observe(f"scheduler.upstream.{priority}.wait_seconds", time.perf_counter() - started)
+
+    def release(self, priority: str) -> None:
+        self._in_flight[priority] = max(0, self._in_flight[priority] - 1)
+        self._dispatch()
+        self._publish(priority)
+
+    def _dispatch(self) -> None:
+        capacity = self.capacity
+        while sum(self._in_flight.values()) < capacity:
+            candidates = [name for name in PRIORITY_CLASSES if self._waiters[name] and self._eligible(name, capacity)]
+            if not candidates:
+                return
+            name = min(candidates, key=lambda candidate: (self._virtual[candidate], -self._weight(candidate)))
+            waiter = self._waiters[name].popleft()
+            if waiter.done():
+                continue
+            self._now = self._virtual[name]
+            self._virtual[name] += 1.0 / self._weight(name)
+            self._in_flight[name] += 1
+            waiter.set_result(None)
+            self._publish(name)
+
+    def _eligible(self, priority: str, capacity: int) -> bool:
+        if priority != BULK:
+            return True
+        share = self._bulk_max_share if self._bulk_max_share is not None else config.UPSTREAM_BULK_MAX_SHARE
+        return self._in_flight[BULK] < max(1, int(capacity * share))
+
+    def _weight(self, priority: str) -> float:
+        if self._weights is not None:
+            return max(self._weights.get(priority, 1.0), 1e-6)
+        weight = config.UPSTREAM_BULK_WEIGHT if priority == BULK else config.UPSTREAM_INTERACTIVE_WEIGHT
+        return max(weight, 1e-6)
+
+    def _publish(self, priority: str) -> None:
+        metrics.set_gauge(f"scheduler.upstream.{priority}.in_flight", self._in_flight[priority])
+        metrics.set_gauge(f"scheduler.upstream.{priority}.waiting", len(self._waiters[priority]))
+
+
+_UPSTREAM = WeightedFairScheduler()
+
+
+def upstream_slot(priority: Optional[str] = None) -> contextlib.AbstractAsyncContextManager[None]:
+    """Hold one shared upstream slot for the current (or given) priority class."""
+
+    return _UPSTREAM.slot(priority)
+
+
+async def run_upstream(call: Callable[[], Awaitable[_T]]) -> _T:
+    async with upstream_slot():
+        return await call()
+
+
+__all__ = [
+    "BULK",
+    "INTERACTIVE",
+    "PRIORITY_CLASSES",
+    "PriorityMiddleware",
+    "WeightedFairScheduler",
+    "current_priority",
+    "priority_for",
+    "run_upstream",
+    "upstream_slot",
+    "use_priority",
+]
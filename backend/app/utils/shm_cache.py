@@ -0,0 +1,249 @@
+"""Cache backend shared by every worker process on one host, without Redis.
+
+Entries live in a ``multiprocessing.shared_memory`` segment named after the
+namespace and the table layout, so the first worker creates it and the rest
+attach to it, while a deploy that changes the layout gets a fresh segment. The
+segment is an open-addressing hash table split into buckets of
+``_WAYS`` fixed-size slots. A key hashes to one bucket and is probed linearly
+within it, so each operation touches exactly one bucket. Buckets are guarded by
+``fcntl`` byte-range locks on a companion lock file: one byte per bucket,
+shared across processes. A full bucket evicts its expired or least recently
+used slot. Values are stored as JSON (like ``RedisCache``) with a wall-clock
+expiry; values larger than a slot are not cached.
+
+POSIX only (``fcntl``); ``create_cache`` falls back to the in-process ``Cache``
+elsewhere or when an existing segment has a different layout.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, List, Optional, Tuple
+
+from app.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"FNPSHM01"
+# magic, bucket count, slot size
+_HEADER = struct.Struct("<8sII")
+# state, key length, value length, key hash, expires at, last access
+_SLOT = struct.Struct("<BxHIQdd")
+_WAYS = 8
+_EMPTY, _USED = 0, 1
+
+
+class SharedMemoryLayoutError(RuntimeError):
+    """An existing segment under this name was created with a different layout."""
+
+
+class SharedMemoryCache:
+    """TTL cache in a shared memory segment, with LRU eviction per bucket."""
+
+    def __init__(self, name: str, *, ttl: int = 600, max_items: int = 256, slot_bytes: int = 16384) -> None:
+        self._default_ttl = max(1, int(ttl))
+        self._buckets, self._slot_bytes = _layout(max_items, slot_bytes)
+        self._name = name
+        size = _HEADER.size + self._buckets * _WAYS * self._slot_bytes
+        self._shm, created = _open_segment(name, size)
+        self._buf = self._shm.buf
+        if created:
+            _HEADER.pack_into(self._buf, 0, _MAGIC, self._buckets, self._slot_bytes)
+        else:
+            magic, buckets, slot_bytes_found = _read_header(self._buf)
+            if (magic, buckets, slot_bytes_found) != (_MAGIC, self._buckets, self._slot_bytes):
+                self._shm.close()
+                raise SharedMemoryLayoutError(
+                    f"shared memory segment {name!r} has layout {buckets}x{slot_bytes_found}, "
+                    f"expected {self._buckets}x{self._slot_bytes}"
+                )
+        self._lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    @property
+    def default_ttl(self) -> int:
+        return self._default_ttl
+
+    @property
+    def max_items(self) -> int:
+        return self._buckets * _WAYS
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._get(key, time.time())
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        now = time.time()
+        return [self._get(key, now) for key in keys]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        encoded_key = key.encode("utf-8")
+        payload = json.dumps(value, separators=(",", ":"), default=repr).encode("utf-8")
+        if _SLOT.size + len(encoded_key) + len(payload) > self._slot_bytes:
+            metrics.increment("cache.shared_memory.oversized")
+            return
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None and ttl > 0 else self._default_ttl)
+        key_hash, bucket = self._locate(encoded_key)
+        with self._locked(bucket):
+            target = self._find(bucket, key_hash, encoded_key)
+            if target is None:
+                target = self._victim(bucket, now)
+            offset = self._slot_offset(bucket, target)
+            start = offset + _SLOT.size
+            self._buf[start : start + len(encoded_key)] = encoded_key
+            self._buf[start + len(encoded_key) : start + len(encoded_key) + len(payload)] = payload
+            _SLOT.pack_into(self._buf, offset, _USED, len(encoded_key), len(payload), key_hash, expires_at, now)
+
+    async def delete(self, key: str) -> None:
+        encoded_key = key.encode("utf-8")
+        key_hash, bucket = self._locate(encoded_key)
+        with self._locked(bucket):
+            way = self._find(bucket, key_hash, encoded_key)
+            if way is not None:
+                self._buf[self._slot_offset(bucket, way)] = _EMPTY
+
+    async def clear(self) -> None:
+        for bucket in range(self._buckets):
+            with self._locked(bucket):
+                for way in range(_WAYS):
+                    self._buf[self._slot_offset(bucket, way)] = _EMPTY
+
+    def close(self) -> None:
+        self._buf = None  # type: ignore[assignment]
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self) -> None:
+        """Remove the segment name and lock file; attached processes keep their mapping."""
+
+        # SharedMemory.unlink() unregisters from the resource tracker, which
+        # _open_segment already did; register again so the calls stay paired.
+        try:
+            resource_tracker.register(self._shm._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+            self._shm.unlink()
+            os.unlink(self._lock_path)
+        except FileNotFoundError:
+            pass
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        encoded_key = key.encode("utf-8")
+        key_hash, bucket = self._locate(encoded_key)
+        with self._locked(bucket):
+            way = self._find(bucket, key_hash, encoded_key)
+            if way is None:
+                return None
+            offset = self._slot_offset(bucket, way)
+            _, key_len, value_len, _, expires_at, _ = _SLOT.unpack_from(self._buf, offset)
+            if expires_at <= now:
+                self._buf[offset] = _EMPTY
+                return None
+            struct.pack_into("<d", self._buf, offset + _SLOT.size - 8, now)
+            start = offset + _SLOT.size + key_len
+            raw = bytes(self._buf[start : start + value_len])
+        return json.loads(raw)
+
+    def _locate(self, encoded_key: bytes) -> Tuple[int, int]:
+        key_hash = int.from_bytes(hashlib.blake2b(encoded_key, digest_size=8).digest(), "little")
+        return key_hash, key_hash % self._buckets
+
+    def _slot_offset(self, bucket: int, way: int) -> int:
+        return _HEADER.size + (bucket * _WAYS + way) * self._slot_bytes
+
+    def _find(self, bucket: int, key_hash: int, encoded_key: bytes) -> Optional[int]:
+        for way in range(_WAYS):
+            offset = self._slot_offset(bucket, way)
+            state, key_len, _, slot_hash, _, _ = _SLOT.unpack_from(self._buf, offset)
+            if state != _USED or slot_hash != key_hash or key_len != len(encoded_key):
+                continue
+            start = offset + _SLOT.size
+            if self._buf[start : start + key_len] == encoded_key:
+                return way
+        return None
+
+    def _victim(self, bucket: int, now: float) -> int:
+        oldest_way, oldest_access = 0, float("inf")
+        for way in range(_WAYS):
+            state, _, _, _, expires_at, touched = _SLOT.unpack_from(self._buf, self._slot_offset(bucket, way))
+            if state != _USED or expires_at <= now:
+                return way
+            if touched < oldest_access:
+                oldest_way, oldest_access = way, touched
+        metrics.increment("cache.shared_memory.evictions")
+        return oldest_way
+
+    def _locked(self, bucket: int) -> "_BucketLock":
+        return _BucketLock(self._lock_fd, bucket)
+
+
+class _BucketLock:
+    __slots__ = ("_fd", "_bucket")
+
+    def __init__(self, fd: int, bucket: int) -> None:
+        self._fd = fd
+        self._bucket = bucket
+
+    def __enter__(self) -> None:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, self._bucket, os.SEEK_SET)
+
+    def __exit__(self, *_exc: object) -> None:
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, self._bucket, os.SEEK_SET)
+
+
+def _read_header(buf: memoryview) -> Tuple[bytes, int, int]:
+    # A worker that created the segment a moment ago may not have written it yet.
+    for _ in range(100):
+        header = _HEADER.unpack_from(buf, 0)
+        if header[0] == _MAGIC:
+            break
+        time.sleep(0.001)
+    return header
+
+
+def _open_segment(name: str, size: int) -> Tuple[shared_memory.SharedMemory, bool]:
+    try:
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        created = True
+    except FileExistsError:
+        segment = shared_memory.SharedMemory(name=name)
+        created = False
+    # The segment outlives any single worker; stop the resource tracker from
+    # unlinking it when the process that happened to create it exits.
+    try:
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+    except Exception:  # pragma: no cover - tracker internals differ by version
+        pass
+    return segment, created
+
+
+def _layout(max_items: int, slot_bytes: int) -> Tuple[int, int]:
+    buckets = max(1, -(-max(1, int(max_items)) // _WAYS))
+    return buckets, max(_SLOT.size + 64, int(slot_bytes))
+
+
+def segment_name(prefix: str, namespace: str, *, max_items: int, slot_bytes: int) -> str:
+    """Short, filesystem-safe segment name for *namespace* (POSIX limits names to ~30 chars).
+
+    The format version and table layout are part of the digest, so a deploy
+    that changes either one creates a new segment rather than tripping over
+    the previous deploy's.
+    """
+
+    buckets, slot_size = _layout(max_items, slot_bytes)
+    layout = f"{namespace}\0{_MAGIC.decode('ascii')}\0{buckets}x{slot_size}"
+    digest = hashlib.blake2b(layout.encode("utf-8"), digest_size=6).hexdigest()
+    return f"{prefix[:16]}-{digest}"
+
+
+__all__ = [
+    "SharedMemoryCache",
+    "SharedMemoryLayoutError",
+    "segment_name",
+]
@@ -0,0 +1,42 @@
+"""Request-scoped view of a submitted text. The whitespace-normalised form and
+its SHA-256 digest are computed once per request and shared by every cache
+key builder and service, instead of each re-normalising and re-hashing a
+possibly very large article.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass(frozen=True, slots=True)
+class TextContext:
+    raw: str
+    normalised: str
+    digest: str
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextContext":
+        normalised = " ".join(text.split())
+        return cls(raw=text, normalised=normalised, digest=hashlib.sha256(normalised.encode("utf-8")).hexdigest())
+
+    def __str__(self) -> str:
+        return self.normalised
+
+
+TextLike = Union[str, TextContext]
+
+
+def of(text: TextLike) -> TextContext:
+    """Return *text* unchanged if it already is a context, else build one."""
+
+    return text if isinstance(text, TextContext) else TextContext.from_text(text)
+
+
+__all__ = [
+    "TextContext",
+    "TextLike",
+    "of",
+]
@@ -0,0 +1 @@
+"""Micro-benchmarks for the backend application (run with ``python -m benchmarks.<name>``)."""
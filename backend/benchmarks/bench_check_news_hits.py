@@ -0,0 +1,109 @@
+"""Requests per second for ``POST /check-news`` when every lookup is a cache hit,
+driven in-process through the ASGI app (no sockets), plus the cost of building
+and serialising one response the old way (``model_validate`` followed by a
+``response_model`` round trip) against ``_assemble`` + ``model_dump_json``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_check_news_hits
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+
+from app import config
+from app.main import app
+from app.routes import check_news as route
+from app.services import classifier_service, factcheck_service, news_service
+
+_TEXT = "Officials said the council approved the budget after a public hearing."
+_REQUESTS = 2_000
+_SOURCES: List[Dict[str, Any]] = [
+    {
+        "title": f"Council approves budget {index}",
+        "source": "Reuters",
+        "url": f"https://example.com/{index}",
+        "publishedAt": "2026-10-01T00:00:00Z",
+        "snippet": "The council approved the budget on Tuesday.",
+    }
+    for index in range(3)
+]
+
+
+async def _prime() -> None:
+    fact_key = factcheck_service.query_claimreview.cache_key(_TEXT, limit=config.FACTCHECK_DEFAULT_LIMIT)
+    news_key = news_service.search_news.cache_key(_TEXT, limit=config.NEWS_DEFAULT_LIMIT)
+    await factcheck_service.query_claimreview.cache_backend.set(fact_key, [])
+    await news_service.search_news.cache_backend.set(news_key, _SOURCES)
+    await classifier_service.classify_text(_TEXT)
+
+
+async def _requests_per_second(client: httpx.AsyncClient) -> float:
+    payload = {"text": _TEXT}
+    await client.post("/check-news", json=payload)
+    started = time.perf_counter()
+    for _ in range(_REQUESTS):
+        response = await client.post("/check-news", json=payload)
+        response.raise_for_status()
+    return _REQUESTS / (time.perf_counter() - started)
+
+
+def _legacy_build() -> bytes:
+    data = {
+        "verdict": "real",
+        "confidence": 0.85,
+        "evidence": [],
+        "sources": _SOURCES,
+        "claim_reviews": [],
+        "classifier": route.ClassifierResult(provider="local", score=0.2, explanation="Found 2 reputable cues"),
+        "notes": "Mock notes. News results added. Classifier provider local executed.",
+    }
+    model = route.CheckNewsResponse.model_validate(data)
+    revalidated = route.CheckNewsResponse.model_validate(model.model_dump())
+    return json.dumps(jsonable_encoder(revalidated)).encode("utf-8")
+
+
+def _fast_build() -> bytes:
+    model = route._assemble(  # noqa: SLF001
+        _TEXT,
+        [],
+        _SOURCES,
+        "News results added.",
+        {"provider": "local", "score": 0.2, "explanation": "Found 2 reputable cues"},
+    )
+    return model.model_dump_json().encode("utf-8")
+
+
+def _per_call_us(func: Any, repeats: int = 20_000) -> float:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - started) / repeats * 1_000_000
+
+
+async def main() -> None:
+    await _prime()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        with_response_cache = await _requests_per_second(client)
+        config.CHECK_NEWS_RESPONSE_CACHE_TTL_SECONDS = 0  # type: ignore[misc]
+        stage_caches_only = await _requests_per_second(client)
+
+    print(f"{'workload':<32} {'req/s':>10}")
+    print(f"{'response cache hit':<32} {with_response_cache:>10.0f}")
+    print(f"{'stage caches hit':<32} {stage_caches_only:>10.0f}")
+    print()
+    print(f"{'response build':<32} {'us/call':>10}")
+    print(f"{'model_validate + re-validate':<32} {_per_call_us(_legacy_build):>10.1f}")
+    print(f"{'_assemble + model_dump_json':<32} {_per_call_us(_fast_build):>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""Throughput benchmark for bulk local scoring. Compares a per-text loop over the
+single-text scorer with ``classify_many`` for batch sizes from 1 to 10k.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_classify_many [--model model.bin]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List, Sequence
+
+from app import config
+from app.services import classifier_service
+
+_WORDS = (
+    "shocking secret exposed official study according research reported council budget "
+    "hoax cover-up analysis evidence journal market rates vaccine election storm outrage"
+).split()
+_BATCH_SIZES = (1, 10, 100, 1_000, 10_000)
+
+
+def _headlines(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 14))) for _ in range(count)]
+
+
+def _throughput(func: Callable[[Sequence[str]], object], texts: Sequence[str], min_seconds: float = 0.2) -> float:
+    rounds = 0
+    started = time.perf_counter()
+    while True:
+        func(texts)
+        rounds += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return rounds * len(texts) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk local classification.")
+    parser.add_argument("--model", help="Linear model file; benchmarks the heuristic when omitted.")
+    args = parser.parse_args()
+
+    if args.model:
+        config.CLASSIFIER_PROVIDER = "linear"  # type: ignore[misc]
+        config.LINEAR_MODEL_PATH = args.model  # type: ignore[misc]
+        model = classifier_service._get_linear_model()  # noqa: SLF001
+
+        def single(texts: Sequence[str]) -> object:
+            return [model.score(text) for text in texts]
+
+    else:
+
+        def single(texts: Sequence[str]) -> object:
+            return [classifier_service._classify_locally(text) for text in texts]  # noqa: SLF001
+
+    print(f"{'batch':>8} {'single texts/s':>16} {'batch texts/s':>16} {'speedup':>8}")
+    for size in _BATCH_SIZES:
+        texts = _headlines(size)
+        single_rate = _throughput(single, texts)
+        batch_rate = _throughput(classifier_service.classify_many, texts)
+        print(f"{size:>8} {single_rate:>16,.0f} {batch_rate:>16,.0f} {batch_rate / single_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compares the compiled phrase lexicon with the original split/strip/set-lookup
+tokenizer on 1KB-1MB articles, for the bundled lexicon and for a synthetic
+5,000-term lexicon. The legacy tokenizer cannot match multi-word phrases at
+all; the numbers show what the single-pass scan costs in exchange.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_lexicon
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, Dict, Set
+
+from app.services import lexicon
+
+_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+_FILLER = (
+    "the council said on tuesday that the budget shocking would be reviewed according to "
+    "officials while a secret report exposed the cover-up in a peer reviewed study "
+).split()
+
+
+def _article(size: int, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(_FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def _legacy_scanner(sensational: Set[str], reputable: Set[str]) -> Callable[[str], int]:
+    def scan(text: str) -> int:
+        words = [token.strip(".,!?;:\"'()").lower() for token in text.split() if token.strip()]
+        return sum(1 for word in words if word in sensational) - sum(1 for word in words if word in reputable)
+
+    return scan
+
+
+def _best_of(func: Callable[[str], object], text: str, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _synthetic_terms(count: int, seed: int = 3) -> Dict[str, float]:
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    terms: Dict[str, float] = {}
+    while len(terms) < count:
+        words = ["".join(rng.choice(letters) for _ in range(rng.randint(4, 8))) for _ in range(rng.randint(1, 3))]
+        terms[" ".join(words)] = 0.5
+    return terms
+
+
+def main() -> None:
+    bundled = lexicon.Lexicon.load()
+    bundled_terms = dict(bundled.terms())
+    large_terms = {**_synthetic_terms(5_000), **{term: abs(weight) for term, weight in bundled_terms.items()}}
+    large = lexicon.Lexicon(large_terms, {}, version="synthetic")
+
+    def single_words(terms: Dict[str, float], positive: bool) -> Set[str]:
+        return {term for term, weight in terms.items() if " " not in term and (weight >= 0) == positive}
+
+    legacy_small = _legacy_scanner(single_words(bundled_terms, True), single_words(bundled_terms, False))
+    legacy_large = _legacy_scanner(set(large_terms), set())
+
+    print(f"{'article':>9} {'terms':>6} {'legacy ms':>10} {'lexicon ms':>11} {'lexicon MB/s':>13}")
+    for size in _SIZES:
+        text = _article(size)
+        for label, compiled, legacy in (("bundled", bundled, legacy_small), ("5k", large, legacy_large)):
+            legacy_seconds = _best_of(legacy, text)
+            lexicon_seconds = _best_of(compiled.scan, text)
+            throughput = size / lexicon_seconds / 1_000_000
+            print(
+                f"{size:>9,} {label:>6} {legacy_seconds * 1000:>10.2f} {lexicon_seconds * 1000:>11.2f} {throughput:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Per-request overhead of ``RateLimitMiddleware`` with the in-memory limiter,
+measured around a no-op ASGI app so only identification, the sliding window
+check and header injection are timed. Clients rotate through a pool so the
+counters stay under the limit.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_rate_limit
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from app import config
+from app.utils.rate_limit import MemoryRateLimiter, RateLimitMiddleware
+
+_REQUESTS = 200_000
+_CLIENTS = 10_000
+
+
+async def _noop_app(scope: dict, receive: object, send: object) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _send(message: dict) -> None:
+    return None
+
+
+async def _receive() -> dict:
+    return {"type": "http.request"}
+
+
+def _scopes(api_key: bool) -> list[dict]:
+    scopes = []
+    for index in range(_CLIENTS):
+        headers = [(b"content-type", b"application/json"), (b"user-agent", b"bench")]
+        if api_key:
+            headers.append((b"x-api-key", f"key-{index}".encode()))
+        address = f"10.0.{index // 256}.{index % 256}"
+        scopes.append({"type": "http", "method": "POST", "path": "/check-news", "client": (address, 1), "headers": headers})
+    return scopes
+
+
+async def _time(app: object, scopes: list[dict]) -> float:
+    started = time.perf_counter()
+    for index in range(_REQUESTS):
+        await app(scopes[index % _CLIENTS], _receive, _send)  # type: ignore[operator]
+    return (time.perf_counter() - started) / _REQUESTS
+
+
+async def main() -> None:
+    limited = RateLimitMiddleware(_noop_app, limiter=MemoryRateLimiter())
+    limit = max(config.RATE_LIMIT_REQUESTS, _REQUESTS)
+    config.RATE_LIMIT_REQUESTS = limit  # type: ignore[misc]
+    config.RATE_LIMIT_API_KEYS = frozenset(f"key-{index}" for index in range(_CLIENTS))  # type: ignore[misc]
+    for label, api_key in (("by IP", False), ("by API key", True)):
+        scopes = _scopes(api_key)
+        baseline = await _time(_noop_app, scopes)
+        with_limit = await _time(limited, scopes)
+        print(f"{label:>11}: {(with_limit - baseline) * 1e6:6.2f} µs/request overhead")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Per-request cost of preparing cache keys and search queries for one input,
+before and after sharing a ``TextContext``. The "before" column reproduces the
+previous key builders: each one re-normalised the text, the classifier hashed
+it, the response key hashed the full normalised text again inside
+``make_key``, query extraction re-normalised it, and ``cached`` bound the call
+signature twice.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_text_context
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import random
+import time
+from typing import Callable
+
+from app import config
+from app.routes import check_news as route
+from app.services import classifier_service, query_extraction
+from app.utils import cache
+from app.utils.text_context import TextContext
+
+_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+_WORDS = "officials said the council approved a budget of 42 million after a report found shocking errors".split()
+_SIGNATURE = inspect.signature(classifier_service.classify_text.__wrapped__)
+
+
+def _article(size: int) -> str:
+    rng = random.Random(size)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word + ("." if rng.random() < 0.08 else ""))
+        length += len(word) + 1
+    return "  ".join(words)[:size]
+
+
+def _before(text: str) -> None:
+    for _ in range(2):
+        _SIGNATURE.bind_partial(text)
+    normalised = " ".join(text.split())
+    digest = hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+    cache.make_key("classifier", config.CLASSIFIER_PROVIDER, classifier_service.active_model_version(), digest)
+    cache.make_key("check_news.response", " ".join(text.split()), config.NEWS_PROVIDER)
+    query_extraction.extract(text)
+
+
+def _after(text: str) -> None:
+    context = TextContext.from_text(text)
+    classifier_service._make_cache_key(context)  # noqa: SLF001
+    route._response_cache_key(context)  # noqa: SLF001
+    query_extraction.extract(context)
+
+
+def _best_of(func: Callable[[str], None], text: str, repeats: int = 7) -> float:
+    func(text)  # warm the extraction cache so only key preparation is timed
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    print(f"{'input':>10} {'before ms':>10} {'after ms':>9} {'saved':>7}")
+    for size in _SIZES:
+        text = _article(size)
+        before = _best_of(_before, text)
+        after = _best_of(_after, text)
+        print(f"{size:>10,} {before * 1000:>10.3f} {after * 1000:>9.3f} {1 - after / before:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
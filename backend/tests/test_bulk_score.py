@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app import bulk_score, config
+
+TEXTS = [
+    "Shocking secret cure exposed",
+    "City council approves budget, officials said",
+    "You won't believe this hoax",
+    "Study published in peer reviewed journal",
+    "Miracle pill melts fat overnight",
+]
+
+
+@pytest.fixture()
+def corpus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "local")
+    path = tmp_path / "articles.jsonl"
+    path.write_text("".join(json.dumps({"id": f"a{i}", "text": text}) + "\n" for i, text in enumerate(TEXTS)))
+    return path
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_offline_scoring_writes_rows_in_order(corpus: Path, tmp_path: Path) -> None:
+    output = tmp_path / "verdicts.jsonl"
+
+    assert bulk_score.main([str(corpus), str(output), "--workers", "2", "--batch-size", "2"]) == 0
+
+    rows = _read(output)
+    assert [row["id"] for row in rows] == [f"a{i}" for i in range(len(TEXTS))]
+    assert [row["classifier"] for row in rows] == bulk_score.classifier_service.classify_many(TEXTS)
+    assert {row["verdict"] for row in rows} <= {"fake", "real", "unsure"}
+
+
+def test_resume_skips_checkpointed_rows(corpus: Path, tmp_path: Path) -> None:
+    output = tmp_path / "verdicts.jsonl"
+    bulk_score.main([str(corpus), str(output), "--workers", "1", "--batch-size", "2"])
+    complete = output.read_bytes()
+
+    # Simulate a crash after two rows were checkpointed plus a torn third line.
+    lines = complete.splitlines(keepends=True)
+    kept = b"".join(lines[:2])
+    output.write_bytes(kept + lines[2][:10])
+    bulk_score._Checkpoint(output).save(2, len(kept))  # noqa: SLF001
+
+    bulk_score.main([str(corpus), str(output), "--workers", "1", "--batch-size", "2"])
+
+    assert output.read_bytes() == complete
+
+
+def test_with_lookups_uses_full_pipeline(corpus: Path, tmp_path: Path) -> None:
+    output = tmp_path / "verdicts.jsonl"
+
+    bulk_score.main([str(corpus), str(output), "--with-lookups", "--batch-size", "3", "--no-resume"])
+
+    rows = _read(output)
+    assert len(rows) == len(TEXTS)
+    assert {"verdict", "confidence", "sources", "claim_reviews", "classifier", "notes"} <= rows[0].keys()
+
+
+def test_malformed_rows_are_recorded_without_shifting_row_numbers(corpus: Path, tmp_path: Path) -> None:
+    lines = corpus.read_text().splitlines(keepends=True)
+    corpus.write_text(lines[0] + '{"id": "broken", "text": \n' + "[1, 2]\n" + "".join(lines[1:]))
+    output = tmp_path / "verdicts.jsonl"
+
+    assert bulk_score.main([str(corpus), str(output), "--workers", "1", "--batch-size", "2"]) == 0
+
+    rows = _read(output)
+    assert [row["row"] for row in rows] == list(range(len(TEXTS) + 2))
+    assert [row["id"] for row in rows] == ["a0", None, None] + [f"a{i}" for i in range(1, len(TEXTS))]
+    assert "error" in rows[1] and "error" in rows[2]
+    assert [row["classifier"] for row in rows if "error" not in row] == bulk_score.classifier_service.classify_many(TEXTS)
@@ -4,16 +4,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+
+from typing import AsyncIterator
+
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.routes import check_news as check_news_route
+from app.services import classifier_service
+from app.utils import cache, metrics, text_context
 
 MOCK_REQUEST = {"text": "Sample headline about space exploration."}
 EXPECTED_KEYS = {"verdict", "confidence", "evidence", "sources", "claim_reviews", "classifier", "notes"}
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def _clear_all_caches() -> AsyncIterator[None]:
+    await cache.clear_registered_caches()
+    yield
+    await cache.clear_registered_caches()
+
+
 def test_check_news_returns_mock_payload() -> None:
     """POST /check-news should emit every expected field from the mock."""
     client = TestClient(app)
@@ -77,3 +93,225 @@ def test_check_news_blends_classifier_when_no_claimreview(monkeypatch: pytest.Mo
     assert pytest.approx(payload["confidence"], abs=1e-6) == 0.9
     assert payload["classifier"]["provider"] == "local"
     assert payload["classifier"]["score"] == pytest.approx(0.92)
+
+
+def test_check_news_batch_deduplicates_and_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    classified: list[str] = []
+
+    async def _classify(text, **_kwargs):
+        classified.append(str(text))
+        return {"provider": "local", "score": 0.1 if "council" in str(text).lower() else 0.95}
+
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _async_return([]))
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _async_return([]))
+    monkeypatch.setattr(check_news_route.classifier_service, "classify_text", _classify)
+
+    texts = ["Shocking hoax exposed", "Council approves budget", "  Shocking   hoax exposed ", "   "]
+    response = client.post("/check-news/batch", json={"texts": texts})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2, 3]
+    assert sorted(classified) == ["Council approves budget", "Shocking hoax exposed"]
+    assert results[0]["result"] == results[2]["result"]
+    assert results[0]["result"]["classifier"]["score"] == pytest.approx(0.95)
+    assert results[1]["result"]["classifier"]["score"] == pytest.approx(0.1)
+    assert results[3]["result"] is None and results[3]["error"]
+
+
+def test_check_news_batch_rejects_oversized_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(check_news_route.config, "CHECK_NEWS_BATCH_MAX_ITEMS", 2)
+    client = TestClient(app)
+
+    response = client.post("/check-news/batch", json={"texts": ["a", "b", "c"]})
+
+    assert response.status_code == 413
+
+
+def test_check_news_stream_emits_stages_then_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _async_return([]))
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _async_return([]))
+    monkeypatch.setattr(
+        check_news_route.classifier_service,
+        "classify_text",
+        _async_return({"provider": "rapidapi", "score": 0.9, "explanation": "remote"}),
+    )
+
+    with client.stream("POST", "/check-news/stream", json=MOCK_REQUEST) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.iter_lines() if line]
+
+    stages = [event["stage"] for event in events]
+    assert stages[0] == "estimate"
+    assert sorted(stages[1:-1]) == ["claim_reviews", "classifier", "sources"]
+    assert stages[-1] == "result"
+    assert events[-1]["result"] == client.post("/check-news", json=MOCK_REQUEST).json()
+
+
+def test_check_news_job_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _async_return([]))
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _async_return([]))
+
+    with TestClient(app) as client:
+        submitted = client.post("/check-news/jobs", json=MOCK_REQUEST)
+        assert submitted.status_code == 202
+        job_id = submitted.json()["id"]
+        assert submitted.headers["location"] == f"/check-news/jobs/{job_id}"
+
+        for _ in range(200):
+            job = client.get(f"/check-news/jobs/{job_id}").json()
+            if job["status"] == "done":
+                break
+            time.sleep(0.01)
+
+        assert job["status"] == "done"
+        assert EXPECTED_KEYS.issubset(job["result"].keys())
+        assert client.get("/check-news/jobs/unknown").status_code == 404
+
+
+def test_check_news_serves_cached_response_with_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    calls: list[str] = []
+
+    async def _classify(text: str, **_kwargs):
+        calls.append(text)
+        return {"provider": "local", "score": 0.2}
+
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _async_return([]))
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _async_return([]))
+    monkeypatch.setattr(check_news_route.classifier_service, "classify_text", _classify)
+
+    first = client.post("/check-news", json=MOCK_REQUEST)
+    etag = first.headers["etag"]
+    second = client.post("/check-news", json={"text": "  " + MOCK_REQUEST["text"] + " "})
+    not_modified = client.post("/check-news", json=MOCK_REQUEST, headers={"If-None-Match": etag})
+    refreshed = client.post("/check-news?refresh=true", json=MOCK_REQUEST)
+
+    assert first.status_code == 200 and etag.startswith('"')
+    assert second.content == first.content and second.headers["etag"] == etag
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert refreshed.status_code == 200
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("failed_stage", ["factcheck", "news"])
+def test_check_news_does_not_cache_responses_built_during_an_outage(
+    monkeypatch: pytest.MonkeyPatch, failed_stage: str
+) -> None:
+    client = TestClient(app)
+    calls: list[str] = []
+
+    async def _classify(text: str, **_kwargs):
+        calls.append(text)
+        return {"provider": "local", "score": 0.2}
+
+    outage = _async_return(None)
+    monkeypatch.setattr(
+        check_news_route.factcheck_service, "query_claimreview", outage if failed_stage == "factcheck" else _async_return([])
+    )
+    monkeypatch.setattr(check_news_route.news_service, "search_news", outage if failed_stage == "news" else _async_return([]))
+    monkeypatch.setattr(check_news_route.classifier_service, "classify_text", _classify)
+
+    first = client.post("/check-news", json=MOCK_REQUEST)
+    second = client.post("/check-news", json=MOCK_REQUEST, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    # Recomputed rather than revalidated against a cached outage response.
+    assert len(calls) == 2
+    assert second.status_code == 304
+
+
+def test_long_articles_search_with_extracted_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    fact_queries: list[str] = []
+    news_queries: list[str] = []
+
+    async def _factcheck(query: str, **_kwargs):
+        fact_queries.append(query)
+        return [{"url": "https://fact.example/shared", "truth_rating": "False"}]
+
+    async def _news(query: str, **_kwargs):
+        news_queries.append(query)
+        return []
+
+    monkeypatch.setattr(check_news_route.config, "QUERY_EXTRACTION_MIN_CHARS", 100)
+    monkeypatch.setattr(check_news_route.config, "FACTCHECK_MAX_CLAIM_QUERIES", 2)
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _factcheck)
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _news)
+
+    article = " ".join(
+        [
+            "The council met on Tuesday to discuss the annual budget.",
+            "According to a report by the Health Department, 42% of residents lack clinics.",
+            "Mayor Jane Smith said the plan would cost 3.5 million dollars.",
+        ]
+        * 5
+    )
+    response = client.post("/check-news", json={"text": article})
+
+    assert response.status_code == 200
+    assert len(fact_queries) == 2 and len(set(fact_queries)) == 2
+    assert all(len(query) < 200 for query in fact_queries)
+    assert len(news_queries) == 1 and len(news_queries[0].split()) <= 4
+    assert len(response.json()["claim_reviews"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_news_cancels_lookups_when_client_disconnects(monkeypatch: pytest.MonkeyPatch) -> None:
+    cancelled: list[str] = []
+    started = asyncio.Event()
+
+    async def _hang(*_args, **_kwargs):
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.append("news")
+            raise
+
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _async_return([]))
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _hang)
+    metrics.reset()
+
+    text = "Disconnecting readers should not spend provider quota."
+    body = json.dumps({"text": text}).encode("utf-8")
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await started.wait()
+        return {"type": "http.disconnect"}
+
+    sent: list[dict] = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/check-news",
+        "raw_path": b"/check-news",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+    assert sent[0]["status"] == 499
+    assert cancelled == ["news"]
+    counters = metrics.snapshot()["counters"]
+    assert counters["check_news.client_disconnected"] == 1
+    assert counters["check_news.stage_lookups_cancelled"] == 1
+    # The classifier finished before the disconnect, so its result stays cached.
+    context = text_context.TextContext.from_text(text)
+    assert await classifier_service._CLASSIFIER_CACHE.get(classifier_service._make_cache_key(context)) is not None
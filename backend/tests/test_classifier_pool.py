@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from app import config
+from app.services import classifier_service
+from app.utils import metrics
+
+LONG_ARTICLE = " ".join(
+    ["Shocking secret exposed by insiders."] * 40
+    + ["According to research the official analysis was verified."] * 25
+)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_pool() -> AsyncIterator[None]:
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    metrics.reset()
+    yield
+    classifier_service._shutdown_process_pool()  # noqa: SLF001
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+
+
+def _use_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "local")
+    monkeypatch.setattr(config, "CLASSIFIER_EXECUTION", "process")
+    monkeypatch.setattr(config, "CLASSIFIER_POOL_WORKERS", 2)
+    monkeypatch.setattr(config, "CLASSIFIER_INLINE_MAX_CHARS", 200)
+    monkeypatch.setattr(config, "CLASSIFIER_CHUNK_CHARS", 300)
+
+
+@pytest.mark.asyncio
+async def test_long_text_is_chunked_on_pool_and_matches_inline(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_process_pool(monkeypatch)
+
+    pooled = await classifier_service.classify_text(LONG_ARTICLE)
+    inline = classifier_service._classify_locally(LONG_ARTICLE, reason="Configured to use local classifier")  # noqa: SLF001
+
+    assert pooled == inline
+    chunks = metrics.snapshot()["summaries"]["classifier.pool.chunks"]
+    assert chunks["max"] > 1
+
+
+@pytest.mark.asyncio
+async def test_reload_lets_queued_pool_work_finish(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_process_pool(monkeypatch)
+    inline = classifier_service._classify_locally(LONG_ARTICLE, reason="Configured to use local classifier")  # noqa: SLF001
+
+    pending = asyncio.ensure_future(classifier_service.classify_text(LONG_ARTICLE))
+    await asyncio.sleep(0)
+    retired = classifier_service._PROCESS_POOL  # noqa: SLF001
+    classifier_service.reload_models()
+
+    assert await pending == inline
+    assert retired is not None and classifier_service._PROCESS_POOL is not retired  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_short_text_stays_inline(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_process_pool(monkeypatch)
+
+    result = await classifier_service.classify_text("Shocking secret exposed")
+
+    assert result["provider"] == "local"
+    assert "classifier.pool.chunks" not in metrics.snapshot()["summaries"]
+    assert classifier_service._PROCESS_POOL is None  # noqa: SLF001
+
+
+def test_chunks_split_on_whitespace() -> None:
+    chunks = classifier_service._split_into_chunks(LONG_ARTICLE, 300)  # noqa: SLF001
+
+    assert "".join(chunks) == LONG_ARTICLE
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert sum(len(chunk.split()) for chunk in chunks) == len(LONG_ARTICLE.split())
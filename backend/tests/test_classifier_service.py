@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import AsyncIterator
 
 import pytest
@@ -84,4 +85,98 @@ async def test_local_classifier_explanation_contains_counts(monkeypatch: pytest.
 
     assert result["provider"] == "local"
     assert "sensational" in (result.get("explanation") or "").lower()
-    assert "reputable" in (result.get("explanation") or "").lower()
\ No newline at end of file
+    assert "reputable" in (result.get("explanation") or "").lower()
+
+
+@pytest.mark.asyncio
+async def test_classify_many_matches_single_text_scores(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "local")
+    texts = [
+        "Shocking secret exposed!",
+        "According to research, the study was verified.",
+        "   ",
+        "Breaking: official investigation into the hoax (secret)",
+        "Plain headline",
+    ]
+
+    batch = classifier_service.classify_many(texts)
+    single = [await classifier_service.classify_text(text) for text in texts]
+
+    assert [result["score"] for result in batch] == pytest.approx([result["score"] for result in single])
+    assert [result["explanation"] for result in batch] == [result["explanation"] for result in single]
+
+
+@pytest.mark.asyncio
+async def test_ensemble_blends_remote_score_within_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "rapidapi")
+    monkeypatch.setattr(config, "CLASSIFIER_ENSEMBLE_DEADLINE_MS", 200.0)
+    monkeypatch.setattr(config, "CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT", 0.5)
+
+    async def fast_remote(text: str) -> dict:
+        return {"provider": "rapidapi", "score": 0.9, "explanation": "remote"}
+
+    monkeypatch.setattr(classifier_service, "_classify_via_rapidapi_batched", fast_remote)
+    local = classifier_service._classify_locally("Council approves budget")  # noqa: SLF001
+
+    result = await classifier_service.classify_text("Council approves budget")
+
+    assert result["provider"] == "ensemble"
+    assert result["score"] == pytest.approx(0.5 * 0.9 + 0.5 * local["score"])
+
+
+@pytest.mark.asyncio
+async def test_ensemble_returns_local_and_caches_late_remote(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "rapidapi")
+    monkeypatch.setattr(config, "CLASSIFIER_ENSEMBLE_DEADLINE_MS", 10.0)
+    monkeypatch.setattr(config, "CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT", 1.0)
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_remote(text: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"provider": "rapidapi", "score": 0.95, "explanation": "remote"}
+
+    monkeypatch.setattr(classifier_service, "_classify_via_rapidapi_batched", slow_remote)
+
+    first = await classifier_service.classify_text("Council approves budget")
+    release.set()
+    await asyncio.gather(*classifier_service._LATE_REMOTE_WRITES)  # noqa: SLF001
+    second = await classifier_service.classify_text("Council approves budget")
+
+    assert first["provider"] == "local"
+    assert "pending" in first["explanation"]
+    assert second["provider"] == "ensemble"
+    assert second["score"] == pytest.approx(0.95)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_ensemble_retries_remote_after_late_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "rapidapi")
+    monkeypatch.setattr(config, "CLASSIFIER_ENSEMBLE_DEADLINE_MS", 10.0)
+    monkeypatch.setattr(config, "CLASSIFIER_ENSEMBLE_REMOTE_WEIGHT", 1.0)
+    monkeypatch.setattr(config, "CLASSIFIER_FALLBACK_CACHE_TTL_SECONDS", 0)
+    release = asyncio.Event()
+    calls = 0
+
+    async def flaky_remote(text: str) -> dict:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+            raise classifier_service.ClassifierServiceError("RapidAPI rate limit reached")
+        return {"provider": "rapidapi", "score": 0.95, "explanation": "remote"}
+
+    monkeypatch.setattr(classifier_service, "_classify_via_rapidapi_batched", flaky_remote)
+
+    first = await classifier_service.classify_text("Council approves budget")
+    release.set()
+    await asyncio.gather(*classifier_service._LATE_REMOTE_WRITES)  # noqa: SLF001
+    second = await classifier_service.classify_text("Council approves budget")
+
+    assert "pending" in first["explanation"]
+    assert second["provider"] == "ensemble"
+    assert second["score"] == pytest.approx(0.95)
+    assert calls == 2
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+from app import config
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+# Generous enough for a cold CI filesystem; ~0.45s warm at the time of writing,
+# most of it FastAPI and pydantic. Override with IMPORT_TIME_BUDGET_MS.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+LAZY_MODULES = ("redis", "aioredis", "onnxruntime")
+
+
+def _import_app_main() -> Dict[str, int]:
+    """Import ``app.main`` in a fresh interpreter and return cumulative µs per module."""
+
+    env = dict(os.environ, USE_REDIS="true", REDIS_URL="redis://127.0.0.1:1/0", PYTHONDONTWRITEBYTECODE="1")
+    probe = "import app.main; from app.utils import cache; assert cache._REDIS_CLIENT is None, 'redis client built at import'"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def test_app_import_stays_within_budget_and_defers_optional_dependencies() -> None:
+    modules = _import_app_main()
+
+    assert "app.main" in modules
+    eager = sorted(name for name in modules if name.split(".")[0] in LAZY_MODULES)
+    assert not eager, f"optional dependencies imported at start-up: {eager}"
+    if config._find_dotenv() is None:  # noqa: SLF001
+        assert "dotenv" not in modules
+
+    elapsed_ms = modules["app.main"] / 1000
+    assert elapsed_ms <= IMPORT_TIME_BUDGET_MS, f"import app.main took {elapsed_ms:.0f} ms"
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from app import config
+from app.services import classifier_service, lexicon
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_cache() -> AsyncIterator[None]:
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    yield
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+
+
+def test_phrases_match_with_spaces_hyphens_and_punctuation() -> None:
+    compiled = lexicon.Lexicon({"cover up": 1.0}, {"according to": 0.5}, version="test")
+
+    assert compiled.scan("A cover up, according to insiders").sensational_hits == 1
+    assert compiled.scan("The cover-up was denied.").sensational_hits == 1
+    assert compiled.scan("According to: the report").reputable_hits == 1
+    assert compiled.scan("cover the story; up next").sensational_hits == 0
+
+
+def test_longest_phrase_wins_without_double_counting() -> None:
+    compiled = lexicon.Lexicon({"secret": 0.5, "secret plan": 2.0}, {"plan": 1.0}, version="test")
+
+    match = compiled.scan("The secret plan and another secret")
+
+    assert match.sensational_hits == 2
+    assert match.reputable_hits == 0
+    assert match.weight == pytest.approx(2.5)
+
+
+def test_scan_many_matches_scan() -> None:
+    compiled = lexicon.Lexicon(
+        {"secret": 0.5, "secret plan": 2.0, "cover up": 1.0, "cover up story": 1.5},
+        {"plan": 1.0, "according to": 0.5, "up": 0.25},
+        version="test",
+    )
+    texts = [
+        "The secret plan and another secret",
+        "secret",
+        "",
+        "A cover-up story, according to insiders; cover up",
+        "cover the story; up next according",
+        "plan secret plan secret plan up",
+    ]
+
+    sensational, reputable, weights = compiled.scan_many(texts)
+
+    for index, text in enumerate(texts):
+        expected = compiled.scan(text)
+        assert (sensational[index], reputable[index]) == (expected.sensational_hits, expected.reputable_hits)
+        assert weights[index] == pytest.approx(expected.weight)
+
+
+def test_bundled_lexicon_is_versioned() -> None:
+    bundled = lexicon.Lexicon.load()
+
+    assert bundled.version.startswith("2026.")
+    assert bundled.size > 20
+    assert bundled.max_phrase_words >= 3
+
+
+def test_invalid_lexicon_file_raises(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.json"
+    broken.write_text("[not json", encoding="utf-8")
+
+    with pytest.raises(lexicon.LexiconError):
+        lexicon.Lexicon.load(broken)
+
+
+@pytest.mark.asyncio
+async def test_classifier_uses_configured_lexicon(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    custom = tmp_path / "lexicon.json"
+    custom.write_text(
+        json.dumps({"version": "custom", "sensational": {"moon landing faked": 3.0}, "reputable": {}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "local")
+    monkeypatch.setattr(config, "LEXICON_PATH", str(custom))
+
+    result = await classifier_service.classify_text("They say the Moon-landing faked footage leaked")
+
+    assert result["score"] > 0.9
+    assert "Detected 1 sensational terms" in result["explanation"]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import AsyncIterator
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from app import config
+from app.services import classifier_service, linear_model
+
+FAKE_HEADLINES = [
+    "Shocking secret cure exposed, doctors hate it",
+    "You won't believe this hoax they are hiding",
+    "Miracle pill melts fat overnight, shocking truth exposed",
+    "Secret cover up exposed by anonymous insider",
+]
+REAL_HEADLINES = [
+    "Central bank holds interest rates steady, officials said",
+    "Study published in medical journal reviews vaccine data",
+    "City council approves budget after public hearing",
+    "Researchers report findings according to peer reviewed analysis",
+]
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_cache() -> AsyncIterator[None]:
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    yield
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+
+
+@pytest.fixture()
+def model_path(tmp_path: Path) -> Path:
+    dataset = tmp_path / "labelled.jsonl"
+    with dataset.open("w", encoding="utf-8") as handle:
+        for text in FAKE_HEADLINES:
+            handle.write(json.dumps({"text": text, "label": "fake"}) + "\n")
+        for text in REAL_HEADLINES:
+            handle.write(json.dumps({"text": text, "label": "real"}) + "\n")
+
+    output = tmp_path / "model.bin"
+    exit_code = linear_model.main(
+        ["train", str(dataset), str(output), "--version", "test-1", "--feature-bits", "14", "--epochs", "300"]
+    )
+    assert exit_code == 0
+    return output
+
+
+def test_trained_model_separates_labels(model_path: Path) -> None:
+    model = linear_model.LinearModel.load(model_path)
+
+    assert model.version == "test-1"
+    assert model.n_features == 1 << 14
+    assert model.score("Shocking secret exposed") > 0.5
+    assert model.score("Officials said the study was published in a journal") < 0.5
+
+
+def test_csv_training_input(tmp_path: Path) -> None:
+    dataset = tmp_path / "labelled.csv"
+    dataset.write_text("text,label\nShocking hoax exposed,1\nCouncil approves budget,0\nbad row,maybe\n", encoding="utf-8")
+
+    rows = list(linear_model.read_labelled(dataset))
+
+    assert rows == [("Shocking hoax exposed", 1), ("Council approves budget", 0)]
+
+
+def test_jsonl_reader_skips_malformed_rows_and_ambiguous_labels(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    dataset = tmp_path / "labelled.jsonl"
+    dataset.write_text(
+        '{"text": "Shocking hoax exposed", "label": "fake"}\n'
+        '{"text": "truncated", "lab\n'
+        '["not", "an", "object"]\n'
+        '{"text": "Boolean label", "label": true}\n'
+        '{"text": "String boolean", "label": "false"}\n'
+        '{"text": "Council approves budget", "label": 0}\n',
+        encoding="utf-8",
+    )
+
+    rows = list(linear_model.read_labelled(dataset))
+
+    assert rows == [("Shocking hoax exposed", 1), ("Council approves budget", 0)]
+    assert "Skipped 4 unusable rows" in capsys.readouterr().err
+
+
+def test_load_rejects_foreign_files(tmp_path: Path) -> None:
+    bogus = tmp_path / "bogus.bin"
+    bogus.write_bytes(b"not a model file at all")
+
+    with pytest.raises(linear_model.LinearModelError):
+        linear_model.LinearModel.load(bogus)
+
+
+def test_load_rejects_truncated_and_malformed_files(model_path: Path, tmp_path: Path) -> None:
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(model_path.read_bytes()[:-16])
+    headerless = tmp_path / "headerless.bin"
+    linear_model.save(headerless, version="v", idf=np.ones(8, dtype=np.float32), coef=np.ones(8, dtype=np.float32), bias=0.0)
+    raw = headerless.read_bytes()
+    # Same length, so the weights still line up; only the bias key is renamed.
+    headerless.write_bytes(raw.replace(b'"bias"', b'"bIas"'))
+
+    for broken in (truncated, headerless):
+        with pytest.raises(linear_model.LinearModelError):
+            linear_model.LinearModel.load(broken)
+
+
+@pytest.mark.asyncio
+async def test_linear_provider_reports_model_version(monkeypatch: pytest.MonkeyPatch, model_path: Path) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "linear")
+    monkeypatch.setattr(config, "LINEAR_MODEL_PATH", str(model_path))
+
+    result = await classifier_service.classify_text("Shocking secret cure exposed")
+
+    assert result["provider"] == "linear"
+    assert result["model_version"] == "test-1"
+    assert result["score"] > 0.5
+
+
+@pytest.mark.asyncio
+async def test_linear_provider_falls_back_without_model(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "linear")
+    monkeypatch.setattr(config, "LINEAR_MODEL_PATH", str(tmp_path / "missing.bin"))
+
+    result = await classifier_service.classify_text("Shocking secret cure exposed")
+
+    assert result["provider"] == "local"
+    assert "Unable to read model" in (result.get("explanation") or "")
+
+
+def test_score_many_matches_single_text_path(model_path: Path) -> None:
+    model = linear_model.LinearModel.load(model_path)
+    texts = FAKE_HEADLINES + REAL_HEADLINES + ["", "!!!", "Unseen words entirely"]
+
+    batch = model.score_many(texts)
+
+    assert batch.tolist() == pytest.approx([model.score(text) for text in texts])
+
+
+@pytest.mark.asyncio
+async def test_classify_many_uses_linear_provider(monkeypatch: pytest.MonkeyPatch, model_path: Path) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "linear")
+    monkeypatch.setattr(config, "LINEAR_MODEL_PATH", str(model_path))
+
+    batch = classifier_service.classify_many(FAKE_HEADLINES[:2])
+    single = [await classifier_service.classify_text(text) for text in FAKE_HEADLINES[:2]]
+
+    assert batch == [{**result, "score": pytest.approx(result["score"])} for result in single]
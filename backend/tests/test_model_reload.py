@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app import config
+from app.main import app
+from app.services import classifier_service, linear_model
+
+FEATURES = 1 << 10
+
+
+def _write_model(path: Path, version: str, bias: float) -> None:
+    linear_model.save(
+        path,
+        version=version,
+        idf=np.ones(FEATURES, dtype=np.float32),
+        coef=np.zeros(FEATURES, dtype=np.float32),
+        bias=bias,
+        ngram_max=1,
+    )
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_state(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    monkeypatch.setattr(classifier_service, "_WATCHED_MTIMES", {})
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    yield
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+
+
+@pytest.fixture()
+def model_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "model.bin"
+    _write_model(path, "v1", bias=2.0)
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "linear")
+    monkeypatch.setattr(config, "LINEAR_MODEL_PATH", str(path))
+    return path
+
+
+@pytest.mark.asyncio
+async def test_reload_switches_cache_key_and_result(model_path: Path) -> None:
+    first = await classifier_service.classify_text("Budget approved")
+    key_v1 = classifier_service._make_cache_key("Budget approved")  # noqa: SLF001
+
+    _write_model(model_path, "v2", bias=-2.0)
+    versions = classifier_service.reload_models()
+    second = await classifier_service.classify_text("Budget approved")
+
+    assert versions["active"] == "v2"
+    assert classifier_service._make_cache_key("Budget approved") != key_v1  # noqa: SLF001
+    assert first["model_version"] == "v1" and first["score"] > 0.5
+    assert second["model_version"] == "v2" and second["score"] < 0.5
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_keeps_current_model(model_path: Path) -> None:
+    await classifier_service.classify_text("Budget approved")
+    model_path.write_bytes(b"corrupt")
+
+    with pytest.raises(classifier_service.ClassifierServiceError):
+        classifier_service.reload_models()
+
+    assert classifier_service.active_model_version() == "v1"
+
+
+@pytest.mark.asyncio
+async def test_file_watch_reloads_changed_model(model_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_MODEL_WATCH_SECONDS", 0.01)
+    assert classifier_service.active_model_version() == "v1"
+    watcher = asyncio.create_task(classifier_service.watch_model_files())
+    try:
+        while not classifier_service._WATCHED_MTIMES:  # noqa: SLF001 - baseline recorded
+            await asyncio.sleep(0.01)
+        _write_model(model_path, "v2", bias=-2.0)
+        os.utime(model_path, ns=(0, os.stat(model_path).st_mtime_ns + 1_000_000_000))
+        # Cache keys never stat the file; the watcher swaps the model in the background.
+        assert classifier_service.active_model_version() == "v1"
+        for _ in range(200):
+            if classifier_service.active_model_version() == "v2":
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        watcher.cancel()
+
+    result = await classifier_service.classify_text("Budget approved")
+
+    assert result["model_version"] == "v2"
+
+
+def test_admin_reload_requires_token(model_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    monkeypatch.setattr(config, "ADMIN_TOKEN", None)
+    assert client.post("/admin/reload-model").status_code == 404
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "s3cret")
+    assert client.post("/admin/reload-model", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    response = client.post("/admin/reload-model", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()["linear"] == "v1"
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from app import config
+from app.services import classifier_service, onnx_classifier
+from app.utils import metrics
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "hoax", "shocking", "official", "report", "##s"]
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_state(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    monkeypatch.setattr(classifier_service, "_ONNX_MODEL", None)
+    monkeypatch.setattr(classifier_service, "_ONNX_BATCHER", None)
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+    metrics.reset()
+    yield
+    await classifier_service._clear_cache_for_tests()  # noqa: SLF001
+
+
+def _write_tiny_model(directory: Path) -> tuple[Path, Path]:
+    """Bag-of-embeddings classifier: fake-leaning tokens push logit 1 up."""
+
+    from onnx import TensorProto, helper
+
+    embedding = np.zeros((len(VOCAB), 2), dtype=np.float32)
+    embedding[VOCAB.index("hoax")] = [0.0, 3.0]
+    embedding[VOCAB.index("shocking")] = [0.0, 2.0]
+    embedding[VOCAB.index("official")] = [3.0, 0.0]
+    embedding[VOCAB.index("report")] = [2.0, 0.0]
+
+    graph = helper.make_graph(
+        [
+            helper.make_node("Gather", ["embedding", "input_ids"], ["embedded"]),
+            helper.make_node("Cast", ["attention_mask"], ["mask_float"], to=TensorProto.FLOAT),
+            helper.make_node("Unsqueeze", ["mask_float", "axis_two"], ["mask_3d"]),
+            helper.make_node("Mul", ["embedded", "mask_3d"], ["masked"]),
+            helper.make_node("ReduceSum", ["masked", "axis_one"], ["logits"], keepdims=0),
+        ],
+        "tiny_classifier",
+        [
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, ["batch", "sequence"]),
+            helper.make_tensor_value_info("attention_mask", TensorProto.INT64, ["batch", "sequence"]),
+        ],
+        [helper.make_tensor_value_info("logits", TensorProto.FLOAT, ["batch", 2])],
+        initializer=[
+            helper.make_tensor("embedding", TensorProto.FLOAT, embedding.shape, embedding.flatten().tolist()),
+            helper.make_tensor("axis_one", TensorProto.INT64, [1], [1]),
+            helper.make_tensor("axis_two", TensorProto.INT64, [1], [2]),
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    model_path = directory / "tiny.onnx"
+    onnx.save(model, model_path)
+
+    vocab_path = directory / "vocab.txt"
+    vocab_path.write_text("\n".join(VOCAB) + "\n", encoding="utf-8")
+    return model_path, vocab_path
+
+
+def test_tokenizer_uses_wordpieces_and_special_tokens(tmp_path: Path) -> None:
+    _, vocab_path = _write_tiny_model(tmp_path)
+    tokenizer = onnx_classifier.WordPieceTokenizer.from_file(vocab_path)
+
+    assert tokenizer.encode("Official reports unknown", max_length=16) == [2, 6, 7, 8, 1, 3]
+    assert len(tokenizer.encode("hoax " * 100, max_length=16)) == 16
+
+
+def test_predict_pads_to_length_buckets(tmp_path: Path) -> None:
+    model_path, vocab_path = _write_tiny_model(tmp_path)
+    model = onnx_classifier.OnnxClassifier.load(model_path, vocab_path, max_length=64)
+
+    scores = model.predict(["shocking hoax", "official report", "official " * 40])
+
+    assert scores[0] > 0.9
+    assert scores[1] < 0.1
+    assert scores[2] < 0.1
+    assert model.version.startswith("onnx-")
+
+
+@pytest.mark.asyncio
+async def test_onnx_provider_batches_concurrent_requests(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    model_path, vocab_path = _write_tiny_model(tmp_path)
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "onnx")
+    monkeypatch.setattr(config, "ONNX_MODEL_PATH", str(model_path))
+    monkeypatch.setattr(config, "ONNX_VOCAB_PATH", str(vocab_path))
+    monkeypatch.setattr(config, "ONNX_BATCH_MAX_SIZE", 8)
+    monkeypatch.setattr(config, "ONNX_BATCH_WINDOW_MS", 20.0)
+
+    results = await asyncio.gather(
+        classifier_service.classify_text("shocking hoax"),
+        classifier_service.classify_text("official report"),
+        classifier_service.classify_text("hoax"),
+    )
+
+    assert [result["provider"] for result in results] == ["onnx"] * 3
+    assert results[0]["score"] > 0.9 and results[1]["score"] < 0.1
+    assert results[0]["model_version"].startswith("onnx-")
+    assert metrics.snapshot()["summaries"]["classifier.onnx.batch_size"]["max"] == 3
+
+
+def test_quantize_cli_writes_loadable_model(tmp_path: Path) -> None:
+    model_path, vocab_path = _write_tiny_model(tmp_path)
+    quantized = tmp_path / "tiny.int8.onnx"
+
+    assert onnx_classifier.main(["quantize", str(model_path), str(quantized)]) == 0
+
+    model = onnx_classifier.OnnxClassifier.load(quantized, vocab_path)
+    assert model.predict(["shocking hoax"])[0] > 0.5
+
+
+@pytest.mark.asyncio
+async def test_onnx_provider_falls_back_without_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "CLASSIFIER_PROVIDER", "onnx")
+    monkeypatch.setattr(config, "ONNX_MODEL_PATH", None)
+
+    result = await classifier_service.classify_text("shocking hoax")
+
+    assert result["provider"] == "local"
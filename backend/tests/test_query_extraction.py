@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from app.services import query_extraction
+from app.utils import text_context
+
+ARTICLE = (
+    "The city council met on Tuesday to discuss the annual budget. "
+    "According to a report released by the Health Department, 42% of residents lack access to clinics. "
+    "Mayor Jane Smith said the new plan would cost 3.5 million dollars. "
+    "Residents gathered outside the hall. "
+    "Critics claimed the Health Department data was outdated and the council ignored the report. "
+    "The meeting ended late in the evening."
+)
+
+
+def test_short_text_is_used_verbatim() -> None:
+    extraction = query_extraction.extract("  Moon   landing faked  ", min_chars=280)
+
+    assert extraction.claims == ("Moon landing faked",)
+    assert extraction.news_query == "Moon landing faked"
+
+
+def test_long_text_yields_check_worthy_claims_and_keywords() -> None:
+    extraction = query_extraction.extract(ARTICLE, max_claims=2, max_keywords=3, min_chars=100)
+
+    assert len(extraction.claims) == 2
+    assert any("42%" in claim for claim in extraction.claims)
+    assert all("Residents gathered" not in claim for claim in extraction.claims)
+    assert len(extraction.keywords) == 3
+    assert "report" in extraction.keywords
+    assert extraction.news_query == " ".join(extraction.keywords)
+
+
+def test_claims_are_capped_in_length() -> None:
+    long_sentence = "Officials said " + " ".join(f"word{index}" for index in range(100)) + "."
+
+    extraction = query_extraction.extract(long_sentence * 3, min_chars=10)
+
+    assert all(len(claim.split()) <= 24 for claim in extraction.claims)
+
+
+def test_memo_is_keyed_by_digest_not_text() -> None:
+    context = text_context.TextContext.from_text(ARTICLE * 50)
+
+    first = query_extraction.extract(context, min_chars=100)
+
+    assert query_extraction.extract(ARTICLE * 50, min_chars=100) is first
+    assert all(len(key[0]) == 64 for key in query_extraction._memo)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app import config, lifecycle
+from app.main import app
+from app.routes import check_news as check_news_route
+from app.utils import cache, text_context
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _isolated(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    async def _empty(*_args: object, **_kwargs: object) -> list[object]:
+        return []
+
+    # Restored on teardown, so later tests see a ready app again.
+    monkeypatch.setattr(lifecycle, "_STATE", lifecycle.READY)
+    monkeypatch.setattr(check_news_route.factcheck_service, "query_claimreview", _empty)
+    monkeypatch.setattr(check_news_route.news_service, "search_news", _empty)
+    await cache.clear_registered_caches()
+    yield
+    await cache.clear_registered_caches()
+
+
+def test_ready_reports_warming_until_warm_up_finishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    models_loaded = threading.Event()
+    real_preload = lifecycle.classifier_service.preload
+
+    def _slow_preload() -> str:
+        models_loaded.wait(timeout=5)
+        return real_preload()
+
+    monkeypatch.setattr(lifecycle.classifier_service, "preload", _slow_preload)
+
+    with TestClient(app) as client:
+        warming = client.get("/ready")
+        assert warming.status_code == 503
+        assert warming.json()["status"] == "warming"
+        assert client.get("/health").status_code == 200
+
+        models_loaded.set()
+        for _ in range(200):
+            ready = client.get("/ready")
+            if ready.status_code == 200:
+                break
+            time.sleep(0.01)
+
+        assert ready.status_code == 200
+        assert ready.json()["checks"]["warmup"] == {
+            "upstreams": "0 connected",
+            "caches": "in-process",
+            "models": lifecycle.classifier_service.active_model_version(),
+            "hot_texts": "skipped",
+        }
+
+    assert lifecycle.state() == lifecycle.DRAINING
+
+
+@pytest.mark.asyncio
+async def test_warm_up_replays_hot_texts_into_response_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    hot_texts = tmp_path / "hot.txt"
+    hot_texts.write_text(
+        "# most requested this week\nMoon landing was staged\n\nMoon  landing was  staged\n"
+        "Vaccines cause magnetism\nNot replayed\n"
+    )
+    monkeypatch.setattr(config, "USE_REDIS", False)
+    monkeypatch.setattr(config, "WARMUP_HOT_TEXTS_PATH", str(hot_texts))
+    monkeypatch.setattr(config, "WARMUP_HOT_TEXTS_MAX", 3)
+
+    first = await lifecycle.warm_up()
+    second = await lifecycle.warm_up()
+
+    assert first["hot_texts"] == "2 primed"
+    assert second["hot_texts"] == "0 primed"
+    assert lifecycle.state() == lifecycle.READY
+    for text in ("Moon landing was staged", "Vaccines cause magnetism"):
+        key = check_news_route._response_cache_key(text_context.TextContext.from_text(text))  # noqa: SLF001
+        assert await check_news_route._RESPONSE_CACHE.get(key) is not None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_late_writes_while_jobs_use_the_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _stuck_jobs(timeout: float) -> int:
+        await asyncio.sleep(timeout)
+        return 1
+
+    async def _late_write() -> None:
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(config, "DRAIN_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(check_news_route, "drain_jobs", _stuck_jobs)
+    late_write = asyncio.create_task(_late_write())
+    lifecycle.classifier_service._LATE_REMOTE_WRITES.add(late_write)  # noqa: SLF001
+    late_write.add_done_callback(lifecycle.classifier_service._LATE_REMOTE_WRITES.discard)  # noqa: SLF001
+
+    await lifecycle.drain()
+
+    assert late_write.done() and not late_write.cancelled()
+    assert lifecycle.state() == lifecycle.DRAINING
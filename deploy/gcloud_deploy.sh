@@ -117,12 +117,15 @@ declare -a FRONTEND_DEPLOY_FLAGS=(
   "--timeout" "30"
 )
 
-if [[ -n "${BACKEND_ENV_VARS}" ]]; then
-  BACKEND_DEPLOY_FLAGS+=("--set-env-vars" "${BACKEND_ENV_VARS}")
-else
+if [[ ! -f "${BACKEND_ENV_FILE}" ]]; then
   echo "[WARN] No backend environment file found at ${BACKEND_ENV_FILE}; deploying with defaults."
 fi
 
+# Cloud Run's front end appends the caller's address to X-Forwarded-For; without this every
+# client is rate limited as the proxy address. A value in the env file takes precedence.
+BACKEND_ENV_VARS="RATE_LIMIT_TRUST_FORWARDED=true${BACKEND_ENV_VARS:+,${BACKEND_ENV_VARS}}"
+BACKEND_DEPLOY_FLAGS+=("--set-env-vars" "${BACKEND_ENV_VARS}")
+
 if [[ -n "${FRONTEND_ENV_VARS}" ]]; then
   FRONTEND_DEPLOY_FLAGS+=("--set-env-vars" "${FRONTEND_ENV_VARS}")
 fi
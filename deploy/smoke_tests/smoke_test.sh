@@ -63,7 +63,8 @@ echo "[INFO] Exercising backend /health endpoint..."
 curl -fsSL --max-time "${TIMEOUT}" "${BACKEND_URL}/health" >/dev/null
 
 echo "[INFO] Exercising backend /ready endpoint..."
-curl -fsSL --max-time "${TIMEOUT}" "${BACKEND_URL}/ready" >/dev/null
+# A fresh instance answers 503 while it warms up; curl retries 503 responses.
+curl -fsSL --max-time "${TIMEOUT}" --retry 6 --retry-delay 5 "${BACKEND_URL}/ready" >/dev/null
 
 echo "[INFO] Posting payload to backend /check-news..."
 BACKEND_RESPONSE="$(curl -fsSL --max-time "${TIMEOUT}" -X POST "${BACKEND_URL}/check-news" -H 'Content-Type: application/json' -d "${PAYLOAD}")"
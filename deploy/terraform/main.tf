@@ -50,6 +50,11 @@ resource "google_cloud_run_service" "backend" {
         ports {
           container_port = 8000
         }
+        # Rate limit on the caller address Cloud Run appends, not the proxy's.
+        env {
+          name  = "RATE_LIMIT_TRUST_FORWARDED"
+          value = "true"
+        }
         resources {
           limits = {
             cpu    = "1"